@@ -0,0 +1,36 @@
+"""Process-unique identifiers without uuid4.
+
+Each ID is a random per-process prefix followed by a counter. Both are
+redrawn in forked children (multiprocessing workers, spaCy nlp.pipe with
+n_process > 1), so a worker never repeats IDs its parent already issued.
+"""
+import itertools
+import os
+import secrets
+
+_prefix = ""
+_counter = itertools.count()
+
+
+def _reseed() -> None:
+    """Draw a fresh prefix and restart the counter."""
+    global _prefix, _counter
+    _prefix = secrets.token_hex(4)
+    _counter = itertools.count()
+
+
+_reseed()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def next_id(kind: str = "") -> str:
+    """Generate a unique identifier.
+
+    Args:
+        kind: Label prepended to the ID, e.g. "edge_"
+
+    Returns:
+        The label, an 8-hex-digit process prefix and an 8-hex-digit counter
+    """
+    return f"{kind}{_prefix}{next(_counter):08x}"
@@ -8,7 +8,9 @@ Maps linguistic elements to categorical morphisms:
 from semantic_zoom.phase3.preposition_symbols import (
     CategoricalSymbol,
     PrepositionMapping,
+    PrepositionMatch,
     SymbolState,
+    find_prepositions,
     map_preposition,
 )
 from semantic_zoom.phase3.focusing_adverbs import (
@@ -36,7 +38,9 @@ __all__ = [
     # NSM-43: Preposition symbols
     "CategoricalSymbol",
     "PrepositionMapping",
+    "PrepositionMatch",
     "SymbolState",
+    "find_prepositions",
     "map_preposition",
     # NSM-44: Focusing adverbs
     "FocusingAdverb",
@@ -3,9 +3,16 @@
 Maps ~60 English prepositions to ~15-20 categorical symbols with state flags.
 Handles dual-citizenship prepositions via saturation mechanism.
 """
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 
 class CategoricalSymbol(Enum):
@@ -59,7 +66,7 @@ class CategoricalSymbol(Enum):
     GENERIC = "•"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolState:
     """State flags for preposition symbols.
 
@@ -73,7 +80,7 @@ class SymbolState:
     inverse: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PrepositionMapping:
     """Result of mapping a preposition to categorical symbol(s).
 
@@ -88,7 +95,7 @@ class PrepositionMapping:
     original: str
     symbol: CategoricalSymbol
     state: SymbolState
-    possible_symbols: list[CategoricalSymbol] = field(default_factory=list)
+    possible_symbols: tuple[CategoricalSymbol, ...] = ()
     saturated: bool = True
     is_dual_citizen: bool = False
 
@@ -116,6 +123,20 @@ class PrepositionMapping:
         )
 
 
+@dataclass(slots=True)
+class PrepositionMatch:
+    """A preposition located while scanning a sentence.
+
+    Attributes:
+        start: Character offset where the preposition begins
+        end: Character offset just past the preposition
+        mapping: The categorical mapping for the matched text
+    """
+    start: int
+    end: int
+    mapping: PrepositionMapping
+
+
 # Preposition mapping tables
 _DIRECTIONAL_TO: dict[str, tuple[CategoricalSymbol, SymbolState]] = {
     "to": (CategoricalSymbol.DIRECTIONAL_TO, SymbolState(motion="dynamic", inverse="from")),
@@ -183,21 +204,28 @@ _IDENTITY: dict[str, tuple[CategoricalSymbol, SymbolState]] = {
 }
 
 # Dual-citizenship prepositions (require context for resolution)
-_DUAL_CITIZENS: dict[str, tuple[list[CategoricalSymbol], SymbolState]] = {
+_DUAL_CITIZENS: dict[str, tuple[tuple[CategoricalSymbol, ...], SymbolState]] = {
     "at": (
-        [CategoricalSymbol.SPATIAL_AT, CategoricalSymbol.TEMPORAL_AT],
+        (CategoricalSymbol.SPATIAL_AT, CategoricalSymbol.TEMPORAL_AT),
         SymbolState(motion="static"),
     ),
     "by": (
-        [CategoricalSymbol.SPATIAL_PROXIMITY, CategoricalSymbol.AGENT_BY],
+        (CategoricalSymbol.SPATIAL_PROXIMITY, CategoricalSymbol.AGENT_BY),
         SymbolState(),
     ),
     "for": (
-        [CategoricalSymbol.PURPOSE_FOR, CategoricalSymbol.BENEFICIARY_FOR],
+        (CategoricalSymbol.PURPOSE_FOR, CategoricalSymbol.BENEFICIARY_FOR),
         SymbolState(),
     ),
 }
 
+# Shared single-symbol tuples for single-citizenship mappings
+_SINGLE_SYMBOLS: dict[CategoricalSymbol, tuple[CategoricalSymbol, ...]] = {
+    symbol: (symbol,) for symbol in CategoricalSymbol
+}
+
+_GENERIC_STATE = SymbolState()
+
 # Combine all single-citizenship mappings
 _SIMPLE_MAPPINGS: dict[str, tuple[CategoricalSymbol, SymbolState]] = {
     **_DIRECTIONAL_TO,
@@ -255,7 +283,7 @@ def map_preposition(preposition: str) -> PrepositionMapping:
             original=preposition,
             symbol=symbol,
             state=state,
-            possible_symbols=[symbol],
+            possible_symbols=_SINGLE_SYMBOLS[symbol],
             saturated=True,
             is_dual_citizen=False,
         )
@@ -264,8 +292,102 @@ def map_preposition(preposition: str) -> PrepositionMapping:
     return PrepositionMapping(
         original=preposition,
         symbol=CategoricalSymbol.GENERIC,
-        state=SymbolState(),
-        possible_symbols=[CategoricalSymbol.GENERIC],
+        state=_GENERIC_STATE,
+        possible_symbols=_SINGLE_SYMBOLS[CategoricalSymbol.GENERIC],
         saturated=True,
         is_dual_citizen=False,
     )
+
+
+# Every known preposition, single- and multi-word, for sentence scanning
+_ALL_PREPOSITIONS: tuple[str, ...] = (*_SIMPLE_MAPPINGS, *_DUAL_CITIZENS)
+
+
+def _build_scanner() -> "re.Pattern[str] | ahocorasick.Automaton":
+    """Build the sentence scanner once at import time.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed; otherwise
+    a longest-first regex alternation, which gives the same maximal-munch result.
+    """
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for prep in _ALL_PREPOSITIONS:
+            automaton.add_word(prep, len(prep))
+        automaton.make_automaton()
+        return automaton
+
+    alternation = "|".join(
+        re.escape(prep) for prep in sorted(_ALL_PREPOSITIONS, key=len, reverse=True)
+    )
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+_SCANNER = _build_scanner()
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character."""
+    return char.isalnum() or char == "_"
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text without changing its length, so offsets stay valid.
+
+    Characters whose lowercase form is longer (e.g. "İ") are kept as they
+    are; no preposition contains them.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def _scan_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) spans of prepositions in case-folded text.
+
+    Spans are whole-word, non-overlapping, and leftmost-longest.
+    """
+    if not HAS_AHOCORASICK:
+        for match in _SCANNER.finditer(text):
+            yield match.start(), match.end()
+        return
+
+    candidates = []
+    for end_idx, length in _SCANNER.iter(text):
+        start, end = end_idx - length + 1, end_idx + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        candidates.append((start, end))
+
+    candidates.sort(key=lambda span: (span[0], -span[1]))
+    last_end = 0
+    for start, end in candidates:
+        if start >= last_end:
+            yield start, end
+            last_end = end
+
+
+def find_prepositions(sentence: str) -> Iterator[PrepositionMatch]:
+    """Scan a sentence for known prepositions in a single linear pass.
+
+    Multi-word prepositions ("out of", "prior to") win over their
+    single-word prefixes, and matches must fall on word boundaries.
+
+    Args:
+        sentence: Raw sentence text (case-insensitive)
+
+    Yields:
+        PrepositionMatch for each preposition, in sentence order
+
+    Examples:
+        >>> [m.mapping.original for m in find_prepositions("He ran out of the house")]
+        ['out of']
+    """
+    for start, end in _scan_spans(_fold_case(sentence)):
+        yield PrepositionMatch(
+            start=start,
+            end=end,
+            mapping=map_preposition(sentence[start:end]),
+        )
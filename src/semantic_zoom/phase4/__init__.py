@@ -10,6 +10,7 @@ from semantic_zoom.phase4.framenet_assignment import (
     FrameElement,
     assign_frame,
     disambiguate_polysemous,
+    disambiguate_polysemous_batch,
 )
 from semantic_zoom.phase4.slot_filling import (
     FilledSlot,
@@ -20,6 +21,7 @@ from semantic_zoom.phase4.slot_filling import (
 from semantic_zoom.phase4.plan_description import (
     ClassificationResult,
     PropositionType,
+    ReasonCode,
     classify_proposition,
 )
 
@@ -30,6 +32,7 @@ __all__ = [
     "FrameElement",
     "assign_frame",
     "disambiguate_polysemous",
+    "disambiguate_polysemous_batch",
     # NSM-47
     "FilledSlot",
     "FrameInstance",
@@ -38,5 +41,6 @@ __all__ = [
     # NSM-48
     "ClassificationResult",
     "PropositionType",
+    "ReasonCode",
     "classify_proposition",
 ]
@@ -3,14 +3,16 @@
 Maps verbs to candidate FrameNet frames and disambiguates polysemous verbs
 using context and semantic similarity.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 from functools import lru_cache
 
 from nltk.corpus import framenet as fn
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameElement:
     """A frame element with its properties."""
     name: str
@@ -18,7 +20,7 @@ class FrameElement:
     definition: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameCandidate:
     """A candidate frame for a verb with confidence score."""
     frame_name: str
@@ -29,7 +31,7 @@ class FrameCandidate:
     definition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameAssignment:
     """Result of frame assignment for a verb."""
     verb: str
@@ -80,14 +82,44 @@ def _extract_frame_elements(frame) -> list[FrameElement]:
     return elements
 
 
+# Lexical unit resolved per (frame ID, verb)
+_LU_CACHE: dict[tuple[int, str], str] = {}
+
+# (lowercased, original) lexical unit names per frame ID
+_FRAME_LU_LOWER: dict[int, list[tuple[str, str]]] = {}
+
+
 def _find_lexical_unit(frame, verb: str) -> str:
     """Find the lexical unit in the frame that matches the verb."""
-    for lu_name in frame.lexUnit.keys():
-        # Lexical units are formatted as "word.pos"
-        if lu_name.lower().startswith(verb.lower() + "."):
-            return lu_name
-    # Fallback: return first matching or generic
-    return f"{verb}.v"
+    key = (frame.ID, verb)
+    cached = _LU_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    lu_names = _FRAME_LU_LOWER.get(frame.ID)
+    if lu_names is None:
+        lu_names = [(lu_name.lower(), lu_name) for lu_name in frame.lexUnit.keys()]
+        _FRAME_LU_LOWER[frame.ID] = lu_names
+
+    # Lexical units are formatted as "word.pos"
+    verb_prefix = verb.lower() + "."
+    result = f"{verb}.v"  # Fallback: generic verb LU
+    for lu_lower, lu_name in lu_names:
+        if lu_lower.startswith(verb_prefix):
+            result = lu_name
+            break
+
+    _LU_CACHE[key] = result
+    return result
+
+
+def _cosine_similarity(vec1, vec2) -> float:
+    """Cosine similarity of two embeddings, clamped to [0, 1]."""
+    from numpy import dot
+    from numpy.linalg import norm
+    similarity = dot(vec1, vec2) / (norm(vec1) * norm(vec2))
+    # Clamp to [0, 1] range (cosine can be negative)
+    return max(0.0, min(1.0, float(similarity)))
 
 
 def _compute_semantic_similarity(text1: str, text2: str) -> float:
@@ -98,17 +130,17 @@ def _compute_semantic_similarity(text1: str, text2: str) -> float:
 
     try:
         embeddings = model.encode([text1, text2])
-        # Cosine similarity
-        from numpy import dot
-        from numpy.linalg import norm
-        similarity = dot(embeddings[0], embeddings[1]) / (norm(embeddings[0]) * norm(embeddings[1]))
-        # Clamp to [0, 1] range (cosine can be negative)
-        return max(0.0, min(1.0, float(similarity)))
+        return _cosine_similarity(embeddings[0], embeddings[1])
     except Exception:
         return 0.5
 
 
-def _score_frame_for_context(frame, verb: str, context: Optional[str]) -> float:
+def _score_frame_for_context(
+    frame,
+    verb: str,
+    context: Optional[str],
+    similarity_fn: Callable[[str, str], float] = _compute_semantic_similarity,
+) -> float:
     """Score how well a frame matches the given context."""
     if context is None:
         # No context: use frame frequency/salience heuristic
@@ -120,7 +152,7 @@ def _score_frame_for_context(frame, verb: str, context: Optional[str]) -> float:
     frame_def = frame.definition if hasattr(frame, 'definition') else ""
 
     # Compute similarity between context and frame definition
-    similarity = _compute_semantic_similarity(context, frame_def)
+    similarity = similarity_fn(context, frame_def)
 
     # Boost if frame name contains relevant keywords from context
     context_lower = context.lower()
@@ -195,6 +227,16 @@ def disambiguate_polysemous(
         initial = assign_frame(verb, context=None)
         candidates = initial.candidates
 
+    return _rescore_candidates(verb, candidates, context, _compute_semantic_similarity)
+
+
+def _rescore_candidates(
+    verb: str,
+    candidates: list[FrameCandidate],
+    context: str,
+    similarity_fn: Callable[[str, str], float],
+) -> FrameAssignment:
+    """Re-rank candidates against context using the given similarity function."""
     if not candidates:
         return FrameAssignment(verb=verb, candidates=[], best_frame=None)
 
@@ -204,7 +246,7 @@ def disambiguate_polysemous(
         # Get the original frame for full definition
         try:
             frame = fn.frame(candidate.frame_name)
-            new_confidence = _score_frame_for_context(frame, verb, context)
+            new_confidence = _score_frame_for_context(frame, verb, context, similarity_fn)
             rescored.append(FrameCandidate(
                 frame_name=candidate.frame_name,
                 frame_id=candidate.frame_id,
@@ -223,3 +265,57 @@ def disambiguate_polysemous(
         candidates=rescored,
         best_frame=rescored[0] if rescored else None
     )
+
+
+def disambiguate_polysemous_batch(
+    items: list[tuple[str, str]]
+) -> list[FrameAssignment]:
+    """Disambiguate many (verb, context) pairs with a single embedding pass.
+
+    All contexts and candidate frame definitions are encoded in one call;
+    per-item re-ranking then runs on a thread pool.
+
+    Args:
+        items: (verb lemma, sentence context) pairs
+
+    Returns:
+        FrameAssignment for each item, in input order
+    """
+    if not items:
+        return []
+
+    # Load the model before any worker threads need it
+    model = _get_embedding_model()
+
+    prepared = []
+    text_index: dict[str, int] = {}
+    for verb, context in items:
+        candidates = assign_frame(verb, context=None).candidates
+        prepared.append((verb, candidates, context))
+        text_index.setdefault(context, len(text_index))
+        for candidate in candidates:
+            try:
+                frame = fn.frame(candidate.frame_name)
+            except Exception:
+                continue
+            frame_def = frame.definition if hasattr(frame, 'definition') else ""
+            text_index.setdefault(frame_def, len(text_index))
+
+    embeddings = None
+    if model is not None:
+        try:
+            embeddings = model.encode(list(text_index))
+        except Exception:
+            embeddings = None
+
+    def similarity(text1: str, text2: str) -> float:
+        if embeddings is None:
+            return 0.5  # Default similarity when no model available
+        return _cosine_similarity(embeddings[text_index[text1]], embeddings[text_index[text2]])
+
+    def rescore(item: tuple[str, list[FrameCandidate], str]) -> FrameAssignment:
+        verb, candidates, context = item
+        return _rescore_candidates(verb, candidates, context, similarity)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(rescore, prepared))
@@ -4,8 +4,8 @@ Classifies propositions as PLAN (dynamic/eventive), DESCRIPTION (stative),
 or HYBRID based on frame semantics and aspectual properties.
 """
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntEnum
+from typing import Optional, overload
 
 
 class PropositionType(Enum):
@@ -15,12 +15,93 @@ class PropositionType(Enum):
     HYBRID = "hybrid"
 
 
+class ReasonCode(IntEnum):
+    """Reasons contributing to a plan/description classification."""
+    FRAME_DYNAMIC = 1
+    FRAME_STATIVE = 2
+    VERB_STATIVE = 3
+    DEFAULT_VERB = 4
+    ASPECT_DYNAMIC_SHIFT = 5
+    ASPECT_STATIVE_SHIFT = 6
+    ASPECT_HYBRID = 7
+    MOOD_PLAN = 8
+    TENSE_SHIFTS_PLAN = 9
+    TENSE_CONFIRMS_PLAN = 10
+
+
+# Human-readable templates, formatted only when reasoning is requested
+_REASON_TEMPLATES: dict[ReasonCode, str] = {
+    ReasonCode.FRAME_DYNAMIC: "Frame '{frame_name}' is dynamic/eventive",
+    ReasonCode.FRAME_STATIVE: "Frame '{frame_name}' is stative",
+    ReasonCode.VERB_STATIVE: "Verb '{verb}' is lexically stative",
+    ReasonCode.DEFAULT_VERB: "Default classification for verb '{verb}'",
+    ReasonCode.ASPECT_DYNAMIC_SHIFT: "{aspect} aspect shifts toward dynamic",
+    ReasonCode.ASPECT_STATIVE_SHIFT: "{aspect} aspect shifts toward stative",
+    ReasonCode.ASPECT_HYBRID: "{aspect} aspect creates hybrid",
+    ReasonCode.MOOD_PLAN: "{mood} mood indicates PLAN",
+    ReasonCode.TENSE_SHIFTS_PLAN: "{tense} tense shifts toward PLAN",
+    ReasonCode.TENSE_CONFIRMS_PLAN: "{tense} tense confirms PLAN",
+}
+
+
+class _ReasoningField:
+    """Descriptor backing the ``ClassificationResult.reasoning`` field.
+
+    An explicitly passed string is returned as-is; otherwise the text is
+    formatted from the reason codes each time it is read, so results that
+    are never explained pay no formatting cost.
+    """
+
+    @overload
+    def __get__(self, result: None, owner: type) -> None: ...
+
+    @overload
+    def __get__(self, result: "ClassificationResult", owner: type) -> str: ...
+
+    def __get__(
+        self, result: Optional["ClassificationResult"], owner: type
+    ) -> Optional[str]:
+        # Read on the class, this is the dataclass default
+        if result is None:
+            return None
+        text: Optional[str] = result.__dict__["_reasoning"]
+        return text if text is not None else result._format_reasoning()
+
+    def __set__(self, result: "ClassificationResult", value: Optional[str]) -> None:
+        result.__dict__["_reasoning"] = value
+
+
 @dataclass
 class ClassificationResult:
-    """Result of plan/description classification."""
+    """Result of plan/description classification.
+
+    Reasons are recorded as codes and ``reasoning`` is formatted from them
+    on demand, unless a reasoning string is passed explicitly.
+    """
     proposition_type: PropositionType
     confidence: float
-    reasoning: str
+    reasoning: _ReasoningField = _ReasoningField()
+    reasoning_codes: tuple[ReasonCode, ...] = ()
+    verb: str = ""
+    frame_name: str = ""
+    aspect: Optional[str] = None
+    tense: Optional[str] = None
+    mood: Optional[str] = None
+
+    def _format_reasoning(self) -> str:
+        """Build the human-readable explanation from the reason codes."""
+        if not self.reasoning_codes:
+            return "Default classification"
+        return "; ".join(
+            _REASON_TEMPLATES[code].format(
+                verb=self.verb,
+                frame_name=self.frame_name,
+                aspect=self.aspect,
+                tense=self.tense,
+                mood=self.mood,
+            )
+            for code in self.reasoning_codes
+        )
 
 
 # Frames that are inherently dynamic/eventive (favor PLAN)
@@ -145,43 +226,30 @@ def _is_verb_stative(verb: str) -> bool:
 def _compute_base_classification(
     verb: str,
     frame_name: str
-) -> tuple[PropositionType, float, str]:
+) -> tuple[PropositionType, float, ReasonCode]:
     """Compute base classification from verb and frame."""
-    reasons = []
-
     # Check frame type
     frame_dynamic = _is_frame_dynamic(frame_name)
     verb_stative = _is_verb_stative(verb)
 
     if frame_dynamic is True:
-        base_type = PropositionType.PLAN
-        confidence = 0.8
-        reasons.append(f"Frame '{frame_name}' is dynamic/eventive")
-    elif frame_dynamic is False:
-        base_type = PropositionType.DESCRIPTION
-        confidence = 0.8
-        reasons.append(f"Frame '{frame_name}' is stative")
-    elif verb_stative:
-        base_type = PropositionType.DESCRIPTION
-        confidence = 0.7
-        reasons.append(f"Verb '{verb}' is lexically stative")
-    else:
-        # Default to PLAN for unknown frames with non-stative verbs
-        base_type = PropositionType.PLAN
-        confidence = 0.6
-        reasons.append(f"Default classification for verb '{verb}'")
-
-    return base_type, confidence, "; ".join(reasons)
+        return PropositionType.PLAN, 0.8, ReasonCode.FRAME_DYNAMIC
+    if frame_dynamic is False:
+        return PropositionType.DESCRIPTION, 0.8, ReasonCode.FRAME_STATIVE
+    if verb_stative:
+        return PropositionType.DESCRIPTION, 0.7, ReasonCode.VERB_STATIVE
+    # Default to PLAN for unknown frames with non-stative verbs
+    return PropositionType.PLAN, 0.6, ReasonCode.DEFAULT_VERB
 
 
 def _apply_aspect_modulation(
     base_type: PropositionType,
     confidence: float,
     aspect: Optional[str]
-) -> tuple[PropositionType, float, str]:
+) -> tuple[PropositionType, float, Optional[ReasonCode]]:
     """Apply aspectual modulation to classification."""
     if aspect is None or aspect not in ASPECT_EFFECTS:
-        return base_type, confidence, ""
+        return base_type, confidence, None
 
     effect_type, shift_amount = ASPECT_EFFECTS[aspect]
 
@@ -189,18 +257,18 @@ def _apply_aspect_modulation(
         if base_type == PropositionType.DESCRIPTION:
             # Shift toward HYBRID or PLAN
             if shift_amount > 0.3:
-                return PropositionType.HYBRID, confidence * 0.9, f"{aspect} aspect shifts toward dynamic"
+                return PropositionType.HYBRID, confidence * 0.9, ReasonCode.ASPECT_DYNAMIC_SHIFT
             else:
-                return PropositionType.HYBRID, confidence * 0.8, f"{aspect} aspect creates hybrid"
+                return PropositionType.HYBRID, confidence * 0.8, ReasonCode.ASPECT_HYBRID
     elif effect_type == "stative_shift":
         if base_type == PropositionType.PLAN:
             # Shift toward HYBRID or DESCRIPTION
             if shift_amount > 0.3:
-                return PropositionType.HYBRID, confidence * 0.9, f"{aspect} aspect shifts toward stative"
+                return PropositionType.HYBRID, confidence * 0.9, ReasonCode.ASPECT_STATIVE_SHIFT
             else:
-                return PropositionType.HYBRID, confidence * 0.8, f"{aspect} aspect creates hybrid"
+                return PropositionType.HYBRID, confidence * 0.8, ReasonCode.ASPECT_HYBRID
 
-    return base_type, confidence, ""
+    return base_type, confidence, None
 
 
 def _apply_mood_tense_modulation(
@@ -208,9 +276,9 @@ def _apply_mood_tense_modulation(
     confidence: float,
     mood: Optional[str],
     tense: Optional[str]
-) -> tuple[PropositionType, float, str]:
+) -> tuple[PropositionType, float, list[ReasonCode]]:
     """Apply mood and tense effects."""
-    reasons = []
+    reasons: list[ReasonCode] = []
 
     # Mood effects
     if mood and mood in MOOD_EFFECTS:
@@ -219,7 +287,7 @@ def _apply_mood_tense_modulation(
             if mood_effect == PropositionType.PLAN and base_type != PropositionType.PLAN:
                 base_type = PropositionType.PLAN
                 confidence = min(confidence + 0.1, 1.0)
-                reasons.append(f"{mood} mood indicates PLAN")
+                reasons.append(ReasonCode.MOOD_PLAN)
 
     # Tense effects
     if tense and tense in TENSE_EFFECTS:
@@ -228,12 +296,12 @@ def _apply_mood_tense_modulation(
             if tense_effect == PropositionType.PLAN:
                 if base_type == PropositionType.DESCRIPTION:
                     base_type = PropositionType.HYBRID
-                    reasons.append(f"{tense} tense shifts toward PLAN")
+                    reasons.append(ReasonCode.TENSE_SHIFTS_PLAN)
                 elif base_type == PropositionType.HYBRID:
                     base_type = PropositionType.PLAN
-                    reasons.append(f"{tense} tense confirms PLAN")
+                    reasons.append(ReasonCode.TENSE_CONFIRMS_PLAN)
 
-    return base_type, confidence, "; ".join(reasons)
+    return base_type, confidence, reasons
 
 
 def classify_proposition(
@@ -257,27 +325,30 @@ def classify_proposition(
     Returns:
         ClassificationResult with type, confidence, and reasoning
     """
-    all_reasons = []
-
     # Step 1: Base classification from frame and verb
-    prop_type, confidence, reason = _compute_base_classification(verb, frame_name)
-    if reason:
-        all_reasons.append(reason)
+    prop_type, confidence, base_reason = _compute_base_classification(verb, frame_name)
+    all_reasons = [base_reason]
 
     # Step 2: Apply aspectual modulation
-    prop_type, confidence, reason = _apply_aspect_modulation(prop_type, confidence, aspect)
-    if reason:
-        all_reasons.append(reason)
+    prop_type, confidence, aspect_reason = _apply_aspect_modulation(
+        prop_type, confidence, aspect
+    )
+    if aspect_reason is not None:
+        all_reasons.append(aspect_reason)
 
     # Step 3: Apply mood/tense modulation
-    prop_type, confidence, reason = _apply_mood_tense_modulation(
+    prop_type, confidence, mood_tense_reasons = _apply_mood_tense_modulation(
         prop_type, confidence, mood, tense
     )
-    if reason:
-        all_reasons.append(reason)
+    all_reasons.extend(mood_tense_reasons)
 
     return ClassificationResult(
         proposition_type=prop_type,
         confidence=min(confidence, 1.0),
-        reasoning="; ".join(all_reasons) if all_reasons else "Default classification"
+        reasoning_codes=tuple(all_reasons),
+        verb=verb,
+        frame_name=frame_name,
+        aspect=aspect,
+        tense=tense,
+        mood=mood,
     )
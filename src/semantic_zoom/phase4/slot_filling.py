@@ -21,7 +21,7 @@ class SlotStatus(Enum):
     IMPLICIT = "implicit"
 
 
-@dataclass
+@dataclass(slots=True)
 class FilledSlot:
     """A frame element slot with its filling status."""
     element_name: str
@@ -35,7 +35,7 @@ class FilledSlot:
             self.implicit = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameInstance:
     """An instantiated frame with filled slots."""
     frame_name: str
@@ -50,29 +50,37 @@ class FrameInstance:
 
 
 # Mapping from syntactic roles to likely frame element names
-SUBJECT_ROLES = {
+SUBJECT_ROLES = frozenset({
     "Agent", "Actor", "Cause", "Experiencer", "Donor", "Giver",
     "Speaker", "Cognizer", "Creator", "Author", "Ingestor",
     "Theme", "Breaker", "Killer", "Cook", "Builder", "Writer",
     "Self_mover", "Perceiver", "Owner"
-}
+})
 
-OBJECT_ROLES = {
+OBJECT_ROLES = frozenset({
     "Theme", "Patient", "Undergoer", "Phenomenon", "Content",
     "Message", "Created_entity", "Food", "Building", "Text",
     "Broken_entity", "Victim", "Ingestibles", "Entity",
     "Information", "Item", "Goods", "Resource"
-}
+})
 
-INDIRECT_OBJECT_ROLES = {
+INDIRECT_OBJECT_ROLES = frozenset({
     "Recipient", "Goal", "Beneficiary", "Addressee", "Receiver"
+})
+
+# Preferred frame element roles per syntactic argument type
+_ROLES_BY_ARG_TYPE: dict[str, frozenset[str]] = {
+    "subject": SUBJECT_ROLES,
+    "object": OBJECT_ROLES,
+    "indirect_object": INDIRECT_OBJECT_ROLES,
 }
 
 
 def _match_argument_to_element(
     arg_value: Optional[str],
     arg_type: str,  # "subject", "object", "indirect_object"
-    frame_elements: list[FrameElement]
+    frame_elements: list[FrameElement],
+    core_elements: list[FrameElement],
 ) -> tuple[Optional[str], float]:
     """Match an argument to the best frame element.
 
@@ -83,18 +91,11 @@ def _match_argument_to_element(
         return None, 0.0
 
     # Get the role set based on argument type
-    if arg_type == "subject":
-        preferred_roles = SUBJECT_ROLES
-    elif arg_type == "object":
-        preferred_roles = OBJECT_ROLES
-    elif arg_type == "indirect_object":
-        preferred_roles = INDIRECT_OBJECT_ROLES
-    else:
-        preferred_roles = set()
+    preferred_roles = _ROLES_BY_ARG_TYPE.get(arg_type, frozenset())
 
     # First pass: look for Core elements matching preferred roles
-    for fe in frame_elements:
-        if fe.core_type == "Core" and fe.name in preferred_roles:
+    for fe in core_elements:
+        if fe.name in preferred_roles:
             return fe.name, 0.9
 
     # Second pass: any element matching preferred roles
@@ -103,7 +104,6 @@ def _match_argument_to_element(
             return fe.name, 0.7
 
     # Third pass: first Core element
-    core_elements = [fe for fe in frame_elements if fe.core_type == "Core"]
     if core_elements:
         return core_elements[0].name, 0.5
 
@@ -111,43 +111,26 @@ def _match_argument_to_element(
 
 
 def _detect_implicit_arguments(
-    frame_elements: list[FrameElement],
+    core_subject_elements: list[FrameElement],
     filled_element_names: set[str],
-    subject: Optional[str],
-    verb: str
-) -> list[FilledSlot]:
-    """Detect implicit (unexpressed but understood) arguments."""
-    implicit_slots = []
-
-    # Check for inchoative/anticausative alternations
-    # e.g., "The door opened" - implicit opener
-    if subject is not None:
-        # Look for unfilled agent-like Core elements
-        for fe in frame_elements:
-            if fe.core_type == "Core" and fe.name not in filled_element_names:
-                if fe.name in SUBJECT_ROLES:
-                    implicit_slots.append(FilledSlot(
-                        element_name=fe.name,
-                        core_type=fe.core_type,
-                        status=SlotStatus.IMPLICIT,
-                        value=None,
-                        implicit=True
-                    ))
-
-    # Pro-drop detection (subject is None but expected)
-    if subject is None:
-        for fe in frame_elements:
-            if fe.core_type == "Core" and fe.name in SUBJECT_ROLES:
-                if fe.name not in filled_element_names:
-                    implicit_slots.append(FilledSlot(
-                        element_name=fe.name,
-                        core_type=fe.core_type,
-                        status=SlotStatus.IMPLICIT,
-                        value=None,
-                        implicit=True
-                    ))
-
-    return implicit_slots
+) -> set[str]:
+    """Detect implicit (unexpressed but understood) arguments.
+
+    Covers inchoative/anticausative alternations ("The door opened" has an
+    implicit opener) and pro-drop (no subject, but one is expected): in both
+    cases any unfilled agent-like Core element is implicit.
+
+    Args:
+        core_subject_elements: Core frame elements in SUBJECT_ROLES
+        filled_element_names: Names of elements already filled
+
+    Returns:
+        Names of the frame elements to mark implicit
+    """
+    return {
+        fe.name for fe in core_subject_elements
+        if fe.name not in filled_element_names
+    }
 
 
 def fill_slots(
@@ -185,85 +168,56 @@ def fill_slots(
         frame = assignment.best_frame
 
     frame_elements = frame.frame_elements
+    fe_by_name = {fe.name: fe for fe in frame_elements}
+    core_elements = [fe for fe in frame_elements if fe.core_type == "Core"]
+    core_subject_elements = [fe for fe in core_elements if fe.name in SUBJECT_ROLES]
     filled_slots = []
     filled_element_names = set()
 
-    # Map subject to element
-    if subject is not None:
-        element_name, confidence = _match_argument_to_element(
-            subject, "subject", frame_elements
-        )
-        if element_name:
-            fe = next((fe for fe in frame_elements if fe.name == element_name), None)
-            if fe:
-                filled_slots.append(FilledSlot(
-                    element_name=element_name,
-                    core_type=fe.core_type,
-                    status=SlotStatus.FILLED,
-                    value=subject,
-                    implicit=False
-                ))
-                filled_element_names.add(element_name)
-
-    # Map direct object to element
-    if object is not None:
+    # Map subject, direct object and indirect object to elements, in order
+    arguments = (
+        ("subject", subject),
+        ("object", object),
+        ("indirect_object", indirect_object),
+    )
+    for arg_type, arg_value in arguments:
+        if arg_value is None:
+            continue
         element_name, confidence = _match_argument_to_element(
-            object, "object", frame_elements
+            arg_value, arg_type, frame_elements, core_elements
         )
         if element_name and element_name not in filled_element_names:
-            fe = next((fe for fe in frame_elements if fe.name == element_name), None)
+            fe = fe_by_name.get(element_name)
             if fe:
                 filled_slots.append(FilledSlot(
                     element_name=element_name,
                     core_type=fe.core_type,
                     status=SlotStatus.FILLED,
-                    value=object,
+                    value=arg_value,
                     implicit=False
                 ))
                 filled_element_names.add(element_name)
 
-    # Map indirect object to element
-    if indirect_object is not None:
-        element_name, confidence = _match_argument_to_element(
-            indirect_object, "indirect_object", frame_elements
-        )
-        if element_name and element_name not in filled_element_names:
-            fe = next((fe for fe in frame_elements if fe.name == element_name), None)
-            if fe:
-                filled_slots.append(FilledSlot(
-                    element_name=element_name,
-                    core_type=fe.core_type,
-                    status=SlotStatus.FILLED,
-                    value=indirect_object,
-                    implicit=False
-                ))
-                filled_element_names.add(element_name)
+    # Detect implicit arguments among the elements left unfilled
+    implicit_names = _detect_implicit_arguments(
+        core_subject_elements, filled_element_names
+    )
 
-    # Build all_slots with unfilled elements
+    # Build all_slots: filled first, then each remaining element once,
+    # as implicit or unfilled
     all_slots = filled_slots.copy()
 
     for fe in frame_elements:
         if fe.name not in filled_element_names:
+            implicit = fe.name in implicit_names
             all_slots.append(FilledSlot(
                 element_name=fe.name,
                 core_type=fe.core_type,
-                status=SlotStatus.UNFILLED,
+                status=SlotStatus.IMPLICIT if implicit else SlotStatus.UNFILLED,
                 value=None,
-                implicit=False
+                implicit=implicit
             ))
 
-    # Detect implicit arguments
-    implicit_slots = _detect_implicit_arguments(
-        frame_elements, filled_element_names, subject, verb
-    )
-    for slot in implicit_slots:
-        if slot.element_name not in filled_element_names:
-            # Update the unfilled slot to implicit
-            for i, s in enumerate(all_slots):
-                if s.element_name == slot.element_name and s.status == SlotStatus.UNFILLED:
-                    all_slots[i] = slot
-                    break
-
     return FrameInstance(
         frame_name=frame.frame_name,
         frame_id=frame.frame_id,
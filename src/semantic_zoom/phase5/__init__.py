@@ -9,7 +9,9 @@ from semantic_zoom.phase5.nodes import (
     NodeType,
     SemanticNode,
     create_node,
+    create_nodes_from_doc,
     create_nodes_from_text,
+    create_nodes_from_texts,
 )
 from semantic_zoom.phase5.edges import (
     AdverbAttachment,
@@ -19,6 +21,7 @@ from semantic_zoom.phase5.edges import (
     NULL_NODE_ID,
     create_edge,
     create_edges_from_text,
+    create_edges_from_texts,
 )
 from semantic_zoom.phase5.morphisms import (
     AttachmentLevel,
@@ -35,6 +38,7 @@ from semantic_zoom.phase5.inter_frame import (
     create_explicit_link,
     create_implicit_link,
     detect_frame_relations,
+    iter_detect_frame_relations,
 )
 
 __all__ = [
@@ -42,7 +46,9 @@ __all__ = [
     "NodeType",
     "SemanticNode",
     "create_node",
+    "create_nodes_from_doc",
     "create_nodes_from_text",
+    "create_nodes_from_texts",
     # NSM-50: Edges
     "AdverbAttachment",
     "AdverbTier",
@@ -51,6 +57,7 @@ __all__ = [
     "NULL_NODE_ID",
     "create_edge",
     "create_edges_from_text",
+    "create_edges_from_texts",
     # NSM-51: Morphisms
     "AttachmentLevel",
     "MorphismAttachment",
@@ -65,4 +72,5 @@ __all__ = [
     "create_explicit_link",
     "create_implicit_link",
     "detect_frame_relations",
+    "iter_detect_frame_relations",
 ]
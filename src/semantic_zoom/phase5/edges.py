@@ -6,32 +6,21 @@ Creates semantic graph edges from verb predicates with:
 - Tiered adverb stack attachment
 """
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Optional
-import uuid
+from enum import Enum, IntEnum, auto
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 
-from semantic_zoom.phase5.nodes import SemanticNode, create_nodes_from_text
+from semantic_zoom._ids import next_id
+from semantic_zoom.phase5.nodes import (
+    SemanticNode,
+    _get_nlp,
+    _parse_text,
+    create_nodes_from_doc,
+)
 
 # Sentinel value for NULL/implicit object node
 NULL_NODE_ID = "NULL_NODE"
 
-# Lazy load spacy
-_nlp = None
-
-
-def _get_nlp():
-    """Lazy load spacy model."""
-    global _nlp
-    if _nlp is None:
-        import spacy
-        try:
-            _nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-            _nlp = spacy.load("en_core_web_sm")
-    return _nlp
-
 
 class EdgeType(Enum):
     """Types of semantic edges."""
@@ -42,7 +31,7 @@ class EdgeType(Enum):
     COGNITION = auto()   # Mental state verbs
 
 
-class AdverbTier(Enum):
+class AdverbTier(IntEnum):
     """Tiers for adverb attachment.
     
     Adverbs attach at different semantic levels:
@@ -61,7 +50,53 @@ class AdverbTier(Enum):
     EPISTEMIC = auto()
 
 
-@dataclass
+# Dependency labels that edge extraction reads from a verb's children
+_DEP_SUBJECT = "subject"
+_DEP_OBJECT = "object"
+_DEP_ADVERB = "adverb"
+_DEP_KIND: dict[str, str] = {
+    "nsubj": _DEP_SUBJECT,
+    "nsubjpass": _DEP_SUBJECT,
+    "dobj": _DEP_OBJECT,
+    "obj": _DEP_OBJECT,
+    "advmod": _DEP_ADVERB,
+}
+
+# Verb classes for edge typing
+_STATIVE_VERBS = frozenset({"be", "have", "know", "believe", "want", "need", "like", "love"})
+_PERCEPTION_VERBS = frozenset({"see", "hear", "feel", "smell", "taste", "watch", "notice"})
+_COGNITION_VERBS = frozenset({"think", "understand", "remember", "forget", "realize", "consider"})
+_RELATION_VERBS = frozenset({"belong", "contain", "include", "resemble", "equal", "differ"})
+
+# Known verbs by edge type; anything else defaults to ACTION
+_VERB_EDGE_TYPE: dict[str, EdgeType] = {
+    **{v: EdgeType.RELATION for v in _RELATION_VERBS},
+    **{v: EdgeType.COGNITION for v in _COGNITION_VERBS},
+    **{v: EdgeType.PERCEPTION for v in _PERCEPTION_VERBS},
+    **{v: EdgeType.STATE for v in _STATIVE_VERBS},
+}
+
+# Known adverbs by tier; anything else defaults to MANNER
+_ADVERB_TIER: dict[str, AdverbTier] = {
+    **{w: AdverbTier.TEMPORAL for w in (
+        "yesterday", "today", "tomorrow", "now", "then", "soon", "later", "already",
+    )},
+    **{w: AdverbTier.LOCATIVE for w in (
+        "here", "there", "everywhere", "nowhere", "somewhere", "inside", "outside",
+    )},
+    **{w: AdverbTier.FREQUENCY for w in (
+        "always", "never", "often", "sometimes", "rarely", "usually", "seldom",
+    )},
+    **{w: AdverbTier.DEGREE for w in (
+        "very", "extremely", "quite", "rather", "somewhat", "too", "enough",
+    )},
+    **{w: AdverbTier.EPISTEMIC for w in (
+        "probably", "possibly", "certainly", "definitely", "maybe", "perhaps",
+    )},
+}
+
+
+@dataclass(slots=True)
 class AdverbAttachment:
     """An adverb attached to an edge at a specific tier."""
     text: str
@@ -69,7 +104,7 @@ class AdverbAttachment:
     span: Optional[tuple[int, int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticEdge:
     """An edge in the semantic graph representing a verb predicate.
     
@@ -105,28 +140,13 @@ class SemanticEdge:
 
 def _generate_edge_id() -> str:
     """Generate a unique edge identifier."""
-    return f"edge_{uuid.uuid4().hex[:12]}"
+    return next_id("edge_")
 
 
+@lru_cache(maxsize=2048)
 def _classify_edge_type(verb: str) -> EdgeType:
     """Classify edge type based on verb."""
-    stative_verbs = {"be", "have", "know", "believe", "want", "need", "like", "love"}
-    perception_verbs = {"see", "hear", "feel", "smell", "taste", "watch", "notice"}
-    cognition_verbs = {"think", "understand", "remember", "forget", "realize", "consider"}
-    relation_verbs = {"belong", "contain", "include", "resemble", "equal", "differ"}
-    
-    verb_lower = verb.lower()
-    
-    if verb_lower in stative_verbs:
-        return EdgeType.STATE
-    elif verb_lower in perception_verbs:
-        return EdgeType.PERCEPTION
-    elif verb_lower in cognition_verbs:
-        return EdgeType.COGNITION
-    elif verb_lower in relation_verbs:
-        return EdgeType.RELATION
-    else:
-        return EdgeType.ACTION
+    return _VERB_EDGE_TYPE.get(verb.lower(), EdgeType.ACTION)
 
 
 def create_edge(
@@ -161,13 +181,10 @@ def create_edge(
         is_intransitive = False
     
     # Build adverb stack
-    adverb_stack = []
-    if adverbs:
-        for adverb_text, tier in adverbs:
-            adverb_stack.append(AdverbAttachment(
-                text=adverb_text,
-                tier=tier,
-            ))
+    adverb_stack = [
+        AdverbAttachment(text=adverb_text, tier=tier)
+        for adverb_text, tier in adverbs
+    ] if adverbs else []
     
     # Determine edge type
     if edge_type is None:
@@ -186,6 +203,26 @@ def create_edge(
     )
 
 
+def _index_nodes_by_char(
+    nodes: list[SemanticNode],
+    text_length: int,
+) -> list[Optional[SemanticNode]]:
+    """Map every character offset to the node whose span covers it.
+    
+    Args:
+        nodes: Nodes with disjoint spans
+        text_length: Length of the source text
+        
+    Returns:
+        List indexed by character offset, None where no node covers it
+    """
+    char_to_node: list[Optional[SemanticNode]] = [None] * text_length
+    for node in nodes:
+        start, end = node.span
+        char_to_node[start:end] = [node] * (end - start)
+    return char_to_node
+
+
 def create_edges_from_text(text: str) -> list[SemanticEdge]:
     """Extract all verb edges from text using NLP.
     
@@ -195,12 +232,47 @@ def create_edges_from_text(text: str) -> list[SemanticEdge]:
     Returns:
         List of SemanticEdge objects for all verb predicates
     """
-    nlp = _get_nlp()
-    doc = nlp(text)
+    # Parse once and share the Doc with node creation
+    doc = _parse_text(text)
     
     # First create nodes
-    nodes = create_nodes_from_text(text)
-    node_by_span = {(n.span[0], n.span[1]): n for n in nodes}
+    nodes = create_nodes_from_doc(doc)
+    return _create_edges_from_doc(doc, nodes)
+
+
+def create_edges_from_texts(
+    texts: Iterable[str],
+    batch_size: int = 32,
+) -> Iterator[list[SemanticEdge]]:
+    """Extract verb edges from many texts, parsing each text once.
+    
+    Texts are parsed in batches with nlp.pipe, and each Doc is shared
+    between node and edge creation.
+    
+    Args:
+        texts: Input texts to analyze
+        batch_size: Number of texts per spaCy batch
+        
+    Yields:
+        List of SemanticEdge objects for each text, in input order
+    """
+    nlp = _get_nlp()
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        yield _create_edges_from_doc(doc, create_nodes_from_doc(doc))
+
+
+def _create_edges_from_doc(doc, nodes: list[SemanticNode]) -> list[SemanticEdge]:
+    """Extract verb edges from a parsed Doc, linking to the given nodes.
+    
+    Args:
+        doc: Parsed spaCy Doc
+        nodes: Nodes created from the same text
+        
+    Returns:
+        List of SemanticEdge objects for all verb predicates
+    """
+    # Character offset -> node table, built on the first subject/object lookup
+    char_to_node: Optional[list[Optional[SemanticNode]]] = None
     
     edges = []
     
@@ -212,21 +284,25 @@ def create_edges_from_text(text: str) -> list[SemanticEdge]:
             adverbs = []
             
             for child in token.children:
-                if child.dep_ in ("nsubj", "nsubjpass"):
-                    # Find corresponding node
-                    for span, node in node_by_span.items():
-                        if span[0] <= child.idx < span[1]:
-                            subject_node = node
-                            break
-                elif child.dep_ in ("dobj", "obj"):
-                    for span, node in node_by_span.items():
-                        if span[0] <= child.idx < span[1]:
-                            object_node = node
-                            break
-                elif child.dep_ == "advmod":
+                dep_kind = _DEP_KIND.get(child.dep_)
+                if dep_kind is None:
+                    continue
+                if dep_kind is _DEP_ADVERB:
                     # Classify adverb tier (simplified)
                     tier = _classify_adverb_tier(child.text)
                     adverbs.append((child.text, tier))
+                    continue
+                
+                # Find corresponding node
+                if char_to_node is None:
+                    char_to_node = _index_nodes_by_char(nodes, len(doc.text))
+                node = char_to_node[child.idx]
+                if node is None:
+                    continue
+                if dep_kind is _DEP_SUBJECT:
+                    subject_node = node
+                else:
+                    object_node = node
             
             if subject_node:
                 edge = create_edge(
@@ -241,25 +317,7 @@ def create_edges_from_text(text: str) -> list[SemanticEdge]:
     return edges
 
 
+@lru_cache(maxsize=2048)
 def _classify_adverb_tier(adverb: str) -> AdverbTier:
     """Classify adverb into a tier based on common patterns."""
-    adverb_lower = adverb.lower()
-    
-    temporal = {"yesterday", "today", "tomorrow", "now", "then", "soon", "later", "already"}
-    locative = {"here", "there", "everywhere", "nowhere", "somewhere", "inside", "outside"}
-    frequency = {"always", "never", "often", "sometimes", "rarely", "usually", "seldom"}
-    degree = {"very", "extremely", "quite", "rather", "somewhat", "too", "enough"}
-    epistemic = {"probably", "possibly", "certainly", "definitely", "maybe", "perhaps"}
-    
-    if adverb_lower in temporal:
-        return AdverbTier.TEMPORAL
-    elif adverb_lower in locative:
-        return AdverbTier.LOCATIVE
-    elif adverb_lower in frequency:
-        return AdverbTier.FREQUENCY
-    elif adverb_lower in degree:
-        return AdverbTier.DEGREE
-    elif adverb_lower in epistemic:
-        return AdverbTier.EPISTEMIC
-    else:
-        return AdverbTier.MANNER  # Default to manner
+    return _ADVERB_TIER.get(adverb.lower(), AdverbTier.MANNER)  # Default to manner
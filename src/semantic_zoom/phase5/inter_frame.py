@@ -7,9 +7,10 @@ Creates links between frames based on:
 """
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
-import uuid
+from functools import lru_cache
+from typing import Iterator, Optional
 
+from semantic_zoom._ids import next_id
 from semantic_zoom.phase3 import DiscourseRelation
 
 # Try to import FrameNet for relation detection
@@ -27,7 +28,7 @@ class LinkType(Enum):
     FRAMENET = auto()   # From FrameNet relations
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameLink:
     """A link between two frames in the semantic graph.
     
@@ -57,7 +58,7 @@ class FrameLink:
 
 def _generate_link_id() -> str:
     """Generate a unique link identifier."""
-    return f"link_{uuid.uuid4().hex[:12]}"
+    return next_id("link_")
 
 
 # Confidence scores for explicit discourse markers
@@ -72,6 +73,10 @@ _MARKER_CONFIDENCE = {
     "furthermore": 0.90,
     "additionally": 0.85,
 }
+# Sentence-initial spellings ("However") hit the table without lower()
+_MARKER_CONFIDENCE.update({
+    marker.capitalize(): confidence for marker, confidence in list(_MARKER_CONFIDENCE.items())
+})
 
 
 def create_explicit_link(
@@ -94,7 +99,9 @@ def create_explicit_link(
         FrameLink with high confidence
     """
     # Get confidence from marker or default to 0.8
-    confidence = _MARKER_CONFIDENCE.get(discourse_marker.lower(), 0.8)
+    confidence = _MARKER_CONFIDENCE.get(discourse_marker)
+    if confidence is None:
+        confidence = _MARKER_CONFIDENCE.get(discourse_marker.lower(), 0.8)
     
     return FrameLink(
         link_id=_generate_link_id(),
@@ -141,6 +148,15 @@ def create_implicit_link(
     )
 
 
+@lru_cache(maxsize=512)
+def _cached_fn_frame(name: str):
+    """Fetch a FrameNet frame by name, caching failed lookups as None."""
+    try:
+        return fn.frame(name)
+    except Exception:
+        return None
+
+
 def detect_frame_relations(
     frame_names: list[str],
     frame_ids: list[str],
@@ -160,51 +176,71 @@ def detect_frame_relations(
     Returns:
         List of FrameLinks for detected relations
     """
-    if not HAS_FRAMENET or len(frame_names) < 2:
-        return []
+    return list(iter_detect_frame_relations(frame_names, frame_ids))
+
+
+def iter_detect_frame_relations(
+    frame_names: list[str],
+    frame_ids: list[str],
+) -> Iterator[FrameLink]:
+    """Detect FrameNet frame-to-frame relations, yielding links as found.
     
-    links = []
+    Streaming form of detect_frame_relations for callers that iterate once.
+    
+    Args:
+        frame_names: List of FrameNet frame names
+        frame_ids: Corresponding frame IDs
+        
+    Yields:
+        FrameLink for each detected relation
+    """
+    if not HAS_FRAMENET or len(frame_names) < 2:
+        return
     
     # Map names to IDs
     name_to_id = dict(zip(frame_names, frame_ids))
+    name_set = set(frame_names)
     
-    # Check each pair of frames
+    # Fetch each distinct frame once, indexing its relation types by related frame name
+    related: dict[str, dict[str, list[str]]] = {}
+    for name in dict.fromkeys(frame_names):
+        frame = _cached_fn_frame(name)
+        if frame is None:
+            # Frame lookup failed
+            continue
+        try:
+            by_other: dict[str, list[str]] = {}
+            for rel in frame.frameRelations:
+                rel_type = rel.type.name
+                endpoints = dict.fromkeys((
+                    getattr(rel, 'superFrameName', None),
+                    getattr(rel, 'subFrameName', None),
+                ))
+                for other in endpoints:
+                    if other in name_set:
+                        by_other.setdefault(other, []).append(rel_type)
+        except Exception:
+            continue
+        related[name] = by_other
+    
+    if not related:
+        return
+    
+    # Check each pair of frames against the index
     for i, name1 in enumerate(frame_names):
-        for j, name2 in enumerate(frame_names):
-            if i >= j:
+        relations1 = related.get(name1)
+        if not relations1:
+            continue
+        for name2 in frame_names[i + 1:]:
+            if name2 not in related:
                 continue
-            
-            try:
-                frame1 = fn.frame(name1)
-                frame2 = fn.frame(name2)
-                
-                # Check frame relations
-                for rel in frame1.frameRelations:
-                    rel_type = rel.type.name
-                    
-                    # Check if related to frame2
-                    if hasattr(rel, 'superFrameName') and rel.superFrameName == name2:
-                        links.append(FrameLink(
-                            link_id=_generate_link_id(),
-                            source_frame_id=name_to_id[name1],
-                            target_frame_id=name_to_id[name2],
-                            relation=DiscourseRelation.SEQUENCE,  # Default
-                            link_type=LinkType.FRAMENET,
-                            confidence=0.8,
-                            framenet_relation=rel_type,
-                        ))
-                    elif hasattr(rel, 'subFrameName') and rel.subFrameName == name2:
-                        links.append(FrameLink(
-                            link_id=_generate_link_id(),
-                            source_frame_id=name_to_id[name1],
-                            target_frame_id=name_to_id[name2],
-                            relation=DiscourseRelation.SEQUENCE,
-                            link_type=LinkType.FRAMENET,
-                            confidence=0.8,
-                            framenet_relation=rel_type,
-                        ))
-            except Exception:
-                # Frame lookup failed
-                continue
-    
-    return links
+            for rel_type in relations1.get(name2, ()):
+                yield FrameLink(
+                    link_id=_generate_link_id(),
+                    source_frame_id=name_to_id[name1],
+                    target_frame_id=name_to_id[name2],
+                    relation=DiscourseRelation.SEQUENCE,  # Default
+                    link_type=LinkType.FRAMENET,
+                    confidence=0.8,
+                    framenet_relation=rel_type,
+                )
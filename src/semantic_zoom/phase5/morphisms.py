@@ -11,10 +11,11 @@ Also handles:
 - Tiered adverb morphisms
 """
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional
-import uuid
+import sys
 
+from semantic_zoom._ids import next_id
 from semantic_zoom.phase3 import (
     CategoricalSymbol,
     PrepositionMapping,
@@ -23,7 +24,7 @@ from semantic_zoom.phase3 import (
 from semantic_zoom.phase5.edges import AdverbTier
 
 
-class AttachmentLevel(Enum):
+class AttachmentLevel(IntEnum):
     """Levels at which morphisms can attach."""
     NODE = auto()        # Modifies a noun node
     EDGE = auto()        # Modifies a verb edge
@@ -31,7 +32,7 @@ class AttachmentLevel(Enum):
     PROPOSITION = auto() # Modifies entire proposition
 
 
-@dataclass
+@dataclass(slots=True)
 class MorphismAttachment:
     """A morphism attached to a graph element.
     
@@ -55,7 +56,7 @@ class MorphismAttachment:
     saturated: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FocusingAdverbAttachment:
     """A focusing adverb scope operator attachment.
     
@@ -78,7 +79,7 @@ class FocusingAdverbAttachment:
     invertible: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AdverbMorphismAttachment:
     """A general adverb morphism at a tier level.
     
@@ -96,7 +97,7 @@ class AdverbMorphismAttachment:
 
 def _generate_attachment_id() -> str:
     """Generate a unique attachment identifier."""
-    return f"attach_{uuid.uuid4().hex[:12]}"
+    return next_id("attach_")
 
 
 def attach_preposition(
@@ -120,7 +121,7 @@ def attach_preposition(
         level=level,
         symbol=prep_mapping.symbol,
         state=prep_mapping.state,
-        original_text=prep_mapping.original,
+        original_text=sys.intern(prep_mapping.original),
         is_dual_citizen=prep_mapping.is_dual_citizen,
         saturated=prep_mapping.saturated,
     )
@@ -150,7 +151,7 @@ def attach_focusing_adverb(
     return FocusingAdverbAttachment(
         attachment_id=_generate_attachment_id(),
         target_id=target_id,
-        adverb=adverb,
+        adverb=sys.intern(adverb),
         scope_start=scope_start,
         scope_end=scope_end,
         invertible=False,  # Always False for focusing adverbs
@@ -175,6 +176,6 @@ def attach_adverb_morphism(
     return AdverbMorphismAttachment(
         attachment_id=_generate_attachment_id(),
         target_id=target_id,
-        adverb=adverb,
+        adverb=sys.intern(adverb),
         tier=tier,
     )
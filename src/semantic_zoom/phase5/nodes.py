@@ -7,37 +7,54 @@ Creates semantic graph nodes from noun phrases with:
 - Proper noun entity types
 """
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Optional
-import uuid
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+import sys
+
+from semantic_zoom._ids import next_id
 
 # Lazy load spacy for text processing
 _nlp = None
 
 
+# Phase 5 reads POS, dependencies, entities and noun chunks, never lemmas
+_DISABLED_PIPES = ["lemmatizer"]
+
+
 def _get_nlp():
     """Lazy load spacy model."""
     global _nlp
     if _nlp is None:
         import spacy
         try:
-            _nlp = spacy.load("en_core_web_sm")
+            _nlp = spacy.load("en_core_web_sm", disable=_DISABLED_PIPES)
         except OSError:
             # Model not installed, try downloading
             import subprocess
             subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-            _nlp = spacy.load("en_core_web_sm")
+            _nlp = spacy.load("en_core_web_sm", disable=_DISABLED_PIPES)
     return _nlp
 
 
-class NodeType(Enum):
+@lru_cache(maxsize=512)
+def _parse_text(text: str):
+    """Parse text with the shared pipeline, memoizing the Doc per string.
+
+    Parsing dominates node and edge creation, so repeated texts reuse
+    the Doc. Callers must treat the returned Doc as read-only.
+    """
+    return _get_nlp()(text)
+
+
+class NodeType(IntEnum):
     """Types of semantic nodes."""
     NOUN = auto()
     PRONOUN = auto()
     PROPER_NOUN = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticNode:
     """A node in the semantic graph representing a noun phrase.
     
@@ -79,7 +96,7 @@ class SemanticNode:
 
 def _generate_node_id() -> str:
     """Generate a unique node identifier."""
-    return f"node_{uuid.uuid4().hex[:12]}"
+    return next_id("node_")
 
 
 def _determine_node_type(pos: str) -> NodeType:
@@ -124,28 +141,64 @@ def create_node(
         text=text,
         span=span,
         node_type=node_type,
-        head=head_text or text,
-        adjective_vector=adjectives or [],
+        # Heads, adjectives and entity labels repeat heavily across a graph
+        head=sys.intern(head_text or text),
+        adjective_vector=[sys.intern(a) for a in adjectives] if adjectives else [],
         attributes=attributes or {},
-        entity_type=entity_type,
+        entity_type=sys.intern(entity_type) if entity_type else entity_type,
         antecedent_id=antecedent_id,
         is_resolved=(antecedent_id is not None) if node_type == NodeType.PRONOUN else False,
     )
 
 
-def create_nodes_from_text(text: str) -> list[SemanticNode]:
+def create_nodes_from_text(text: str, doc=None) -> list[SemanticNode]:
     """Extract all noun nodes from text using NLP.
     
     Args:
         text: Input text to analyze
+        doc: Optional spaCy Doc already parsed from text, to avoid reparsing
         
     Returns:
         List of SemanticNode objects for all noun phrases
     """
+    if doc is None:
+        doc = _parse_text(text)
+    return create_nodes_from_doc(doc)
+
+
+def create_nodes_from_texts(
+    texts: Iterable[str],
+    batch_size: int = 32,
+) -> Iterator[list[SemanticNode]]:
+    """Extract noun nodes from many texts, parsing them in batches.
+    
+    Args:
+        texts: Input texts to analyze
+        batch_size: Number of texts per spaCy batch
+        
+    Yields:
+        List of SemanticNode objects for each text, in input order
+    """
     nlp = _get_nlp()
-    doc = nlp(text)
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        yield create_nodes_from_doc(doc)
+
+
+def create_nodes_from_doc(doc) -> list[SemanticNode]:
+    """Extract all noun nodes from an already-parsed spaCy Doc.
+    
+    Lets callers parse once (e.g. with nlp.pipe over a batch) and share
+    the Doc across phases.
     
+    Args:
+        doc: Parsed spaCy Doc (needs parser and NER annotations)
+        
+    Returns:
+        List of SemanticNode objects for all noun phrases
+    """
     nodes = []
+    # One byte per character of doc.text, set where a noun chunk covers it
+    covered = bytearray(len(doc.text))
     
     # Process noun chunks (noun phrases)
     for chunk in doc.noun_chunks:
@@ -175,16 +228,13 @@ def create_nodes_from_text(text: str) -> list[SemanticNode]:
             entity_type=entity_type,
         )
         nodes.append(node)
+        covered[chunk.start_char:chunk.end_char] = b"\x01" * (chunk.end_char - chunk.start_char)
     
     # Also process standalone pronouns not in chunks
     for token in doc:
         if token.pos_ == "PRON":
             # Check if already covered by a chunk
-            covered = any(
-                node.span[0] <= token.idx < node.span[1]
-                for node in nodes
-            )
-            if not covered:
+            if not covered[token.idx]:
                 node = create_node(
                     text=token.text,
                     span=(token.idx, token.idx + len(token.text)),
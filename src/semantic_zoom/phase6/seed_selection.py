@@ -6,14 +6,30 @@ This module provides seed selection that:
 - Stores multiple seeds with graph node highlighting
 """
 
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
-import uuid
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
+
+from semantic_zoom._ids import next_id
 from semantic_zoom.phase1.dependency_parser import ParsedToken
+from semantic_zoom.phase6.token_table import TokenTable
 
+# Sentence-ending punctuation used for sentence boundary detection
+SENTENCE_END_PUNCT = ('.', '!', '?')
 
-@dataclass
+# Clause-marking dependencies
+CLAUSE_DEPS = frozenset({"ccomp", "xcomp", "advcl", "relcl", "acl", "ROOT"})
+
+
+def _generate_seed_id() -> str:
+    """Generate a unique seed identifier."""
+    return next_id()
+
+
+@dataclass(slots=True)
 class Seed:
     """A seed selection representing a text span for zoom operations.
     
@@ -21,7 +37,7 @@ class Seed:
         id: Unique identifier for this seed
         start_id: First token ID in the selection
         end_id: Last token ID in the selection (inclusive)
-        word_ids: List of all token IDs in the selection
+        word_ids: Contiguous range of all token IDs in the selection
         text: The selected text
         sentence_start_id: Start of containing sentence
         sentence_end_id: End of containing sentence
@@ -30,12 +46,109 @@ class Seed:
     id: str
     start_id: int
     end_id: int
-    word_ids: List[int]
+    word_ids: range
     text: str
     sentence_start_id: Optional[int] = None
     sentence_end_id: Optional[int] = None
     clause_root_id: Optional[int] = None
 
+    @property
+    def word_ids_list(self) -> List[int]:
+        """Get the selected token IDs as a list."""
+        return list(self.word_ids)
+
+
+@dataclass
+class _TokenIndex:
+    """Lookup tables derived once from a token list.
+
+    Attributes:
+        by_id: Token ID to token (first occurrence wins)
+        children: Head token ID to IDs of its dependents
+        table: Columnar view of the token list
+        sentence_breaks: IDs of sentence-ending punctuation tokens, in
+            token-list order (sorted only when ids_ascending)
+        is_dense: Whether tokens[i].id == i for every position
+        ids_ascending: Whether token IDs never decrease along the list
+        clause_roots: Token ID to the root of its containing clause
+    """
+    by_id: Dict[int, ParsedToken]
+    children: Dict[int, List[int]]
+    table: TokenTable
+    sentence_breaks: List[int]
+    is_dense: bool
+    ids_ascending: bool
+    clause_roots: Dict[int, int]
+
+    @classmethod
+    def build(cls, tokens: List[ParsedToken]) -> "_TokenIndex":
+        """Build the index from a token list."""
+        by_id: Dict[int, ParsedToken] = {}
+        children: Dict[int, List[int]] = defaultdict(list)
+        for t in tokens:
+            by_id.setdefault(t.id, t)
+            if t.head_id != t.id:
+                children[t.head_id].append(t.id)
+        table = TokenTable.from_parsed_tokens(tokens)
+        return cls(
+            by_id=by_id,
+            children=dict(children),
+            table=table,
+            sentence_breaks=table.ids[
+                np.isin(table.texts, SENTENCE_END_PUNCT)
+            ].tolist(),
+            is_dense=bool(np.array_equal(table.ids, np.arange(len(tokens)))),
+            ids_ascending=bool(np.all(table.ids[1:] >= table.ids[:-1])),
+            clause_roots=_build_clause_roots(by_id),
+        )
+
+
+def _build_clause_roots(by_id: Dict[int, ParsedToken]) -> Dict[int, int]:
+    """Resolve every token's clause root, sharing work along head chains.
+
+    Each walk stops at a clause-marking token, a root, or a token whose
+    head is unknown, and stops early at any token already resolved; every
+    token on the walked path gets the same answer. Paths that run into a
+    head cycle depend on where the walk started, so they are left out
+    and resolved on demand.
+
+    Args:
+        by_id: Token ID to token
+
+    Returns:
+        Token ID to clause root token ID
+    """
+    roots: Dict[int, int] = {}
+    for token_id, token in by_id.items():
+        if token_id in roots:
+            continue
+        path: List[int] = []
+        on_path: Set[int] = set()
+        current = token
+        answer: Optional[int] = None
+        while True:
+            if current.id in roots:
+                answer = roots[current.id]
+                break
+            path.append(current.id)
+            on_path.add(current.id)
+            head_id = current.head_id
+            if (
+                current.dep in CLAUSE_DEPS
+                or head_id < 0
+                or head_id == current.id
+                or head_id not in by_id
+            ):
+                answer = current.id
+                break
+            if head_id in on_path:
+                break
+            current = by_id[head_id]
+        if answer is not None:
+            for path_id in path:
+                roots[path_id] = answer
+    return roots
+
 
 class SeedSelector:
     """Manages seed selections for semantic zoom operations.
@@ -49,12 +162,22 @@ class SeedSelector:
     
     def __init__(self):
         """Initialize seed selector."""
-        self._seeds: List[Seed] = []
+        # Seeds by ID, in insertion order
+        self._seeds: Dict[str, Seed] = {}
+        # Immutable snapshot of _seeds, rebuilt on first read after a change
+        self._seeds_view: Optional[Tuple[Seed, ...]] = None
+        # Index for the most recently seen token list. The list itself is
+        # held so identity comparison stays valid; lists mutated in place
+        # after a selection are not detected.
+        self._indexed_tokens: Optional[List[ParsedToken]] = None
+        self._index: Optional[_TokenIndex] = None
     
     @property
-    def seeds(self) -> List[Seed]:
-        """Get all stored seeds."""
-        return self._seeds.copy()
+    def seeds(self) -> Tuple[Seed, ...]:
+        """Get all stored seeds as a read-only snapshot."""
+        if self._seeds_view is None:
+            self._seeds_view = tuple(self._seeds.values())
+        return self._seeds_view
     
     def select_range(
         self, 
@@ -72,9 +195,15 @@ class SeedSelector:
         Returns:
             Seed object representing the selection
         """
-        # Get tokens in range
-        word_ids = list(range(start_id, end_id + 1))
-        selected_tokens = [t for t in tokens if t.id in word_ids]
+        index = self._get_index(tokens)
+
+        # Get tokens in range; Phase 1 IDs are list positions, so the
+        # range is a plain slice unless the list has been reordered
+        word_ids = range(start_id, end_id + 1)
+        if index.is_dense:
+            selected_tokens = tokens[max(start_id, 0):max(end_id + 1, 0)]
+        else:
+            selected_tokens = [index.by_id[i] for i in word_ids if i in index.by_id]
         
         # Build text from selected tokens
         text = self._build_text(selected_tokens)
@@ -86,7 +215,7 @@ class SeedSelector:
         clause_root = self._find_clause_root(tokens, start_id)
         
         return Seed(
-            id=str(uuid.uuid4())[:8],
+            id=_generate_seed_id(),
             start_id=start_id,
             end_id=end_id,
             word_ids=word_ids,
@@ -112,18 +241,17 @@ class SeedSelector:
         Returns:
             Seed object representing the selection
         """
-        # Find tokens that overlap with the character range
-        start_id = None
-        end_id = None
-        
-        for t in tokens:
-            # Token overlaps if it starts before end and ends after start
-            if t.start_char < end_char and t.end_char > start_char:
-                if start_id is None:
-                    start_id = t.id
-                end_id = t.id
-        
-        if start_id is None:
+        table = self._get_index(tokens).table
+
+        # Token overlaps if it starts before end and ends after start
+        overlapping = np.flatnonzero(
+            (table.start_chars < end_char) & (table.end_chars > start_char)
+        )
+
+        if overlapping.size:
+            start_id = int(table.ids[overlapping[0]])
+            end_id = int(table.ids[overlapping[-1]])
+        else:
             start_id = 0
             end_id = 0
         
@@ -132,10 +260,13 @@ class SeedSelector:
     def add_seed(self, seed: Seed) -> None:
         """Add a seed to the stored seeds.
         
+        Adding a seed whose ID is already stored replaces that seed.
+        
         Args:
             seed: Seed to add
         """
-        self._seeds.append(seed)
+        self._seeds[seed.id] = seed
+        self._seeds_view = None
     
     def remove_seed(self, seed_id: str) -> bool:
         """Remove a seed by ID.
@@ -146,15 +277,15 @@ class SeedSelector:
         Returns:
             True if seed was found and removed
         """
-        for i, s in enumerate(self._seeds):
-            if s.id == seed_id:
-                self._seeds.pop(i)
-                return True
-        return False
+        if self._seeds.pop(seed_id, None) is None:
+            return False
+        self._seeds_view = None
+        return True
     
     def clear_seeds(self) -> None:
         """Remove all stored seeds."""
         self._seeds.clear()
+        self._seeds_view = None
     
     def get_all_seed_word_ids(self) -> Set[int]:
         """Get union of all word IDs from all seeds.
@@ -163,7 +294,7 @@ class SeedSelector:
             Set of all word IDs covered by any seed
         """
         all_ids: Set[int] = set()
-        for seed in self._seeds:
+        for seed in self._seeds.values():
             all_ids.update(seed.word_ids)
         return all_ids
     
@@ -182,16 +313,30 @@ class SeedSelector:
             List of token IDs in the containing clause
         """
         if seed.clause_root_id is None:
-            return seed.word_ids
+            return seed.word_ids_list
         
         # Get subtree of clause root
         return self._get_subtree_ids(tokens, seed.clause_root_id)
     
+    def _get_index(self, tokens: List[ParsedToken]) -> _TokenIndex:
+        """Get the lookup index for a token list, rebuilding on a new list.
+
+        Args:
+            tokens: Parsed tokens from the document
+
+        Returns:
+            Index over the given tokens
+        """
+        if tokens is not self._indexed_tokens or self._index is None:
+            self._index = _TokenIndex.build(tokens)
+            self._indexed_tokens = tokens
+        return self._index
+
     def _build_text(self, tokens: List[ParsedToken]) -> str:
         """Build text string from tokens.
         
         Args:
-            tokens: Tokens to build text from
+            tokens: Tokens to build text from, in ID order
             
         Returns:
             Reconstructed text
@@ -199,12 +344,10 @@ class SeedSelector:
         if not tokens:
             return ""
         
-        tokens = sorted(tokens, key=lambda t: t.id)
-        parts = []
-        for i, t in enumerate(tokens):
-            parts.append(t.text)
-            if i < len(tokens) - 1:
-                parts.append(t.whitespace_after)
+        # Interleave texts with the whitespace between them
+        parts = [""] * (2 * len(tokens) - 1)
+        parts[0::2] = [t.text for t in tokens]
+        parts[1::2] = [t.whitespace_after for t in tokens[:-1]]
         
         return "".join(parts)
     
@@ -224,20 +367,48 @@ class SeedSelector:
         Returns:
             Tuple of (start_id, end_id) for the sentence
         """
-        sentence_end_punct = {'.', '!', '?'}
+        index = self._get_index(tokens)
+        if not index.ids_ascending:
+            return self._scan_sentence_bounds(tokens, token_id)
+        breaks = index.sentence_breaks
+
+        # Breaks before the token close earlier sentences; the first break
+        # at or after it closes this one.
+        i = bisect_left(breaks, token_id)
+        start_id = breaks[i - 1] + 1 if i else 0
+        end_id = breaks[i] if i < len(breaks) else len(tokens) - 1
         
+        return start_id, end_id
+    
+    def _scan_sentence_bounds(
+        self, 
+        tokens: List[ParsedToken], 
+        token_id: int
+    ) -> tuple[Optional[int], Optional[int]]:
+        """Find sentence boundaries by walking tokens in list order.
+        
+        Used when token IDs are out of order, where the sorted-break
+        bisection in _find_sentence_bounds does not apply.
+        
+        Args:
+            tokens: All tokens in document
+            token_id: Token ID to find sentence for
+            
+        Returns:
+            Tuple of (start_id, end_id) for the sentence
+        """
         # Find sentence start (after previous sentence-ending punct)
         start_id = 0
         for t in tokens:
             if t.id >= token_id:
                 break
-            if t.text in sentence_end_punct:
+            if t.text in SENTENCE_END_PUNCT:
                 start_id = t.id + 1
         
         # Find sentence end (next sentence-ending punct)
         end_id = len(tokens) - 1
         for t in tokens:
-            if t.id >= token_id and t.text in sentence_end_punct:
+            if t.id >= token_id and t.text in SENTENCE_END_PUNCT:
                 end_id = t.id
                 break
         
@@ -259,23 +430,27 @@ class SeedSelector:
         Returns:
             ID of clause root token
         """
-        token = next((t for t in tokens if t.id == token_id), None)
+        index = self._get_index(tokens)
+        root = index.clause_roots.get(token_id)
+        if root is not None:
+            return root
+        
+        by_id = index.by_id
+        token = by_id.get(token_id)
         if token is None:
             return None
         
-        # Clause-marking dependencies
-        clause_deps = {"ccomp", "xcomp", "advcl", "relcl", "acl", "ROOT"}
-        
+        # Only tokens whose head chain reaches a cycle get here.
         # Walk up to find clause root
         current = token
         visited = {current.id}
         
         while current.head_id >= 0 and current.head_id not in visited:
-            if current.dep in clause_deps or current.dep == "ROOT":
+            if current.dep in CLAUSE_DEPS:
                 return current.id
             
             visited.add(current.head_id)
-            head = next((t for t in tokens if t.id == current.head_id), None)
+            head = by_id.get(current.head_id)
             if head is None:
                 break
             current = head
@@ -293,8 +468,14 @@ class SeedSelector:
         Returns:
             List of token IDs in subtree
         """
+        children = self._get_index(tokens).children
         ids = [root_id]
-        for t in tokens:
-            if t.head_id == root_id and t.id != root_id:
-                ids.extend(self._get_subtree_ids(tokens, t.id))
+        seen = {root_id}
+        stack = [root_id]
+        while stack:
+            for child_id in children.get(stack.pop(), ()):
+                if child_id not in seen:
+                    seen.add(child_id)
+                    ids.append(child_id)
+                    stack.append(child_id)
         return sorted(ids)
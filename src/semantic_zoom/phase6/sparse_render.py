@@ -8,30 +8,71 @@ This module provides sparse rendering that:
 """
 
 from dataclasses import dataclass
+from operator import add
 from typing import List, Set, Optional
 
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from semantic_zoom.phase1.dependency_parser import ParsedToken
 from semantic_zoom.phase6.subgraph_extraction import SubgraphResult
+from semantic_zoom.phase6.token_table import TokenTable
 
 
 # Common pronouns for preservation
-PRONOUNS = {
+PRONOUNS = frozenset({
     # Subject pronouns
     "i", "you", "he", "she", "it", "we", "they",
     # Object pronouns
     "me", "him", "her", "us", "them",
     # Possessive pronouns
-    "my", "your", "his", "her", "its", "our", "their",
+    "my", "your", "his", "its", "our", "their",
     "mine", "yours", "hers", "ours", "theirs",
     # Reflexive pronouns
     "myself", "yourself", "himself", "herself", "itself", "ourselves", "themselves",
     # Demonstrative pronouns
     "this", "that", "these", "those",
-    # Relative pronouns
-    "who", "whom", "whose", "which", "that",
-    # Interrogative pronouns
-    "what", "who", "whom", "whose", "which",
-}
+    # Relative and interrogative pronouns
+    "who", "whom", "whose", "which", "what",
+})
+
+# Longer tokens cannot be pronouns, so they skip lowercasing
+_MAX_PRONOUN_LEN = max(map(len, PRONOUNS))
+
+
+def _count_gaps_numpy(token_ids: np.ndarray, included_sorted: np.ndarray) -> int:
+    """Count maximal runs of token IDs absent from a sorted ID array."""
+    if not len(token_ids):
+        return 0
+    keep = np.isin(token_ids, included_sorted)
+    return int(not keep[0]) + int(np.count_nonzero(keep[:-1] & ~keep[1:]))
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _count_gaps(token_ids, included_sorted):  # pragma: no cover - compiled
+        """Count maximal runs of token IDs absent from a sorted ID array."""
+        gaps = 0
+        in_gap = False
+        m = len(included_sorted)
+        for tid in token_ids:
+            j = np.searchsorted(included_sorted, tid)
+            if j < m and included_sorted[j] == tid:
+                if in_gap:
+                    gaps += 1
+                    in_gap = False
+            else:
+                in_gap = True
+        if in_gap:
+            gaps += 1
+        return gaps
+else:
+    _count_gaps = _count_gaps_numpy
 
 
 class SparseRenderer:
@@ -50,6 +91,9 @@ class SparseRenderer:
             placeholder: String to use for indicating omitted content
         """
         self.placeholder = placeholder
+        # Columnar view of the most recently rendered token list
+        self._table_tokens: Optional[List[ParsedToken]] = None
+        self._table: Optional[TokenTable] = None
 
     def render(
         self,
@@ -67,7 +111,7 @@ class SparseRenderer:
         Returns:
             Rendered string with placeholders for gaps
         """
-        if not result.word_ids:
+        if not result.word_ids or not tokens:
             return ""
 
         # Get IDs to include
@@ -78,40 +122,73 @@ class SparseRenderer:
             pronoun_ids = self.find_pronouns(tokens)
             include_ids.update(pronoun_ids)
 
+        table = self._get_table(tokens)
+        keep = np.isin(
+            table.ids,
+            np.fromiter(include_ids, dtype=np.int64, count=len(include_ids)),
+        )
+        return self._render_mask(table, keep)
+
+    def _render_mask(self, table: TokenTable, keep: np.ndarray) -> str:
+        """Render table rows, replacing each run of unkept rows with a placeholder.
+
+        Args:
+            table: Columnar view of the document tokens
+            keep: Boolean mask, one entry per row of table
+
+        Returns:
+            Rendered string with placeholders for gaps
+        """
+        if not len(keep):
+            return ""
+
+        # Split the mask into alternating kept/gap runs; only run
+        # boundaries are visited in Python.
+        n = len(keep)
+        boundaries = [0, *(np.flatnonzero(np.diff(keep.view(np.int8))) + 1).tolist(), n]
+
         # Build rendered output
+        texts = table.texts
+        whitespace = table.whitespace_after
         parts: List[str] = []
         in_gap = False
+        has_kept = False
 
-        for token in tokens:
-            if token.id in include_ids:
-                # End any gap
-                if in_gap:
-                    parts.append(self.placeholder)
-                    parts.append(" ")
-                    in_gap = False
-
-                # Add token text
-                parts.append(token.text)
-                parts.append(token.whitespace_after)
-            else:
-                # Start or continue gap
+        for start, stop in zip(boundaries, boundaries[1:]):
+            if not keep[start]:
                 in_gap = True
+                continue
+            has_kept = True
+            run = "".join(map(add, texts[start:stop], whitespace[start:stop]))
+            # A run that renders nothing would leave two placeholders
+            # side by side, so the gaps around it merge into one
+            if not run:
+                continue
+            if in_gap:
+                parts.append(self.placeholder)
+                parts.append(" ")
+                in_gap = False
+            parts.append(run)
 
         # Handle trailing gap
-        if in_gap and parts:
+        if in_gap and has_kept:
             parts.append(self.placeholder)
 
-        # Clean up result
-        rendered = "".join(parts).strip()
+        return "".join(parts).strip()
+
+    def _get_table(self, tokens: List[ParsedToken]) -> TokenTable:
+        """Get the columnar view of a token list, rebuilding on a new list.
 
-        # Remove duplicate placeholders
-        while f"{self.placeholder} {self.placeholder}" in rendered:
-            rendered = rendered.replace(
-                f"{self.placeholder} {self.placeholder}",
-                self.placeholder
-            )
+        Args:
+            tokens: Parsed tokens
 
-        return rendered
+        Returns:
+            TokenTable over the given tokens
+        """
+        if tokens is not self._table_tokens or self._table is None:
+            self._table = TokenTable.from_parsed_tokens(tokens)
+            self._table_tokens = tokens
+        return self._table
 
     def find_pronouns(self, tokens: List[ParsedToken]) -> Set[int]:
         """Find all pronoun token IDs in the document.
@@ -129,7 +206,10 @@ class SparseRenderer:
             if token.pos == "PRON":
                 pronoun_ids.add(token.id)
             # Also check text against common pronouns
-            elif token.text.lower() in PRONOUNS:
+            elif (
+                len(token.text) <= _MAX_PRONOUN_LEN
+                and token.text.lower() in PRONOUNS
+            ):
                 pronoun_ids.add(token.id)
 
         return pronoun_ids
@@ -150,25 +230,20 @@ class SparseRenderer:
         Returns:
             Rendered string with expanded context
         """
-        if not result.word_ids:
+        if not result.word_ids or not tokens or context_window < 0:
             return ""
 
-        # Expand IDs by context window
-        expanded_ids: Set[int] = set()
-        for word_id in result.word_ids:
-            for offset in range(-context_window, context_window + 1):
-                new_id = word_id + offset
-                if 0 <= new_id < len(tokens):
-                    expanded_ids.add(new_id)
-
-        # Create modified result
-        expanded_result = SubgraphResult(
-            word_ids=sorted(expanded_ids),
-            zoom_level=result.zoom_level,
-            seed_ids=result.seed_ids
-        )
+        # Dilate the subgraph IDs by the window over IDs 0..n-1: each ID
+        # opens a covered interval and a prefix sum marks the union.
+        n = len(tokens)
+        word_ids = np.asarray(result.word_ids, dtype=np.int64)
+        starts = np.clip(word_ids - context_window, 0, n)
+        stops = np.clip(word_ids + context_window + 1, 0, n)
+        delta = np.bincount(starts, minlength=n + 1) - np.bincount(stops, minlength=n + 1)
+        expanded_ids = np.flatnonzero(np.cumsum(delta[:n]) > 0)
 
-        return self.render(tokens, expanded_result)
+        table = self._get_table(tokens)
+        return self._render_mask(table, np.isin(table.ids, expanded_ids))
 
     def get_coverage_stats(
         self,
@@ -188,17 +263,8 @@ class SparseRenderer:
         included_tokens = len(result.word_ids)
 
         # Count gaps
-        gaps = 0
-        in_gap = False
-        for token in tokens:
-            if token.id in result.word_ids:
-                if in_gap:
-                    gaps += 1
-                    in_gap = False
-            else:
-                in_gap = True
-        if in_gap:
-            gaps += 1
+        included_sorted = np.unique(np.asarray(result.word_ids, dtype=np.int64))
+        gaps = int(_count_gaps(self._get_table(tokens).ids, included_sorted))
 
         return {
             "total_tokens": total_tokens,
@@ -8,29 +8,295 @@ This module provides subgraph extraction that:
 - Optionally skips copulas/auxiliaries for semantic focus
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Set
+from itertools import chain
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 from semantic_zoom.phase1.dependency_parser import ParsedToken
 from semantic_zoom.phase6.seed_selection import Seed
+from semantic_zoom.phase6.token_table import TokenTable
 
 
 # Copular/auxiliary verbs to optionally skip during expansion
-COPULA_LEMMAS = {"be", "is", "am", "are", "was", "were", "been", "being"}
+COPULA_LEMMAS: FrozenSet[str] = frozenset(
+    {"be", "is", "am", "are", "was", "were", "been", "being"}
+)
 
+# Extractions remembered per token list
+_RESULT_CACHE_SIZE = 256
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SubgraphResult:
     """Result of subgraph extraction.
-    
+
+    Results are immutable so they can be hashed and shared from the cache;
+    sequence fields given as lists are stored as tuples.
+
     Attributes:
-        word_ids: List of token IDs in the extracted subgraph
+        word_ids: Sorted token IDs in the extracted subgraph
         zoom_level: The zoom level used for extraction
         seed_ids: IDs of the seeds used for extraction
     """
-    word_ids: List[int]
+    word_ids: Tuple[int, ...]
     zoom_level: int
-    seed_ids: List[str]
+    seed_ids: Tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "word_ids", tuple(self.word_ids))
+        object.__setattr__(self, "seed_ids", tuple(self.seed_ids))
+
+
+@dataclass(frozen=True)
+class _CSRAdjacency:
+    """Compressed sparse row adjacency over token IDs 0..N-1.
+
+    Every neighbor ID is within 0..N-1 (enforced by _csr_from_edges), so
+    traversals index rows directly without bounds checks.
+
+    Attributes:
+        indptr: Row offsets; neighbors of token i are
+            indices[indptr[i]:indptr[i + 1]]
+        indices: Concatenated, per-row sorted neighbor token IDs
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+
+def _csr_from_edges(
+    sources: np.ndarray,
+    targets: np.ndarray,
+    n: int
+) -> _CSRAdjacency:
+    """Build a deduplicated CSR adjacency from directed edge arrays.
+
+    Edges with an endpoint outside 0..n-1 are dropped.
+
+    Args:
+        sources: Edge source IDs
+        targets: Edge target IDs
+        n: Number of nodes
+
+    Returns:
+        CSR adjacency with sorted, unique neighbors per row
+    """
+    valid = (sources >= 0) & (sources < n) & (targets >= 0) & (targets < n)
+    keys = np.unique(sources[valid] * n + targets[valid])
+    rows = keys // n if n else keys
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    indices = (keys - rows * n).astype(np.int32)
+    return _CSRAdjacency(indptr=indptr, indices=indices)
+
+
+def _gather_neighbors(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Gather the CSR neighbors of several rows at once.
+
+    The CSR segments of the rows are laid end to end with a ramp, so the
+    gather is a handful of array operations rather than a loop per edge.
+
+    Args:
+        indptr: CSR row offsets
+        indices: CSR neighbor IDs
+        rows: Rows whose neighbors to gather
+
+    Returns:
+        Tuple of (concatenated neighbor IDs, neighbor count per row)
+    """
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    # Position k of segment j maps to starts[j] + k
+    ramp = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return indices[np.repeat(starts, lengths) + ramp], lengths
+
+
+def _bfs_n_hops_numpy(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    seed_rows: np.ndarray,
+    n_hops: int,
+    visited: np.ndarray
+) -> None:
+    """Mark every row within n_hops of the seed rows in visited.
+
+    Each hop gathers all neighbors of the frontier at once. Repeated
+    neighbors are dropped through a slot buffer allocated once per call
+    rather than by sorting each frontier.
+
+    Args:
+        indptr: CSR row offsets
+        indices: CSR neighbor IDs
+        seed_rows: Starting rows
+        n_hops: Number of hops to expand
+        visited: Boolean mask, updated in place
+    """
+    # slot[v] holds the last frontier position that wrote v; only that
+    # position keeps v, so each row enters the next frontier once
+    slot = np.empty(len(visited), dtype=np.intp)
+    n_unvisited = len(visited) - int(np.count_nonzero(visited))
+
+    def mark_new(rows: np.ndarray) -> np.ndarray:
+        """Mark the distinct unvisited rows and return them."""
+        candidates = rows[~visited[rows]]
+        positions = np.arange(candidates.size)
+        slot[candidates] = positions
+        fresh = candidates[slot[candidates] == positions]
+        visited[fresh] = True
+        return fresh
+
+    # Seeds are always covered, as in the compiled kernel, even for n_hops < 1
+    frontier = mark_new(seed_rows)
+    n_unvisited -= frontier.size
+
+    for _ in range(n_hops):
+        # Stop once every row is covered
+        if not frontier.size or not n_unvisited:
+            break
+        neighbors, _ = _gather_neighbors(indptr, indices, frontier)
+        frontier = mark_new(neighbors)
+        n_unvisited -= frontier.size
+
+
+if HAS_NUMBA:
+    @njit(
+        "void(int32[:], int32[:], int32[:], int64, boolean[:])",
+        cache=True,
+        boundscheck=False,
+    )
+    def _bfs_n_hops(indptr, indices, seed_rows, n_hops, visited):  # pragma: no cover - compiled
+        """Mark every row within n_hops of the seed rows in visited.
+
+        Frontiers ping-pong between two preallocated buffers, so the hop
+        loop does no allocation.
+        """
+        n = len(visited)
+        current = np.empty(n, np.int32)
+        following = np.empty(n, np.int32)
+        n_unvisited = n
+        for v in range(n):
+            if visited[v]:
+                n_unvisited -= 1
+        n_current = 0
+        for v in seed_rows:
+            if not visited[v]:
+                visited[v] = True
+                current[n_current] = v
+                n_current += 1
+        n_unvisited -= n_current
+
+        for _ in range(n_hops):
+            # Stop once every row is covered
+            if n_unvisited == 0:
+                break
+            n_next = 0
+            for i in range(n_current):
+                v = current[i]
+                for k in range(indptr[v], indptr[v + 1]):
+                    u = indices[k]
+                    if not visited[u]:
+                        visited[u] = True
+                        following[n_next] = u
+                        n_next += 1
+            if n_next == 0:
+                break
+            n_unvisited -= n_next
+            current, following = following, current
+            n_current = n_next
+else:
+    _bfs_n_hops = _bfs_n_hops_numpy
+
+
+def _tagged_bfs_n_hops(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    tags: np.ndarray,
+    n_hops: int
+) -> None:
+    """Run up to 64 N-hop expansions in one multi-source traversal.
+
+    Bit i of tags[v] records that expansion i has reached row v. Each hop
+    pushes only the bits a row gained on the previous hop, so every
+    expansion still stops at exactly n_hops.
+
+    Args:
+        indptr: CSR row offsets
+        indices: CSR neighbor IDs
+        tags: uint64 bitmask per row, seeded with each expansion's
+            starting rows and updated in place
+        n_hops: Number of hops to expand
+    """
+    fresh = tags.copy()
+    frontier = np.flatnonzero(fresh)
+    # Scratch for the bits arriving at each row, zeroed again after use
+    incoming = np.zeros_like(tags)
+
+    for _ in range(n_hops):
+        neighbors, lengths = _gather_neighbors(indptr, indices, frontier)
+        if not neighbors.size:
+            break
+        np.bitwise_or.at(incoming, neighbors, np.repeat(fresh[frontier], lengths))
+        fresh = incoming & ~tags
+        incoming[neighbors] = 0
+        frontier = np.flatnonzero(fresh)
+        if not frontier.size:
+            break
+        tags |= fresh
+
+
+def _contract_transparent(
+    raw: _CSRAdjacency,
+    transparent_ids: FrozenSet[int]
+) -> _CSRAdjacency:
+    """Derive an adjacency that steps through transparent tokens.
+
+    Every non-transparent token is additionally linked to the
+    non-transparent neighbors of each transparent token it touches, so
+    dependents of a copula reach each other in one hop. Transparent rows
+    keep their raw edges and can still be traversed.
+
+    Args:
+        raw: Dependency adjacency with no transparent tokens
+        transparent_ids: Token IDs to treat as transparent
+
+    Returns:
+        Contracted CSR adjacency over the same token IDs
+    """
+    n = raw.num_nodes
+    is_transparent = np.zeros(n, dtype=np.bool_)
+    is_transparent[[i for i in transparent_ids if 0 <= i < n]] = True
+
+    rows = np.repeat(np.arange(n), np.diff(raw.indptr))
+    through = ~is_transparent[rows] & is_transparent[raw.indices]
+    sources = rows[through]
+    neighbors, lengths = _gather_neighbors(
+        raw.indptr, raw.indices, raw.indices[through]
+    )
+    sources = np.repeat(sources, lengths)
+    keep = (neighbors != sources) & ~is_transparent[neighbors]
+
+    return _csr_from_edges(
+        np.concatenate([rows, sources[keep]]),
+        np.concatenate([raw.indices, neighbors[keep]]),
+        n,
+    )
 
 
 class SubgraphExtractor:
@@ -53,6 +319,17 @@ class SubgraphExtractor:
                 Default False for backward compatibility.
         """
         self.skip_copulas = skip_copulas
+        # Derived structures for the most recently seen token list: copula
+        # IDs, a columnar view, and adjacency keyed by transparent ID set.
+        # The list itself is held so identity comparison stays valid.
+        self._cached_tokens: Optional[List[ParsedToken]] = None
+        self._copula_ids: Optional[FrozenSet[int]] = None
+        self._table: Optional[TokenTable] = None
+        self._adjacency_cache: Dict[FrozenSet[int], _CSRAdjacency] = {}
+        # LRU of extracted word IDs keyed by (seed word IDs, zoom, skip)
+        self._result_cache: Dict[Tuple[FrozenSet[int], int, bool], Tuple[int, ...]] = (
+            OrderedDict()
+        )
 
     def extract(
         self,
@@ -75,44 +352,210 @@ class SubgraphExtractor:
         """
         if not seeds:
             return SubgraphResult(
-                word_ids=[],
+                word_ids=(),
                 zoom_level=zoom_level,
-                seed_ids=[]
+                seed_ids=()
             )
 
         # Resolve skip_copulas setting
         should_skip = skip_copulas if skip_copulas is not None else self.skip_copulas
 
-        # Identify copula tokens for filtering
-        copula_ids = self._find_copula_ids(tokens) if should_skip else set()
-
         # Collect all seed word IDs as starting points
-        seed_word_ids: Set[int] = set()
-        for seed in seeds:
-            seed_word_ids.update(seed.word_ids)
-
-        # Build adjacency map for efficient traversal
-        adjacency = self._build_adjacency(tokens, copula_ids if should_skip else set())
-
-        # Expand from seeds by zoom_level hops
-        expanded_ids = self._expand_n_hops(
-            seed_word_ids,
-            adjacency,
-            zoom_level,
-            len(tokens)
+        seed_word_ids = np.fromiter(
+            (i for seed in seeds for i in seed.word_ids), dtype=np.int64
         )
 
-        # Remove copulas from result if skipping
-        if should_skip:
-            expanded_ids = expanded_ids - copula_ids
+        # Repeated extractions over the same token list are served from
+        # the LRU; the result depends only on the set of seed word IDs, and
+        # the cached tuple is shared since results are immutable
+        self._sync_token_cache(tokens)
+        key = (frozenset(seed_word_ids.tolist()), zoom_level, should_skip)
+        word_ids = self._result_cache.get(key)
+        if word_ids is None:
+            word_ids = tuple(
+                self._extract_word_ids(tokens, seed_word_ids, zoom_level, should_skip)
+            )
+            self._result_cache[key] = word_ids
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        else:
+            self._result_cache.move_to_end(key)
 
         return SubgraphResult(
-            word_ids=sorted(expanded_ids),
+            word_ids=word_ids,
             zoom_level=zoom_level,
-            seed_ids=[s.id for s in seeds]
+            seed_ids=tuple(s.id for s in seeds)
         )
 
-    def _find_copula_ids(self, tokens: List[ParsedToken]) -> Set[int]:
+    def _extract_word_ids(
+        self,
+        tokens: List[ParsedToken],
+        seed_word_ids: np.ndarray,
+        zoom_level: int,
+        should_skip: bool
+    ) -> List[int]:
+        """Compute the word IDs of a subgraph without consulting the LRU.
+
+        Args:
+            tokens: Parsed tokens from the document
+            seed_word_ids: Word IDs of all seeds
+            zoom_level: Number of hops from seeds
+            should_skip: Whether copulas are transparent
+
+        Returns:
+            Sorted word IDs covering the subgraph
+        """
+        # Identify copula tokens for filtering
+        copula_ids = self._find_copula_ids(tokens) if should_skip else frozenset()
+
+        n = len(tokens)
+        in_range = (seed_word_ids >= 0) & (seed_word_ids < n)
+        seed_rows = seed_word_ids[in_range].astype(np.int32)
+
+        if (
+            zoom_level == 1
+            and not copula_ids
+            and frozenset() not in self._adjacency_cache
+        ):
+            # A single hop only needs the seeds' neighbours, not the
+            # adjacency for every token
+            visited = self._direct_neighbors(tokens, seed_rows)
+        else:
+            # Get (cached) adjacency for efficient traversal
+            adjacency = self._get_adjacency(tokens, copula_ids)
+
+            # Expand from seeds by zoom_level hops
+            visited = self._expand_n_hops(seed_rows, adjacency, zoom_level)
+
+        return self._collect_word_ids(visited, seed_word_ids[~in_range], copula_ids)
+
+    def extract_batch(
+        self,
+        tokens: List[ParsedToken],
+        seeds_list: List[List[Seed]],
+        zoom_level: int = 1,
+        skip_copulas: Optional[bool] = None
+    ) -> List[SubgraphResult]:
+        """Extract one subgraph per seed list in shared traversals.
+
+        Equivalent to calling extract() once per entry of seeds_list, but
+        up to 64 seed lists are expanded together in a single BFS over the
+        adjacency, each tagged with its own bit.
+
+        Args:
+            tokens: Parsed tokens from the document
+            seeds_list: Seed lists, one per requested subgraph
+            zoom_level: Number of hops from seeds (1 = direct only)
+            skip_copulas: Override instance setting for these extractions.
+                If None, uses instance default.
+
+        Returns:
+            One SubgraphResult per seed list, in the same order
+        """
+        should_skip = skip_copulas if skip_copulas is not None else self.skip_copulas
+        copula_ids = self._find_copula_ids(tokens) if should_skip else frozenset()
+        adjacency = self._get_adjacency(tokens, copula_ids)
+        n = adjacency.num_nodes
+
+        results: List[SubgraphResult] = []
+        for batch_start in range(0, len(seeds_list), 64):
+            batch = seeds_list[batch_start:batch_start + 64]
+            tags = np.zeros(n, dtype=np.uint64)
+            seed_word_ids = []
+            for bit, seeds in enumerate(batch):
+                ids = np.fromiter(
+                    (i for seed in seeds for i in seed.word_ids), dtype=np.int64
+                )
+                seed_word_ids.append(ids)
+                tags[ids[(ids >= 0) & (ids < n)]] |= np.uint64(1 << bit)
+
+            _tagged_bfs_n_hops(adjacency.indptr, adjacency.indices, tags, zoom_level)
+
+            for bit, (seeds, ids) in enumerate(zip(batch, seed_word_ids)):
+                if not seeds:
+                    results.append(
+                        SubgraphResult(word_ids=(), zoom_level=zoom_level, seed_ids=())
+                    )
+                    continue
+                visited = (tags & np.uint64(1 << bit)).astype(np.bool_)
+                results.append(SubgraphResult(
+                    word_ids=self._collect_word_ids(
+                        visited, ids[(ids < 0) | (ids >= n)], copula_ids
+                    ),
+                    zoom_level=zoom_level,
+                    seed_ids=tuple(s.id for s in seeds)
+                ))
+        return results
+
+    def _collect_word_ids(
+        self,
+        visited: np.ndarray,
+        outside_seed_ids: np.ndarray,
+        copula_ids: FrozenSet[int]
+    ) -> List[int]:
+        """Turn a visited mask into the sorted word IDs of a result.
+
+        Args:
+            visited: Boolean mask over token IDs; modified in place
+            outside_seed_ids: Seed IDs with no token row
+            copula_ids: Copula IDs to leave out of the result
+
+        Returns:
+            Sorted word IDs
+        """
+        n = len(visited)
+
+        # Remove copulas from result if skipping
+        if copula_ids:
+            visited[[i for i in copula_ids if 0 <= i < n]] = False
+
+        # Seed IDs with no token row are kept as-is, around the token rows
+        word_ids = np.flatnonzero(visited).tolist()
+        if outside_seed_ids.size:
+            extra = set(outside_seed_ids.tolist()) - copula_ids
+            word_ids = (
+                sorted(i for i in extra if i < 0)
+                + word_ids
+                + sorted(i for i in extra if i >= n)
+            )
+        return word_ids
+
+    def _direct_neighbors(
+        self,
+        tokens: List[ParsedToken],
+        seed_rows: np.ndarray
+    ) -> np.ndarray:
+        """Mark seeds and their direct neighbours without building adjacency.
+
+        Visits the same one-hop neighbourhood as the full adjacency with no
+        transparent tokens: heads and children of each seed, plus tokens that
+        name a seed as head or child.
+
+        Args:
+            tokens: Parsed tokens
+            seed_rows: In-range seed token IDs
+
+        Returns:
+            Boolean mask over token IDs marking the seeds and their neighbours
+        """
+        n = len(tokens)
+        visited = np.zeros(n, dtype=np.bool_)
+        visited[seed_rows] = True
+        seed_set = set(seed_rows.tolist())
+
+        found: List[int] = []
+        for token in tokens:
+            if token.id in seed_set:
+                found.append(token.head_id)
+                found.extend(token.children_ids)
+            if token.head_id in seed_set or not seed_set.isdisjoint(token.children_ids):
+                found.append(token.id)
+
+        neighbors = np.asarray(found, dtype=np.int64)
+        visited[neighbors[(neighbors >= 0) & (neighbors < n)]] = True
+        return visited
+
+    def _find_copula_ids(self, tokens: List[ParsedToken]) -> FrozenSet[int]:
         """Find token IDs of copular/auxiliary verbs.
 
         Identifies forms of "be" that act as linking verbs rather than
@@ -125,107 +568,147 @@ class SubgraphExtractor:
             tokens: Parsed tokens
 
         Returns:
-            Set of token IDs that are copulas
+            Set of token IDs that are copulas (cached per token list)
         """
-        copula_ids: Set[int] = set()
-
-        for token in tokens:
+        self._sync_token_cache(tokens)
+        if self._copula_ids is None:
             # Only skip if it's:
             # 1. An AUX that is ROOT (copular main verb)
             # 2. A form of "be"
-            if (token.pos == "AUX" and
-                token.dep == "ROOT" and
-                token.text.lower() in COPULA_LEMMAS):
-                copula_ids.add(token.id)
+            # Checks run cheapest first so text is lowercased only for
+            # the few tokens that reach it.
+            self._copula_ids = frozenset(
+                token.id for token in tokens
+                if token.pos == "AUX"
+                and token.dep == "ROOT"
+                and token.text.lower() in COPULA_LEMMAS
+            )
+        return self._copula_ids
 
-        return copula_ids
+    def _sync_token_cache(self, tokens: List[ParsedToken]) -> None:
+        """Drop derived structures when a different token list is passed.
+
+        Args:
+            tokens: Parsed tokens for the current call
+        """
+        if tokens is not self._cached_tokens:
+            self._cached_tokens = tokens
+            self._copula_ids = None
+            self._table = None
+            self._adjacency_cache = {}
+            self._result_cache = OrderedDict()
     
-    def _build_adjacency(
+    def _get_adjacency(
         self,
         tokens: List[ParsedToken],
-        transparent_ids: Optional[Set[int]] = None
-    ) -> dict:
-        """Build adjacency map from dependency structure.
+        transparent_ids: Set[int]
+    ) -> _CSRAdjacency:
+        """Get the adjacency for a token list, building it on first use.
 
-        Creates bidirectional links between tokens and their heads/dependents.
-        Transparent tokens (like copulas) are traversed through but create
-        direct links between their dependents.
+        The raw dependency adjacency is built once per token list; each
+        transparent ID set gets its own contracted copy derived from it.
 
         Args:
             tokens: Parsed tokens
             transparent_ids: Token IDs to treat as transparent (skip over)
 
         Returns:
-            Dict mapping token ID to set of adjacent token IDs
+            CSR adjacency over the token IDs
         """
-        transparent = transparent_ids or set()
-        adjacency: dict[int, Set[int]] = {t.id: set() for t in tokens}
+        self._sync_token_cache(tokens)
+        key = frozenset(transparent_ids)
+        adjacency = self._adjacency_cache.get(key)
+        if adjacency is None:
+            raw = self._adjacency_cache.get(frozenset())
+            if raw is None:
+                raw = self._build_adjacency(tokens)
+                self._adjacency_cache[frozenset()] = raw
+            adjacency = _contract_transparent(raw, key) if key else raw
+            self._adjacency_cache[key] = adjacency
+        return adjacency
 
-        for token in tokens:
-            head_id = token.head_id
+    def _build_adjacency(self, tokens: List[ParsedToken]) -> _CSRAdjacency:
+        """Build adjacency from dependency structure.
 
-            # Skip transparent tokens: connect through them
-            if head_id in transparent and head_id >= 0:
-                # Find the transparent token's dependents (our siblings)
-                transparent_token = next(
-                    (t for t in tokens if t.id == head_id), None
-                )
-                if transparent_token:
-                    for sibling_id in transparent_token.children_ids:
-                        if sibling_id != token.id and sibling_id < len(tokens):
-                            adjacency[token.id].add(sibling_id)
-                            adjacency[sibling_id].add(token.id)
-
-            # Link to head (if not root and head not transparent)
-            if head_id >= 0 and head_id < len(tokens):
-                if head_id not in transparent:
-                    adjacency[token.id].add(head_id)
-                    adjacency[head_id].add(token.id)
-
-            # Link to children (if not transparent)
-            for child_id in token.children_ids:
-                if child_id < len(tokens) and child_id not in transparent:
-                    adjacency[token.id].add(child_id)
-                    adjacency[child_id].add(token.id)
+        Creates bidirectional links between tokens and their heads/dependents.
+
+        Args:
+            tokens: Parsed tokens
+
+        Returns:
+            CSR adjacency over token IDs 0..len(tokens)-1
+        """
+        n = len(tokens)
+        table = self._get_table(tokens)
+        ids = table.ids
+        head_ids = table.head_ids
+
+        # Link to head (if not root)
+        head_link = (head_ids >= 0) & (head_ids < n)
+
+        # Link to children
+        child_counts = np.fromiter(
+            (len(t.children_ids) for t in tokens), dtype=np.int64, count=n
+        )
+        children = np.fromiter(
+            chain.from_iterable(t.children_ids for t in tokens),
+            dtype=np.int64,
+            count=int(child_counts.sum()),
+        )
+        parents = np.repeat(ids, child_counts)
+        child_link = (children >= 0) & (children < n)
+        # Each edge is normally listed on both sides (child.head_id and
+        # head.children_ids). When IDs are row positions, drop child-side
+        # entries already emitted from the child's head_id; keep the rest so
+        # edges present only in children_ids are still linked.
+        if np.array_equal(ids, np.arange(n)):
+            linked_rows = children[child_link]
+            child_link[child_link] = ~(
+                head_link[linked_rows]
+                & (head_ids[linked_rows] == parents[child_link])
+            )
+
+        one_way_sources = np.concatenate([ids[head_link], parents[child_link]])
+        one_way_targets = np.concatenate([head_ids[head_link], children[child_link]])
+        return _csr_from_edges(
+            np.concatenate([one_way_sources, one_way_targets]),
+            np.concatenate([one_way_targets, one_way_sources]),
+            n,
+        )
+
+    def _get_table(self, tokens: List[ParsedToken]) -> TokenTable:
+        """Get the columnar view of a token list, building it on first use.
+
+        Args:
+            tokens: Parsed tokens
+
+        Returns:
+            TokenTable over the given tokens
+        """
+        self._sync_token_cache(tokens)
+        if self._table is None:
+            self._table = TokenTable.from_parsed_tokens(tokens)
+        return self._table
 
-        return adjacency
-    
     def _expand_n_hops(
         self,
-        start_ids: Set[int],
-        adjacency: dict,
-        n_hops: int,
-        max_id: int
-    ) -> Set[int]:
-        """Expand from starting IDs by N hops through adjacency.
+        seed_rows: np.ndarray,
+        adjacency: _CSRAdjacency,
+        n_hops: int
+    ) -> np.ndarray:
+        """Expand from seed rows by N hops through adjacency.
         
         Args:
-            start_ids: Initial token IDs
-            adjacency: Adjacency map
+            seed_rows: Initial token IDs, all within the adjacency
+            adjacency: CSR adjacency
             n_hops: Number of hops to expand
-            max_id: Maximum valid token ID
             
         Returns:
-            Set of all token IDs within N hops
+            Boolean mask over token IDs marking everything within N hops
         """
-        current = set(start_ids)
-        expanded = set(start_ids)
-        
-        for _ in range(n_hops):
-            next_frontier: Set[int] = set()
-            for token_id in current:
-                if token_id in adjacency:
-                    for neighbor_id in adjacency[token_id]:
-                        if neighbor_id not in expanded and neighbor_id < max_id:
-                            next_frontier.add(neighbor_id)
-            
-            expanded.update(next_frontier)
-            current = next_frontier
-            
-            if not current:
-                break
-        
-        return expanded
+        visited = np.zeros(adjacency.num_nodes, dtype=np.bool_)
+        _bfs_n_hops(adjacency.indptr, adjacency.indices, seed_rows, n_hops, visited)
+        return visited
     
     def extract_with_similarity(
         self,
@@ -271,16 +754,16 @@ class SubgraphExtractor:
         Returns:
             Text of tokens in subgraph (may have gaps)
         """
-        subgraph_tokens = [t for t in tokens if t.id in result.word_ids]
-        subgraph_tokens.sort(key=lambda t: t.id)
+        # word_ids from extract() are sorted and unique, so gathering
+        # in that order keeps the tokens in document order
+        tokens_by_id = {t.id: t for t in tokens}
+        subgraph_tokens = [
+            tokens_by_id[wid] for wid in result.word_ids if wid in tokens_by_id
+        ]
         
         if not subgraph_tokens:
             return ""
         
-        parts = []
-        for i, t in enumerate(subgraph_tokens):
-            parts.append(t.text)
-            if i < len(subgraph_tokens) - 1:
-                parts.append(t.whitespace_after)
-        
-        return "".join(parts)
+        return "".join(
+            t.text + t.whitespace_after for t in subgraph_tokens[:-1]
+        ) + subgraph_tokens[-1].text
@@ -0,0 +1,62 @@
+"""Columnar token view for Phase 6 bulk scans.
+
+This module provides a structure-of-arrays view over parsed tokens that:
+- Stores integer fields (IDs, heads, character offsets) as NumPy arrays
+- Keeps string fields as parallel Python lists
+- Is built once per token list and shared by selection and rendering
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from semantic_zoom.phase1.dependency_parser import ParsedToken
+
+
+@dataclass
+class TokenTable:
+    """Parallel-array view of a parsed token list.
+
+    Row i of every column describes tokens[i] of the source list.
+
+    Attributes:
+        ids: Token IDs
+        head_ids: Syntactic head IDs (-1 for root)
+        start_chars: Start character offsets
+        end_chars: End character offsets
+        texts: Token texts
+        whitespace_after: Whitespace following each token
+        pos: Universal POS tags
+    """
+    ids: np.ndarray
+    head_ids: np.ndarray
+    start_chars: np.ndarray
+    end_chars: np.ndarray
+    texts: List[str]
+    whitespace_after: List[str]
+    pos: List[str]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_parsed_tokens(cls, tokens: List[ParsedToken]) -> "TokenTable":
+        """Build a table from parsed tokens.
+
+        Args:
+            tokens: Parsed tokens from the document
+
+        Returns:
+            TokenTable with one row per token
+        """
+        n = len(tokens)
+        return cls(
+            ids=np.fromiter((t.id for t in tokens), dtype=np.int64, count=n),
+            head_ids=np.fromiter((t.head_id for t in tokens), dtype=np.int64, count=n),
+            start_chars=np.fromiter((t.start_char for t in tokens), dtype=np.int64, count=n),
+            end_chars=np.fromiter((t.end_char for t in tokens), dtype=np.int64, count=n),
+            texts=[t.text for t in tokens],
+            whitespace_after=[t.whitespace_after for t in tokens],
+            pos=[t.pos for t in tokens],
+        )
@@ -10,6 +10,8 @@ from semantic_zoom.phase7.grammar_check import (
     GrammarCheckResult,
     Severity,
     check_grammar,
+    check_grammar_batch,
+    iter_errors,
 )
 from semantic_zoom.phase7.ambiguity_detection import (
     Ambiguity,
@@ -18,6 +20,8 @@ from semantic_zoom.phase7.ambiguity_detection import (
     Antecedent,
     Interpretation,
     detect_ambiguities,
+    detect_ambiguities_batch,
+    iter_ambiguities,
 )
 from semantic_zoom.phase7.user_prompts import (
     AmbiguityPrompt,
@@ -48,6 +52,8 @@ __all__ = [
     "GrammarCheckResult",
     "Severity",
     "check_grammar",
+    "check_grammar_batch",
+    "iter_errors",
     # NSM-58: Ambiguity detection
     "Ambiguity",
     "AmbiguityResult",
@@ -55,6 +61,8 @@ __all__ = [
     "Antecedent",
     "Interpretation",
     "detect_ambiguities",
+    "detect_ambiguities_batch",
+    "iter_ambiguities",
     # NSM-59: User prompts
     "AmbiguityPrompt",
     "CorrectionPrompt",
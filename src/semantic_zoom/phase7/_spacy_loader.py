@@ -0,0 +1,39 @@
+"""Shared spaCy model for Phase 7.
+
+Grammar checking, ambiguity detection and version preservation parse with
+the same pipeline, so they share one loaded model instead of holding a copy
+each. The model is loaded on first use, never at import time.
+"""
+import threading
+
+# Phase 7 reads POS, tags, dependencies and lemmas, never entities
+_DISABLED_PIPES = ["ner"]
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """Lazy load the shared spacy model.
+
+    The model is loaded at most once, even when several threads ask for it
+    at the same time.
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                _nlp = _load_nlp()
+    return _nlp
+
+
+def _load_nlp():
+    """Load the spacy model, downloading it if it is not installed."""
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm", disable=_DISABLED_PIPES)
+    except OSError:
+        # Model not installed, try downloading
+        import subprocess
+        subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
+        return spacy.load("en_core_web_sm", disable=_DISABLED_PIPES)
@@ -7,20 +7,50 @@ This module provides ambiguity detection that:
 """
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import List, Optional, Tuple, Set
-import spacy
+from enum import IntEnum, auto
+from functools import lru_cache
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
 
-# Load spaCy model
-try:
-    _nlp = spacy.load("en_core_web_sm")
-except OSError:
-    import subprocess
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-    _nlp = spacy.load("en_core_web_sm")
+import numpy as np
+from spacy.strings import get_string_id
 
+from semantic_zoom.phase7._spacy_loader import get_nlp as _get_nlp
 
-class AmbiguityType(Enum):
+
+# Grammatical number (is_singular, is_plural) of pronouns whose reference
+# can be ambiguous
+_PRONOUN_NUMBER: Dict[str, Tuple[bool, bool]] = {
+    "he": (True, False), "she": (True, False), "it": (True, False),
+    "him": (True, False), "her": (True, False), "his": (True, False),
+    "hers": (True, False), "its": (True, False),
+    "they": (False, True), "them": (False, True),
+    "their": (False, True), "theirs": (False, True),
+}
+
+
+# Universal and existential quantifiers (as determiners)
+_UNIVERSAL_QUANTIFIERS = frozenset({"every", "each", "all"})
+_EXISTENTIAL_QUANTIFIERS = frozenset({"a", "an", "some"})
+
+# Negation words (besides tokens parsed with a "neg" dependency)
+_NEGATION_WORDS = frozenset({"not", "n't", "never"})
+
+# The same word lists keyed by StringStore hash, so tokens are matched on
+# their precomputed ``token.lower`` id without building lowercase strings
+_PRONOUN_NUMBER_IDS: Dict[int, Tuple[bool, bool]] = {
+    get_string_id(word): number for word, number in _PRONOUN_NUMBER.items()
+}
+_UNIVERSAL_QUANTIFIER_IDS = frozenset(map(get_string_id, _UNIVERSAL_QUANTIFIERS))
+_EXISTENTIAL_QUANTIFIER_IDS = frozenset(map(get_string_id, _EXISTENTIAL_QUANTIFIERS))
+_NEGATION_WORD_IDS = frozenset(map(get_string_id, _NEGATION_WORDS))
+
+# Every detector relates at least two words, so text without two separate
+# runs of letters (single words, punctuation, numbers) is never parsed
+_TWO_WORDS_RE = re.compile(r"[^\W\d_][\W\d_]+[^\W\d_]")
+
+
+class AmbiguityType(IntEnum):
     """Types of structural ambiguity."""
     PP_ATTACHMENT = auto()
     COORDINATION = auto()
@@ -29,7 +59,7 @@ class AmbiguityType(Enum):
     NEGATION_SCOPE = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Interpretation:
     """A possible interpretation of an ambiguous structure.
 
@@ -43,7 +73,7 @@ class Interpretation:
     attachment_point: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Antecedent:
     """A possible antecedent for a pronoun.
 
@@ -57,67 +87,263 @@ class Antecedent:
     confidence: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Ambiguity:
     """A detected ambiguity in the text.
 
+    Sequence fields given as lists are stored as tuples.
+
     Attributes:
         ambiguity_type: Type of ambiguity
         span: Character span (start, end) of ambiguous region
         text: The ambiguous text
-        interpretations: List of possible interpretations
-        possible_antecedents: For pronoun ambiguity, list of possible antecedents
+        interpretations: Possible interpretations
+        possible_antecedents: For pronoun ambiguity, possible antecedents
     """
     ambiguity_type: AmbiguityType
     span: Tuple[int, int]
     text: str
-    interpretations: List[Interpretation] = field(default_factory=list)
-    possible_antecedents: Optional[List[Antecedent]] = None
+    interpretations: Tuple[Interpretation, ...] = ()
+    possible_antecedents: Optional[Tuple[Antecedent, ...]] = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "interpretations", tuple(self.interpretations))
+        if self.possible_antecedents is not None:
+            object.__setattr__(
+                self, "possible_antecedents", tuple(self.possible_antecedents)
+            )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AmbiguityResult:
     """Result of ambiguity detection.
 
+    Results are immutable so cached results can be shared between callers;
+    ambiguities given as a list are stored as a tuple.
+
     Attributes:
         text: The original text
-        ambiguities: List of detected ambiguities
+        ambiguities: Detected ambiguities
     """
     text: str
-    ambiguities: List[Ambiguity] = field(default_factory=list)
+    ambiguities: Tuple[Ambiguity, ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ambiguities", tuple(self.ambiguities))
 
 
+@dataclass(slots=True)
+class _Candidates:
+    """Tokens of a Doc that each detector inspects, in document order.
+
+    Attributes:
+        prepositions: ADP tokens attached as ``prep``
+        coordinators: CCONJ tokens attached as ``cc``
+        pronouns: Pronouns whose reference can be ambiguous
+        pronoun_singular: Whether each pronoun is singular
+        any_number: Indices of noun antecedents of either number
+        not_plural: Indices of noun antecedents not tagged plural
+        universal: Universal quantifier determiners
+        existential: Existential quantifier determiners
+        negations: Negation tokens
+        nearest_verb: Index of each token's closest VERB ancestor, or -1
+        conj_children: Indices of ``conj`` children, keyed by head index
+    """
+    prepositions: List = field(default_factory=list)
+    coordinators: List = field(default_factory=list)
+    pronouns: List = field(default_factory=list)
+    pronoun_singular: List[bool] = field(default_factory=list)
+    any_number: List[int] = field(default_factory=list)
+    not_plural: List[int] = field(default_factory=list)
+    universal: List = field(default_factory=list)
+    existential: List = field(default_factory=list)
+    negations: List = field(default_factory=list)
+    nearest_verb: List[int] = field(default_factory=list)
+    conj_children: Dict[int, List[int]] = field(default_factory=dict)
+
+
+def _collect_candidates(doc) -> _Candidates:
+    """Collect every detector's candidates in a single pass over a Doc."""
+    candidates = _Candidates()
+    heads = []
+    is_verb = []
+
+    for token in doc:
+        i = token.i
+        pos = token.pos_
+        dep = token.dep_
+        lower = token.lower
+        head = token.head.i
+        heads.append(head)
+        is_verb.append(pos == "VERB")
+
+        if dep == "conj" and head != i:
+            candidates.conj_children.setdefault(head, []).append(i)
+
+        if pos == "ADP":
+            if dep == "prep":
+                candidates.prepositions.append(token)
+        elif pos == "CCONJ":
+            if dep == "cc":
+                candidates.coordinators.append(token)
+        elif pos == "PRON":
+            number = _PRONOUN_NUMBER_IDS.get(lower)
+            if number is not None:
+                candidates.pronouns.append(token)
+                candidates.pronoun_singular.append(number[0])
+        elif pos == "PROPN" or pos == "NOUN":
+            # Simple number compatibility: singular pronouns need an
+            # antecedent that is not tagged plural, plural pronouns accept
+            # any (groups)
+            if dep != "compound":
+                candidates.any_number.append(i)
+                if token.tag_ not in ("NNS", "NNPS"):
+                    candidates.not_plural.append(i)
+
+        if dep == "det":
+            if lower in _UNIVERSAL_QUANTIFIER_IDS:
+                candidates.universal.append(token)
+            elif lower in _EXISTENTIAL_QUANTIFIER_IDS:
+                candidates.existential.append(token)
+        if dep == "neg" or lower in _NEGATION_WORD_IDS:
+            candidates.negations.append(token)
+
+    candidates.nearest_verb = _nearest_verb_ancestors(heads, is_verb)
+    return candidates
+
+
+def _nearest_verb_ancestors(heads: List[int], is_verb: List[bool]) -> List[int]:
+    """Resolve each token's closest VERB ancestor with memoized upward walks."""
+    # Every non-verb node on a walk shares the answer found at its end
+    unknown = -2
+    nearest_verb = [unknown] * len(heads)
+    for i in range(len(heads)):
+        path = []
+        j = i
+        while nearest_verb[j] == unknown:
+            path.append(j)
+            head = heads[j]
+            if head == j:
+                value = -1
+                break
+            if is_verb[head]:
+                value = head
+                break
+            j = head
+        else:
+            value = nearest_verb[j]
+        for k in path:
+            nearest_verb[k] = value
+    return nearest_verb
+
+
+@lru_cache(maxsize=512)
 def detect_ambiguities(text: str) -> AmbiguityResult:
     """Detect structural ambiguities in text.
 
+    Results are cached per text; use detect_ambiguities.cache_clear() to
+    reset.
+
     Args:
         text: Text to analyze
 
     Returns:
         AmbiguityResult with detected ambiguities
     """
-    doc = _nlp(text)
-    ambiguities: List[Ambiguity] = []
+    if not _TWO_WORDS_RE.search(text):
+        return AmbiguityResult(text=text, ambiguities=())
+
+    return _detect_in_doc(text, _get_nlp()(text))
+
+
+def detect_ambiguities_batch(
+    texts: Iterable[str],
+    batch_size: int = 64,
+    n_process: int = 1
+) -> List[AmbiguityResult]:
+    """Detect structural ambiguities in many texts.
+
+    Texts are parsed as a stream with nlp.pipe(), which minibatches them
+    through the tagger and parser; prefer this over calling
+    detect_ambiguities() in a loop when there are many strings.
+
+    Args:
+        texts: Texts to analyze
+        batch_size: Number of texts per spaCy minibatch
+        n_process: Number of processes for parsing (-1 for all cores)
+
+    Returns:
+        One AmbiguityResult per input text, in order
+    """
+    texts = list(texts)
+    results: List[Optional[AmbiguityResult]] = [None] * len(texts)
+
+    # Texts without two words skip parsing, as in detect_ambiguities()
+    to_parse = []
+    for i, text in enumerate(texts):
+        if not _TWO_WORDS_RE.search(text):
+            results[i] = AmbiguityResult(text=text, ambiguities=())
+        else:
+            to_parse.append(i)
+
+    if to_parse:
+        docs = _get_nlp().pipe(
+            (texts[i] for i in to_parse), batch_size=batch_size, n_process=n_process
+        )
+        for i, doc in zip(to_parse, docs):
+            results[i] = _detect_in_doc(texts[i], doc)
+
+    return results
+
+
+def iter_ambiguities(text: str) -> Iterator[Ambiguity]:
+    """Yield structural ambiguities in text one at a time.
+
+    Unlike detect_ambiguities(), nothing is cached and no result is built,
+    so callers that read each ambiguity once can stop early.
+
+    Args:
+        text: Text to analyze
+
+    Yields:
+        Detected ambiguities, grouped by detector
+    """
+    if not _TWO_WORDS_RE.search(text):
+        return
+
+    yield from _iter_doc_ambiguities(_get_nlp()(text))
+
+
+def _detect_in_doc(text: str, doc) -> AmbiguityResult:
+    """Run all ambiguity detectors over a parsed text."""
+    return AmbiguityResult(text=text, ambiguities=tuple(_iter_doc_ambiguities(doc)))
+
+
+def _iter_doc_ambiguities(doc) -> Iterator[Ambiguity]:
+    """Yield the ambiguities of every detector over a parsed text."""
+    # One pass over the Doc gathers the candidates of every detector
+    candidates = _collect_candidates(doc)
 
     # Detect PP-attachment ambiguities
-    ambiguities.extend(_detect_pp_attachment(doc))
+    yield from _detect_pp_attachment(doc, candidates)
 
     # Detect coordination ambiguities
-    ambiguities.extend(_detect_coordination(doc))
+    yield from _detect_coordination(doc, candidates)
 
     # Detect pronoun ambiguities
-    ambiguities.extend(_detect_pronoun_ambiguity(doc))
+    yield from _detect_pronoun_ambiguity(doc, candidates)
 
     # Detect quantifier scope ambiguities
-    ambiguities.extend(_detect_quantifier_scope(doc))
+    yield from _detect_quantifier_scope(doc, candidates)
 
     # Detect negation scope ambiguities
-    ambiguities.extend(_detect_negation_scope(doc))
-
-    return AmbiguityResult(text=text, ambiguities=ambiguities)
+    yield from _detect_negation_scope(doc, candidates)
 
 
-def _detect_pp_attachment(doc) -> List[Ambiguity]:
+def _detect_pp_attachment(
+    doc,
+    candidates: Optional[_Candidates] = None
+) -> List[Ambiguity]:
     """Detect prepositional phrase attachment ambiguities.
 
     Classic example: "I saw the man with the telescope"
@@ -125,68 +351,71 @@ def _detect_pp_attachment(doc) -> List[Ambiguity]:
     """
     ambiguities = []
 
-    for token in doc:
-        # Look for prepositions
-        if token.pos_ == "ADP" and token.dep_ == "prep":
-            # Get the PP span
-            pp_tokens = list(token.subtree)
-            if not pp_tokens:
-                continue
-
-            pp_start = min(t.idx for t in pp_tokens)
-            pp_end = max(t.idx + len(t.text) for t in pp_tokens)
-            pp_text = doc.text[pp_start:pp_end]
-
-            # Check for potential attachment ambiguity
-            head = token.head
-            potential_attachments = []
-
-            # Current attachment point
-            potential_attachments.append((head.text, head.pos_))
-
-            # Look for other potential attachment points
-            # If attached to noun, check if there's a verb that could take it
-            # If attached to verb, check if there's a noun that could take it
-            if head.pos_ == "NOUN":
-                # Look for verb ancestor
-                for ancestor in head.ancestors:
-                    if ancestor.pos_ == "VERB":
-                        potential_attachments.append((ancestor.text, ancestor.pos_))
-                        break
-            elif head.pos_ == "VERB":
-                # Look for noun object/complement
-                for child in head.children:
-                    if child.pos_ == "NOUN" and child.i < token.i:
-                        potential_attachments.append((child.text, child.pos_))
-                        break
-
-            # Only report as ambiguous if multiple attachment points
-            if len(potential_attachments) >= 2:
-                interpretations = []
-                confidence = 1.0 / len(potential_attachments)
-
-                for attach_text, attach_pos in potential_attachments:
-                    if attach_pos == "VERB":
-                        desc = f"PP '{pp_text}' attaches to verb '{attach_text}'"
-                    else:
-                        desc = f"PP '{pp_text}' attaches to noun '{attach_text}'"
-                    interpretations.append(Interpretation(
-                        description=desc,
-                        confidence=confidence,
-                        attachment_point=attach_text
-                    ))
-
-                ambiguities.append(Ambiguity(
-                    ambiguity_type=AmbiguityType.PP_ATTACHMENT,
-                    span=(pp_start, pp_end),
-                    text=pp_text,
-                    interpretations=interpretations
+    if candidates is None:
+        candidates = _collect_candidates(doc)
+
+    # Prepositions
+    for token in candidates.prepositions:
+        # Get the PP span; a subtree always runs from its left edge
+        # to its right edge
+        left, right = token.left_edge, token.right_edge
+        pp_start = left.idx
+        pp_end = right.idx + len(right.text)
+        pp_text = doc.text[pp_start:pp_end]
+
+        # Check for potential attachment ambiguity
+        head = token.head
+        potential_attachments = []
+
+        # Current attachment point
+        potential_attachments.append((head.text, head.pos_))
+
+        # Look for other potential attachment points
+        # If attached to noun, check if there's a verb that could take it
+        # If attached to verb, check if there's a noun that could take it
+        if head.pos_ == "NOUN":
+            # Look for verb ancestor
+            verb_i = candidates.nearest_verb[head.i]
+            if verb_i >= 0:
+                verb = doc[verb_i]
+                potential_attachments.append((verb.text, verb.pos_))
+        elif head.pos_ == "VERB":
+            # Look for noun object/complement
+            for child in head.children:
+                if child.pos_ == "NOUN" and child.i < token.i:
+                    potential_attachments.append((child.text, child.pos_))
+                    break
+
+        # Only report as ambiguous if multiple attachment points
+        if len(potential_attachments) >= 2:
+            interpretations = []
+            confidence = 1.0 / len(potential_attachments)
+
+            for attach_text, attach_pos in potential_attachments:
+                if attach_pos == "VERB":
+                    desc = f"PP '{pp_text}' attaches to verb '{attach_text}'"
+                else:
+                    desc = f"PP '{pp_text}' attaches to noun '{attach_text}'"
+                interpretations.append(Interpretation(
+                    description=desc,
+                    confidence=confidence,
+                    attachment_point=attach_text
                 ))
 
+            ambiguities.append(Ambiguity(
+                ambiguity_type=AmbiguityType.PP_ATTACHMENT,
+                span=(pp_start, pp_end),
+                text=pp_text,
+                interpretations=interpretations
+            ))
+
     return ambiguities
 
 
-def _detect_coordination(doc) -> List[Ambiguity]:
+def _detect_coordination(
+    doc,
+    candidates: Optional[_Candidates] = None
+) -> List[Ambiguity]:
     """Detect coordination scope ambiguities.
 
     Example: "Old men and women"
@@ -194,53 +423,59 @@ def _detect_coordination(doc) -> List[Ambiguity]:
     """
     ambiguities = []
 
-    for token in doc:
-        # Look for coordinating conjunctions
-        if token.pos_ == "CCONJ" and token.dep_ == "cc":
-            # Get the coordinated elements
-            head = token.head
-            conj_children = [c for c in head.head.children if c.dep_ == "conj"] if head.head else []
-
-            if not conj_children:
-                conj_children = [c for c in head.children if c.dep_ == "conj"]
-
-            if conj_children:
-                # Check if there's a modifier that could scope differently
-                modifiers = []
-                for child in head.children:
-                    if child.dep_ in ("amod", "advmod") and child.i < head.i:
-                        modifiers.append(child)
-
-                if modifiers:
-                    # There's a pre-modifier that could scope over coordination
-                    for mod in modifiers:
-                        coord_text = doc[head.i:conj_children[-1].i + 1].text
-
-                        interpretations = [
-                            Interpretation(
-                                description=f"'{mod.text}' modifies only '{head.text}'",
-                                confidence=0.5
-                            ),
-                            Interpretation(
-                                description=f"'{mod.text}' modifies '{coord_text}'",
-                                confidence=0.5
-                            )
-                        ]
-
-                        span_start = mod.idx
-                        span_end = conj_children[-1].idx + len(conj_children[-1].text)
-
-                        ambiguities.append(Ambiguity(
-                            ambiguity_type=AmbiguityType.COORDINATION,
-                            span=(span_start, span_end),
-                            text=doc.text[span_start:span_end],
-                            interpretations=interpretations
-                        ))
+    if candidates is None:
+        candidates = _collect_candidates(doc)
+
+    # Coordinating conjunctions
+    for token in candidates.coordinators:
+        # Get the coordinated elements
+        head = token.head
+        conj_ids = (
+            candidates.conj_children.get(head.head.i)
+            or candidates.conj_children.get(head.i)
+        )
+        conj_children = [doc[j] for j in conj_ids] if conj_ids else []
+
+        if conj_children:
+            # Check if there's a modifier that could scope differently
+            modifiers = []
+            for child in head.children:
+                if child.dep_ in ("amod", "advmod") and child.i < head.i:
+                    modifiers.append(child)
+
+            if modifiers:
+                # There's a pre-modifier that could scope over coordination
+                for mod in modifiers:
+                    coord_text = doc[head.i:conj_children[-1].i + 1].text
+
+                    interpretations = [
+                        Interpretation(
+                            description=f"'{mod.text}' modifies only '{head.text}'",
+                            confidence=0.5
+                        ),
+                        Interpretation(
+                            description=f"'{mod.text}' modifies '{coord_text}'",
+                            confidence=0.5
+                        )
+                    ]
+
+                    span_start = mod.idx
+                    span_end = conj_children[-1].idx + len(conj_children[-1].text)
+
+                    ambiguities.append(Ambiguity(
+                        ambiguity_type=AmbiguityType.COORDINATION,
+                        span=(span_start, span_end),
+                        text=doc.text[span_start:span_end],
+                        interpretations=interpretations
+                    ))
 
     return ambiguities
 
 
-def _detect_pronoun_ambiguity(doc) -> List[Ambiguity]:
+def _detect_pronoun_ambiguity(
+    doc,
+    candidates: Optional[_Candidates] = None
+) -> List[Ambiguity]:
     """Detect pronoun reference ambiguities.
 
     Example: "John told Bill that he was wrong"
@@ -248,78 +483,60 @@ def _detect_pronoun_ambiguity(doc) -> List[Ambiguity]:
     """
     ambiguities = []
 
-    # Collect potential antecedents (proper nouns and nouns)
-    potential_antecedents = []
-    for token in doc:
-        if token.pos_ in ("PROPN", "NOUN") and token.dep_ not in ("compound",):
-            potential_antecedents.append(token)
-
-    # Look for pronouns
-    for token in doc:
-        if token.pos_ == "PRON" and token.text.lower() in (
-            "he", "she", "it", "they", "him", "her", "them",
-            "his", "hers", "its", "their", "theirs"
-        ):
-            # Find compatible antecedents (preceding the pronoun)
-            compatible = []
-            for ant in potential_antecedents:
-                if ant.i < token.i:  # Antecedent must precede pronoun
-                    # Simple gender/number compatibility check
-                    if _is_compatible(token, ant):
-                        compatible.append(ant)
-
-            # Only ambiguous if multiple compatible antecedents
-            if len(compatible) >= 2:
-                confidence = 1.0 / len(compatible)
-                antecedent_list = [
-                    Antecedent(
-                        text=ant.text,
-                        token_id=ant.i,
-                        confidence=confidence
-                    )
-                    for ant in compatible
-                ]
-
-                interpretations = [
-                    Interpretation(
-                        description=f"'{token.text}' refers to '{ant.text}'",
-                        confidence=confidence
-                    )
-                    for ant in compatible
-                ]
-
-                ambiguities.append(Ambiguity(
-                    ambiguity_type=AmbiguityType.PRONOUN,
-                    span=(token.idx, token.idx + len(token.text)),
-                    text=token.text,
-                    interpretations=interpretations,
-                    possible_antecedents=antecedent_list
-                ))
+    if candidates is None:
+        candidates = _collect_candidates(doc)
+
+    # Count the compatible antecedents preceding every pronoun at once
+    pronoun_rows = [token.i for token in candidates.pronouns]
+    counts = np.where(
+        candidates.pronoun_singular,
+        np.searchsorted(candidates.not_plural, pronoun_rows),
+        np.searchsorted(candidates.any_number, pronoun_rows),
+    ).tolist()
+
+    for token, is_singular, count in zip(
+        candidates.pronouns, candidates.pronoun_singular, counts
+    ):
+        # Only ambiguous if multiple compatible antecedents
+        if count >= 2:
+            antecedents = (
+                candidates.not_plural if is_singular else candidates.any_number
+            )
+            compatible = [doc[j] for j in antecedents[:count]]
+
+            confidence = 1.0 / len(compatible)
+            antecedent_list = [
+                Antecedent(
+                    text=ant.text,
+                    token_id=ant.i,
+                    confidence=confidence
+                )
+                for ant in compatible
+            ]
+
+            interpretations = [
+                Interpretation(
+                    description=f"'{token.text}' refers to '{ant.text}'",
+                    confidence=confidence
+                )
+                for ant in compatible
+            ]
+
+            ambiguities.append(Ambiguity(
+                ambiguity_type=AmbiguityType.PRONOUN,
+                span=(token.idx, token.idx + len(token.text)),
+                text=token.text,
+                interpretations=interpretations,
+                possible_antecedents=antecedent_list
+            ))
 
     return ambiguities
 
 
-def _is_compatible(pronoun, antecedent) -> bool:
-    """Check if pronoun and antecedent are compatible."""
-    # Simple heuristic - in real implementation would check gender/number
-    pron_lower = pronoun.text.lower()
-
-    # Singular pronouns
-    singular = {"he", "she", "it", "him", "her", "his", "hers", "its"}
-    # Plural pronouns
-    plural = {"they", "them", "their", "theirs"}
-
-    if pron_lower in singular:
-        # Check if antecedent is likely singular
-        return antecedent.tag_ not in ("NNS", "NNPS")
-    elif pron_lower in plural:
-        # Check if antecedent could be plural or group
-        return True  # Be permissive
-
-    return True
-
-
-def _detect_quantifier_scope(doc) -> List[Ambiguity]:
+def _detect_quantifier_scope(
+    doc,
+    candidates: Optional[_Candidates] = None
+) -> List[Ambiguity]:
     """Detect quantifier scope ambiguities.
 
     Example: "Every student read a book"
@@ -328,23 +545,12 @@ def _detect_quantifier_scope(doc) -> List[Ambiguity]:
     """
     ambiguities = []
 
-    # Universal quantifiers
-    universal = {"every", "each", "all"}
-    # Existential quantifiers
-    existential = {"a", "an", "some"}
-
-    universal_tokens = []
-    existential_tokens = []
-
-    for token in doc:
-        if token.text.lower() in universal and token.dep_ == "det":
-            universal_tokens.append(token)
-        elif token.text.lower() in existential and token.dep_ == "det":
-            existential_tokens.append(token)
+    if candidates is None:
+        candidates = _collect_candidates(doc)
 
     # Check for scope interaction
-    for univ in universal_tokens:
-        for exist in existential_tokens:
+    for univ in candidates.universal:
+        for exist in candidates.existential:
             if univ.i < exist.i:  # Universal comes before existential
                 # Get the noun phrases
                 univ_np = univ.head.text if univ.head else univ.text
@@ -374,7 +580,10 @@ def _detect_quantifier_scope(doc) -> List[Ambiguity]:
     return ambiguities
 
 
-def _detect_negation_scope(doc) -> List[Ambiguity]:
+def _detect_negation_scope(
+    doc,
+    candidates: Optional[_Candidates] = None
+) -> List[Ambiguity]:
     """Detect negation scope ambiguities.
 
     Example: "John didn't leave because he was tired"
@@ -383,68 +592,69 @@ def _detect_negation_scope(doc) -> List[Ambiguity]:
     """
     ambiguities = []
 
-    for token in doc:
-        # Look for negation
-        if token.dep_ == "neg" or token.text.lower() in ("not", "n't", "never"):
-            head = token.head
+    if candidates is None:
+        candidates = _collect_candidates(doc)
 
-            # Check for adverbial clause that could be in/out of negation scope
-            for child in head.children:
-                if child.dep_ in ("advcl", "prep") and child.i > token.i:
-                    # There's a clause/PP after the negation
-                    clause_tokens = list(child.subtree)
-                    if clause_tokens:
-                        clause_start = min(t.idx for t in clause_tokens)
-                        clause_end = max(t.idx + len(t.text) for t in clause_tokens)
-                        clause_text = doc.text[clause_start:clause_end]
-
-                        span_start = token.idx
-                        span_end = clause_end
-
-                        interpretations = [
-                            Interpretation(
-                                description=f"Negation scopes over main clause only ('{clause_text}' is outside negation)",
-                                confidence=0.5
-                            ),
-                            Interpretation(
-                                description=f"Negation scopes over '{clause_text}' as well",
-                                confidence=0.5
-                            )
-                        ]
-
-                        ambiguities.append(Ambiguity(
-                            ambiguity_type=AmbiguityType.NEGATION_SCOPE,
-                            span=(span_start, span_end),
-                            text=doc.text[span_start:span_end],
-                            interpretations=interpretations
-                        ))
-                        break
-
-            # Check for quantifier-negation interaction
-            for other in doc:
-                if other.text.lower() in ("all", "every", "each") and other.dep_ == "det":
-                    if other.i < token.i:  # Quantifier before negation
-                        np_text = other.head.text if other.head else other.text
-
-                        interpretations = [
-                            Interpretation(
-                                description=f"Not all {np_text}s (some do)",
-                                confidence=0.5
-                            ),
-                            Interpretation(
-                                description=f"All {np_text}s don't (none do)",
-                                confidence=0.5
-                            )
-                        ]
-
-                        span_start = other.idx
-                        span_end = token.idx + len(token.text)
-
-                        ambiguities.append(Ambiguity(
-                            ambiguity_type=AmbiguityType.NEGATION_SCOPE,
-                            span=(span_start, span_end),
-                            text=doc.text[span_start:span_end],
-                            interpretations=interpretations
-                        ))
+    # Look for negation
+    for token in candidates.negations:
+        head = token.head
+
+        # Check for adverbial clause that could be in/out of negation scope
+        for child in head.children:
+            if child.dep_ in ("advcl", "prep") and child.i > token.i:
+                # There's a clause/PP after the negation
+                left, right = child.left_edge, child.right_edge
+                clause_start = left.idx
+                clause_end = right.idx + len(right.text)
+                clause_text = doc.text[clause_start:clause_end]
+
+                span_start = token.idx
+                span_end = clause_end
+
+                interpretations = [
+                    Interpretation(
+                        description=f"Negation scopes over main clause only ('{clause_text}' is outside negation)",
+                        confidence=0.5
+                    ),
+                    Interpretation(
+                        description=f"Negation scopes over '{clause_text}' as well",
+                        confidence=0.5
+                    )
+                ]
+
+                ambiguities.append(Ambiguity(
+                    ambiguity_type=AmbiguityType.NEGATION_SCOPE,
+                    span=(span_start, span_end),
+                    text=doc.text[span_start:span_end],
+                    interpretations=interpretations
+                ))
+                break
+
+        # Check for quantifier-negation interaction
+        for other in candidates.universal:
+            if other.i >= token.i:  # Quantifier must precede negation
+                break
+            np_text = other.head.text if other.head else other.text
+
+            interpretations = [
+                Interpretation(
+                    description=f"Not all {np_text}s (some do)",
+                    confidence=0.5
+                ),
+                Interpretation(
+                    description=f"All {np_text}s don't (none do)",
+                    confidence=0.5
+                )
+            ]
+
+            span_start = other.idx
+            span_end = token.idx + len(token.text)
+
+            ambiguities.append(Ambiguity(
+                ambiguity_type=AmbiguityType.NEGATION_SCOPE,
+                span=(span_start, span_end),
+                text=doc.text[span_start:span_end],
+                interpretations=interpretations
+            ))
 
     return ambiguities
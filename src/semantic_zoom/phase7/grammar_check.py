@@ -6,32 +6,22 @@ Identifies grammatical errors with:
 - Suggestions for corrections
 - Original and corrected version preservation
 """
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Optional
+from dataclasses import dataclass
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 import re
 
-# Lazy load spacy
-_nlp = None
+import numpy as np
+from spacy.attrs import LOWER
+from spacy.strings import get_string_id
+
+from semantic_zoom.phase7._spacy_loader import get_nlp as _get_nlp
 
 # Lazy load CMU pronouncing dictionary
 _cmudict = None
 
 
-def _get_nlp():
-    """Lazy load spacy model."""
-    global _nlp
-    if _nlp is None:
-        import spacy
-        try:
-            _nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-            _nlp = spacy.load("en_core_web_sm")
-    return _nlp
-
-
 def _get_cmudict():
     """Lazy load CMU pronouncing dictionary."""
     global _cmudict
@@ -47,6 +37,17 @@ def _get_cmudict():
     return _cmudict
 
 
+# Letters read as a vowel sound when a word is not in the CMU dictionary
+_VOWEL_SOUNDS = frozenset("aeiou")
+
+# Words that start with vowel letter but consonant sound
+_CONSONANT_SOUND_PREFIXES = ("uni", "eu", "one", "once", "use")
+
+# Words that start with consonant letter but vowel sound
+_VOWEL_SOUND_PREFIXES = ("hour", "honest", "honor", "heir")
+
+
+@lru_cache(maxsize=4096)
 def _starts_with_vowel_sound(word: str) -> bool:
     """Check if a word starts with a vowel sound using CMU pronouncing dictionary.
 
@@ -54,7 +55,8 @@ def _starts_with_vowel_sound(word: str) -> bool:
     - 'hour' → vowel sound (AW1) → use 'an'
     - 'university' → consonant sound (Y) → use 'a'
 
-    Falls back to orthographic check if word not in dictionary.
+    Falls back to orthographic check if word not in dictionary. Results are
+    cached per word, so callers pass words lowercased to share entries.
 
     Args:
         word: Word to check
@@ -77,28 +79,24 @@ def _starts_with_vowel_sound(word: str) -> bool:
     # Fallback to orthographic with known exceptions
     first_char = word[0].lower() if word else ""
 
-    # Words that start with vowel letter but consonant sound
-    consonant_sound_prefixes = ("uni", "eu", "one", "once", "use")
-    if word_lower.startswith(consonant_sound_prefixes):
+    if word_lower.startswith(_CONSONANT_SOUND_PREFIXES):
         return False
 
-    # Words that start with consonant letter but vowel sound
-    vowel_sound_prefixes = ("hour", "honest", "honor", "heir")
-    if word_lower.startswith(vowel_sound_prefixes):
+    if word_lower.startswith(_VOWEL_SOUND_PREFIXES):
         return True
 
     # Default to orthographic check
-    return first_char in {"a", "e", "i", "o", "u"}
+    return first_char in _VOWEL_SOUNDS
 
 
-class Severity(Enum):
+class Severity(IntEnum):
     """Severity levels for grammar errors."""
     ERROR = auto()    # Must be fixed (agreement, fragments)
     WARNING = auto()  # Should be fixed (awkward constructions)
     INFO = auto()     # Style suggestions (passive voice)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GrammarError:
     """A grammatical error with location and suggestion.
 
@@ -120,26 +118,50 @@ class GrammarError:
     message: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GrammarCheckResult:
     """Result of grammar checking.
 
+    Results are immutable so cached results can be shared between callers;
+    errors given as a list are stored as a tuple.
+
     Attributes:
         original: The original input text
         corrected: Text with all suggestions applied
-        errors: List of detected errors
+        errors: Detected errors, ordered by position
     """
     original: str
     corrected: str
-    errors: list[GrammarError] = field(default_factory=list)
+    errors: tuple[GrammarError, ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "errors", tuple(self.errors))
 
 
 # Subject-verb agreement rules
-_SINGULAR_SUBJECTS = {"he", "she", "it", "this", "that", "everyone", "someone", "anyone", "nobody"}
-_PLURAL_SUBJECTS = {"they", "we", "these", "those"}
+_SINGULAR_SUBJECTS = frozenset({"he", "she", "it", "this", "that", "everyone", "someone", "anyone", "nobody"})
+_PLURAL_SUBJECTS = frozenset({"they", "we", "these", "those"})
+
+# Sentence adverbs that take a comma when they open a sentence
+_INTRODUCTORY_ADVERBS = frozenset({"however", "therefore", "moreover", "furthermore",
+                                   "nevertheless", "consequently", "additionally"})
+
+# Lowercase words matched against ``token.lower``, as StringStore hashes so
+# no lowercase strings are built per token
+_ARTICLE_A_ID = get_string_id("a")
+_ARTICLE_AN_ID = get_string_id("an")
+_FIRST_SECOND_PERSON_IDS = frozenset(map(get_string_id, ("i", "you")))
+_SUBORDINATOR_IDS = frozenset(
+    map(get_string_id, ("because", "although", "if", "when", "while"))
+)
+_INTRODUCTORY_ADVERB_IDS = frozenset(map(get_string_id, _INTRODUCTORY_ADVERBS))
 
 # Article rules - now handled by _starts_with_vowel_sound() using CMU dict
 
+# Every check needs a word to fire on; text without a single letter (blank,
+# punctuation, numbers) is returned unchanged without parsing
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
 # Common error patterns
 _DOUBLE_NEGATIVE_PATTERNS = [
     (r"\bdon't\s+\w*\s*no\b", "double negative"),
@@ -150,123 +172,196 @@ _DOUBLE_NEGATIVE_PATTERNS = [
     (r"\bnever\s+\w*\s*no\b", "double negative"),
 ]
 
-
-def _check_subject_verb_agreement(doc) -> list[GrammarError]:
+# All double-negative patterns compiled into one scan. Each alternative
+# captures inside a lookahead, so matches of different patterns may still
+# overlap as they did when every pattern was scanned on its own. Every
+# pattern opens with a word boundary, which is tested once ahead of the
+# lookahead so positions inside words are rejected without trying each
+# alternative.
+_DOUBLE_NEGATIVE_RE = re.compile(
+    r"\b(?=" + "|".join(
+        f"(?P<dn{i}>{body})" for i, body in enumerate(
+            pattern.removeprefix(r"\b") for pattern, _ in _DOUBLE_NEGATIVE_PATTERNS
+        )
+    ) + ")",
+    re.IGNORECASE,
+)
+
+
+def _check_subject_verb_agreement(
+    doc,
+    errors: Optional[list[GrammarError]] = None,
+) -> list[GrammarError]:
     """Check for subject-verb agreement errors."""
-    errors = []
+    if errors is None:
+        errors = []
 
     for token in doc:
-        if token.dep_ == "nsubj" and token.head.pos_ == "VERB":
-            subject = token
-            verb = token.head
-
-            # Check singular subject with plural verb form
-            subject_text = subject.text.lower()
-            verb_text = verb.text.lower()
-
-            # Detect "The dogs runs" pattern
-            if subject.tag_ == "NNS" and verb.tag_ == "VBZ":
-                # Plural noun with singular verb
-                suggestion = verb.lemma_
-                errors.append(GrammarError(
-                    error_type="SUBJECT_VERB_AGREEMENT",
-                    severity=Severity.ERROR,
-                    start_char=verb.idx,
-                    end_char=verb.idx + len(verb.text),
-                    text=verb.text,
-                    suggestion=suggestion,
-                    message=f"Plural subject '{subject.text}' requires plural verb form",
-                ))
-
-            # Detect "The dog run" pattern
-            elif subject.tag_ == "NN" and verb.tag_ == "VBP" and subject_text not in {"i", "you"}:
-                # Singular noun with plural verb
-                if verb_text not in {"be", "have", "do"}:
-                    suggestion = verb_text + "s" if not verb_text.endswith("s") else verb_text
-                    errors.append(GrammarError(
-                        error_type="SUBJECT_VERB_AGREEMENT",
-                        severity=Severity.ERROR,
-                        start_char=verb.idx,
-                        end_char=verb.idx + len(verb.text),
-                        text=verb.text,
-                        suggestion=suggestion,
-                        message=f"Singular subject '{subject.text}' requires singular verb form",
-                    ))
+        if token.dep_ == "nsubj":
+            error = _agreement_error(token)
+            if error is not None:
+                errors.append(error)
 
     return errors
 
 
-def _check_article_errors(doc) -> list[GrammarError]:
+def _agreement_error(subject) -> Optional[GrammarError]:
+    """Return the agreement error between a subject and its verb, if any."""
+    verb = subject.head
+    if verb.pos_ != "VERB":
+        return None
+
+    # Detect "The dogs runs" pattern
+    if subject.tag_ == "NNS" and verb.tag_ == "VBZ":
+        # Plural noun with singular verb
+        suggestion = verb.lemma_
+        return GrammarError(
+            error_type="SUBJECT_VERB_AGREEMENT",
+            severity=Severity.ERROR,
+            start_char=verb.idx,
+            end_char=verb.idx + len(verb.text),
+            text=verb.text,
+            suggestion=suggestion,
+            message=f"Plural subject '{subject.text}' requires plural verb form",
+        )
+
+    # Detect "The dog run" pattern
+    if (
+        subject.tag_ == "NN" and verb.tag_ == "VBP"
+        and subject.lower not in _FIRST_SECOND_PERSON_IDS
+    ):
+        # Singular noun with plural verb
+        verb_text = verb.lower_
+        if verb_text not in {"be", "have", "do"}:
+            suggestion = verb_text + "s" if not verb_text.endswith("s") else verb_text
+            return GrammarError(
+                error_type="SUBJECT_VERB_AGREEMENT",
+                severity=Severity.ERROR,
+                start_char=verb.idx,
+                end_char=verb.idx + len(verb.text),
+                text=verb.text,
+                suggestion=suggestion,
+                message=f"Singular subject '{subject.text}' requires singular verb form",
+            )
+
+    return None
+
+
+def _check_article_errors(
+    doc,
+    errors: Optional[list[GrammarError]] = None,
+) -> list[GrammarError]:
     """Check for article errors (a/an) using phonological analysis.
 
     Uses CMU Pronouncing Dictionary to detect vowel/consonant sounds:
     - 'a hour' → error (hour starts with vowel sound)
     - 'an university' → error (university starts with /j/ consonant)
     """
-    errors = []
-
-    for i, token in enumerate(doc[:-1]):
-        if token.text.lower() == "a":
-            next_token = doc[i + 1]
-            # Check if next word starts with vowel sound
-            if next_token.text and _starts_with_vowel_sound(next_token.text):
-                errors.append(GrammarError(
-                    error_type="ARTICLE",
-                    severity=Severity.WARNING,
-                    start_char=token.idx,
-                    end_char=token.idx + len(token.text),
-                    text=token.text,
-                    suggestion="an",
-                    message=f"Use 'an' before '{next_token.text}' (vowel sound)",
-                ))
-        elif token.text.lower() == "an":
-            next_token = doc[i + 1]
-            # Check if next word starts with consonant sound
-            if next_token.text and not _starts_with_vowel_sound(next_token.text):
-                errors.append(GrammarError(
-                    error_type="ARTICLE",
-                    severity=Severity.WARNING,
-                    start_char=token.idx,
-                    end_char=token.idx + len(token.text),
-                    text=token.text,
-                    suggestion="a",
-                    message=f"Use 'a' before '{next_token.text}' (consonant sound)",
-                ))
+    if errors is None:
+        errors = []
+    if len(doc) < 2:
+        return errors
+
+    # Locate "a"/"an" in one pass over the LOWER column; only those tokens
+    # (never the last one) are visited as Python objects
+    lower = doc.to_array(LOWER)[:-1]
+    is_article = (lower == np.uint64(_ARTICLE_A_ID)) | (lower == np.uint64(_ARTICLE_AN_ID))
+
+    for i in np.flatnonzero(is_article).tolist():
+        error = _article_error(doc[i], doc[i + 1])
+        if error is not None:
+            errors.append(error)
 
     return errors
 
 
-def _check_double_negatives(text: str) -> list[GrammarError]:
-    """Check for double negatives."""
-    errors = []
+def _article_error(article, next_token) -> Optional[GrammarError]:
+    """Return the error for an "a"/"an" article before next_token, if any."""
+    if not next_token.text:
+        return None
 
-    for pattern, desc in _DOUBLE_NEGATIVE_PATTERNS:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            errors.append(GrammarError(
-                error_type="DOUBLE_NEGATIVE",
-                severity=Severity.ERROR,
-                start_char=match.start(),
-                end_char=match.end(),
-                text=match.group(),
-                suggestion=None,  # Complex to suggest
-                message="Avoid double negatives",
-            ))
+    if article.lower == _ARTICLE_A_ID:
+        # Check if next word starts with vowel sound
+        if _starts_with_vowel_sound(next_token.lower_):
+            return GrammarError(
+                error_type="ARTICLE",
+                severity=Severity.WARNING,
+                start_char=article.idx,
+                end_char=article.idx + len(article.text),
+                text=article.text,
+                suggestion="an",
+                message=f"Use 'an' before '{next_token.text}' (vowel sound)",
+            )
+    # Check if next word starts with consonant sound
+    elif not _starts_with_vowel_sound(next_token.lower_):
+        return GrammarError(
+            error_type="ARTICLE",
+            severity=Severity.WARNING,
+            start_char=article.idx,
+            end_char=article.idx + len(article.text),
+            text=article.text,
+            suggestion="a",
+            message=f"Use 'a' before '{next_token.text}' (consonant sound)",
+        )
+
+    return None
+
+
+def _check_double_negatives(
+    text: str,
+    errors: Optional[list[GrammarError]] = None,
+) -> list[GrammarError]:
+    """Check for double negatives."""
+    if errors is None:
+        errors = []
+
+    # Matches of the same pattern never overlap, as with re.finditer
+    pattern_end = [0] * len(_DOUBLE_NEGATIVE_PATTERNS)
+    for match in _DOUBLE_NEGATIVE_RE.finditer(text):
+        group = match.lastgroup
+        index = int(group[2:])
+        start, end = match.span(group)
+        if start < pattern_end[index]:
+            continue
+        pattern_end[index] = end
+        errors.append(GrammarError(
+            error_type="DOUBLE_NEGATIVE",
+            severity=Severity.ERROR,
+            start_char=start,
+            end_char=end,
+            text=match.group(group),
+            suggestion=None,  # Complex to suggest
+            message="Avoid double negatives",
+        ))
 
     return errors
 
 
-def _check_fragment(doc) -> list[GrammarError]:
+def _check_fragment(
+    doc,
+    errors: Optional[list[GrammarError]] = None,
+) -> list[GrammarError]:
     """Check for sentence fragments."""
-    errors = []
+    if errors is None:
+        errors = []
 
     # Check if sentence has a root verb
     has_root = any(token.dep_ == "ROOT" and token.pos_ == "VERB" for token in doc)
     has_subject = any(token.dep_ in ("nsubj", "nsubjpass") for token in doc)
 
+    error = _fragment_error(doc, has_root, has_subject)
+    if error is not None:
+        errors.append(error)
+
+    return errors
+
+
+def _fragment_error(doc, has_root: bool, has_subject: bool) -> Optional[GrammarError]:
+    """Return the fragment error for a Doc, if any."""
     # Fragment: starts with subordinating conjunction but no main clause
-    if doc and doc[0].text.lower() in ("because", "although", "if", "when", "while"):
+    if doc and doc[0].lower in _SUBORDINATOR_IDS:
         if not has_root or not has_subject:
-            errors.append(GrammarError(
+            return GrammarError(
                 error_type="FRAGMENT",
                 severity=Severity.WARNING,
                 start_char=0,
@@ -274,19 +369,20 @@ def _check_fragment(doc) -> list[GrammarError]:
                 text=doc.text,
                 suggestion=None,
                 message="Sentence fragment: subordinate clause without main clause",
-            ))
+            )
 
-    return errors
+    return None
 
 
-def _check_comma_after_introductory(doc) -> list[GrammarError]:
+def _check_comma_after_introductory(
+    doc,
+    errors: Optional[list[GrammarError]] = None,
+) -> list[GrammarError]:
     """Check for missing comma after introductory elements."""
-    errors = []
-
-    introductory_adverbs = {"however", "therefore", "moreover", "furthermore",
-                           "nevertheless", "consequently", "additionally"}
+    if errors is None:
+        errors = []
 
-    if doc and doc[0].text.lower() in introductory_adverbs:
+    if doc and doc[0].lower in _INTRODUCTORY_ADVERB_IDS:
         # Check if followed by comma
         if len(doc) > 1 and doc[1].text != ",":
             errors.append(GrammarError(
@@ -302,29 +398,125 @@ def _check_comma_after_introductory(doc) -> list[GrammarError]:
     return errors
 
 
+@lru_cache(maxsize=512)
 def check_grammar(text: str) -> GrammarCheckResult:
     """Check text for grammatical errors.
 
+    Results are cached per text; use check_grammar.cache_clear() to reset.
+
     Args:
         text: Input text to check
 
     Returns:
         GrammarCheckResult with original, corrected text, and errors
     """
-    if not text or not text.strip():
-        return GrammarCheckResult(original=text, corrected=text, errors=[])
+    if not text or not _LETTER_RE.search(text):
+        return GrammarCheckResult(original=text, corrected=text, errors=())
 
     nlp = _get_nlp()
-    doc = nlp(text)
+    return _check_doc(text, nlp(text))
+
+
+def check_grammar_batch(
+    texts: Iterable[str],
+    batch_size: int = 64,
+    n_process: int = 1,
+) -> list[GrammarCheckResult]:
+    """Check many texts for grammatical errors.
+
+    Texts are parsed as a stream with nlp.pipe(), which minibatches them
+    through the tagger and parser; prefer this over calling check_grammar()
+    in a loop when there are many strings.
+
+    Args:
+        texts: Input texts to check
+        batch_size: Number of texts per spaCy minibatch
+        n_process: Number of processes for parsing (-1 for all cores)
+
+    Returns:
+        One GrammarCheckResult per input text, in order
+    """
+    texts = list(texts)
+    results: list[Optional[GrammarCheckResult]] = [None] * len(texts)
+
+    # Texts without letters skip parsing, as in check_grammar()
+    to_parse = []
+    for i, text in enumerate(texts):
+        if not text or not _LETTER_RE.search(text):
+            results[i] = GrammarCheckResult(original=text, corrected=text, errors=())
+        else:
+            to_parse.append(i)
+
+    if to_parse:
+        nlp = _get_nlp()
+        docs = nlp.pipe(
+            (texts[i] for i in to_parse), batch_size=batch_size, n_process=n_process
+        )
+        for i, doc in zip(to_parse, docs):
+            results[i] = _check_doc(texts[i], doc)
+
+    return results
+
+
+def iter_errors(text: str) -> Iterator[GrammarError]:
+    """Yield grammatical errors in text one check at a time.
+
+    Errors come in check order rather than by position, and no corrected
+    text is built; use check_grammar() for a sorted, cached result.
+
+    Args:
+        text: Input text to check
+
+    Yields:
+        Detected errors, grouped by check
+    """
+    if not text or not _LETTER_RE.search(text):
+        return
+
+    doc = _get_nlp()(text)
+    yield from _check_subject_verb_agreement(doc)
+    yield from _check_article_errors(doc)
+    yield from _check_double_negatives(text)
+    yield from _check_fragment(doc)
+    yield from _check_comma_after_introductory(doc)
+
+
+def _check_all(text: str, doc, errors: list[GrammarError]) -> list[GrammarError]:
+    """Run every grammar check, sharing one pass over the Doc's tokens.
+
+    Agreement and fragment checks share the token loop; articles come from
+    the LOWER-array scan in _check_article_errors. Errors are appended in the same order as running the _check_* helpers
+    one after another.
+    """
+    has_root = has_subject = False
+
+    for token in doc:
+        dep = token.dep_
+        if dep == "nsubj":
+            has_subject = True
+            error = _agreement_error(token)
+            if error is not None:
+                errors.append(error)
+        elif dep == "nsubjpass":
+            has_subject = True
+        elif dep == "ROOT" and token.pos_ == "VERB":
+            has_root = True
+
+    _check_article_errors(doc, errors)
+    _check_double_negatives(text, errors)
+
+    error = _fragment_error(doc, has_root, has_subject)
+    if error is not None:
+        errors.append(error)
+
+    _check_comma_after_introductory(doc, errors)
+    return errors
 
-    errors = []
 
-    # Run all checks
-    errors.extend(_check_subject_verb_agreement(doc))
-    errors.extend(_check_article_errors(doc))
-    errors.extend(_check_double_negatives(text))
-    errors.extend(_check_fragment(doc))
-    errors.extend(_check_comma_after_introductory(doc))
+def _check_doc(text: str, doc) -> GrammarCheckResult:
+    """Run all grammar checks over a parsed text."""
+    # Run all checks into one shared list
+    errors = _check_all(text, doc, [])
 
     # Sort errors by position
     errors.sort(key=lambda e: e.start_char)
@@ -340,16 +532,23 @@ def check_grammar(text: str) -> GrammarCheckResult:
 
 
 def _apply_corrections(text: str, errors: list[GrammarError]) -> str:
-    """Apply all suggestions to create corrected text."""
+    """Apply all suggestions to create corrected text.
+
+    Builds the result in one forward pass; errors must already be sorted
+    by start position. A suggestion overlapping an earlier applied one is
+    skipped.
+    """
     if not errors:
         return text
 
-    # Sort by position in reverse to apply from end to start
-    sorted_errors = sorted(errors, key=lambda e: e.start_char, reverse=True)
-
-    result = text
-    for error in sorted_errors:
-        if error.suggestion is not None:
-            result = result[:error.start_char] + error.suggestion + result[error.end_char:]
-
-    return result
+    parts = []
+    cursor = 0
+    for error in errors:
+        if error.suggestion is None or error.start_char < cursor:
+            continue
+        parts.append(text[cursor:error.start_char])
+        parts.append(error.suggestion)
+        cursor = error.end_char
+    parts.append(text[cursor:])
+
+    return "".join(parts)
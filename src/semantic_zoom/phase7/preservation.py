@@ -8,25 +8,25 @@ Provides version control for text with:
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable, Optional
 import uuid
 
-# Lazy load spacy for tokenization
-_nlp = None
+from semantic_zoom.phase7._spacy_loader import get_nlp as _get_nlp
 
+# Lazy load a blank English tokenizer; splitting text into words needs no
+# trained pipeline
+_tokenizer = None
 
-def _get_nlp():
-    """Lazy load spacy model."""
-    global _nlp
-    if _nlp is None:
+
+def _get_tokenizer():
+    """Lazy load the blank spacy tokenizer."""
+    global _tokenizer
+    if _tokenizer is None:
         import spacy
-        try:
-            _nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-            _nlp = spacy.load("en_core_web_sm")
-    return _nlp
+        _tokenizer = spacy.blank("en").tokenizer
+    return _tokenizer
 
 
 @dataclass
@@ -91,8 +91,7 @@ def _generate_word_id() -> str:
 
 def _tokenize_text(text: str) -> list[str]:
     """Tokenize text into words."""
-    nlp = _get_nlp()
-    doc = nlp(text)
+    doc = _get_tokenizer()(text)
     return [token.text for token in doc if not token.is_space]
 
 
@@ -179,7 +178,7 @@ class VersionStore:
     ) -> Optional[list[WordMapping]]:
         """Get word mapping between two versions.
 
-        Uses LCS-based diff with modification detection.
+        Uses a difflib sequence diff with modification detection.
         Adjacent deletion+insertion pairs are merged into 'modified'
         if the words are similar (share a common lemma).
 
@@ -200,71 +199,39 @@ class VersionStore:
         source_words = source.word_ids
         target_words = target.word_ids
 
-        # Simple LCS-based mapping
         source_texts = [w.text for w in source_words]
         target_texts = [w.text for w in target_words]
 
-        # Build mapping using longest common subsequence approach
-        lcs = _compute_lcs(source_texts, target_texts)
-
-        source_idx = 0
-        target_idx = 0
-        lcs_idx = 0
-
-        while source_idx < len(source_words) or target_idx < len(target_words):
-            if lcs_idx < len(lcs):
-                # Check if current positions match LCS
-                source_matches = (
-                    source_idx < len(source_words) and
-                    source_texts[source_idx] == lcs[lcs_idx]
-                )
-                target_matches = (
-                    target_idx < len(target_words) and
-                    target_texts[target_idx] == lcs[lcs_idx]
-                )
-
-                if source_matches and target_matches:
-                    # Unchanged word
+        # Diff the word sequences; difflib finds matching blocks in C, so
+        # no quadratic table is built for near-identical versions
+        matcher = SequenceMatcher(a=source_texts, b=target_texts, autojunk=False)
+
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                # Unchanged words
+                for source_word, target_word in zip(source_words[i1:i2], target_words[j1:j2]):
                     mappings.append(WordMapping(
-                        source_id=source_words[source_idx].word_id,
-                        target_id=target_words[target_idx].word_id,
+                        source_id=source_word.word_id,
+                        target_id=target_word.word_id,
                         change_type="unchanged",
                     ))
-                    source_idx += 1
-                    target_idx += 1
-                    lcs_idx += 1
-                elif not source_matches and source_idx < len(source_words):
-                    # Deleted from source
-                    mappings.append(WordMapping(
-                        source_id=source_words[source_idx].word_id,
-                        target_id=None,
-                        change_type="deleted",
-                    ))
-                    source_idx += 1
-                elif not target_matches and target_idx < len(target_words):
-                    # Inserted in target
-                    mappings.append(WordMapping(
-                        source_id=None,
-                        target_id=target_words[target_idx].word_id,
-                        change_type="inserted",
-                    ))
-                    target_idx += 1
-            else:
-                # Past LCS
-                if source_idx < len(source_words):
-                    mappings.append(WordMapping(
-                        source_id=source_words[source_idx].word_id,
-                        target_id=None,
-                        change_type="deleted",
-                    ))
-                    source_idx += 1
-                if target_idx < len(target_words):
-                    mappings.append(WordMapping(
-                        source_id=None,
-                        target_id=target_words[target_idx].word_id,
-                        change_type="inserted",
-                    ))
-                    target_idx += 1
+                continue
+
+            # Deleted from source (a replaced span deletes, then inserts)
+            for source_word in source_words[i1:i2]:
+                mappings.append(WordMapping(
+                    source_id=source_word.word_id,
+                    target_id=None,
+                    change_type="deleted",
+                ))
+
+            # Inserted in target
+            for target_word in target_words[j1:j2]:
+                mappings.append(WordMapping(
+                    source_id=None,
+                    target_id=target_word.word_id,
+                    change_type="inserted",
+                ))
 
         # Post-process to detect modifications (deletion+insertion of similar words)
         mappings = _detect_modifications(mappings, source_words, target_words)
@@ -385,55 +352,58 @@ class VersionStore:
         ]
 
 
-def _compute_lcs(seq1: list[str], seq2: list[str]) -> list[str]:
-    """Compute longest common subsequence of two sequences."""
-    m, n = len(seq1), len(seq2)
-
-    # Build DP table
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if seq1[i - 1] == seq2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-    # Backtrack to find LCS
-    lcs = []
-    i, j = m, n
-    while i > 0 and j > 0:
-        if seq1[i - 1] == seq2[j - 1]:
-            lcs.append(seq1[i - 1])
-            i -= 1
-            j -= 1
-        elif dp[i - 1][j] > dp[i][j - 1]:
-            i -= 1
-        else:
-            j -= 1
-
-    return list(reversed(lcs))
-
-
-def _are_words_similar(word1: str, word2: str) -> bool:
+def _are_words_similar(
+    word1: str,
+    word2: str,
+    lemmas: Optional[dict[str, Optional[str]]] = None,
+) -> bool:
     """Check if two words are morphologically related (same lemma).
 
     Uses spaCy lemmatization to determine if words share a common root.
     Examples: "runs" and "run", "dogs" and "dog".
+
+    Args:
+        word1: First word
+        word2: Second word
+        lemmas: Lemmas from _lemmatize_words(); when omitted, both words
+            are lemmatized on the spot and the result is cached
     """
     if word1.lower() == word2.lower():
         return True
 
-    nlp = _get_nlp()
-    doc1 = nlp(word1)
-    doc2 = nlp(word2)
+    if lemmas is None:
+        # Similarity is symmetric, so both argument orders share a cache entry
+        return _lemmas_match(*sorted((word1, word2)))
+
+    lemma1 = lemmas.get(word1)
+    return lemma1 is not None and lemma1 == lemmas.get(word2)
+
 
-    if doc1 and doc2:
-        lemma1 = doc1[0].lemma_.lower()
-        lemma2 = doc2[0].lemma_.lower()
-        return lemma1 == lemma2
+@lru_cache(maxsize=8192)
+def _lemmas_match(word1: str, word2: str) -> bool:
+    """Check if two words share a lemma, cached per pair of words."""
+    lemmas = _lemmatize_words((word1, word2))
+    lemma1 = lemmas.get(word1)
+    return lemma1 is not None and lemma1 == lemmas.get(word2)
 
-    return False
+
+def _lemmatize_words(words: Iterable[str]) -> dict[str, Optional[str]]:
+    """Lemmatize each distinct word once, streaming them through nlp.pipe().
+
+    Returns:
+        Lowercase lemma of each word's first token, or None for a word
+        that yields no tokens
+    """
+    unique = list(dict.fromkeys(words))
+    if not unique:
+        return {}
+
+    # Lemmas come from the tagger and lemmatizer; the parser is not needed
+    docs = _get_nlp().pipe(unique, batch_size=256, disable=["parser"])
+    return {
+        word: doc[0].lemma_.lower() if doc else None
+        for word, doc in zip(unique, docs)
+    }
 
 
 def _detect_modifications(
@@ -447,7 +417,7 @@ def _detect_modifications(
     morphologically related words (same lemma) as 'modified'.
 
     Args:
-        mappings: Initial mappings from LCS algorithm
+        mappings: Initial mappings from the sequence diff
         source_words: Source version word IDs
         target_words: Target version word IDs
 
@@ -461,6 +431,19 @@ def _detect_modifications(
     source_id_to_text = {w.word_id: w.text for w in source_words}
     target_id_to_text = {w.word_id: w.text for w in target_words}
 
+    # Lemmatize every deleted and inserted word in one batch rather than
+    # twice per compared pair
+    deleted_texts = [
+        source_id_to_text.get(m.source_id, "") for m in mappings if m.change_type == "deleted"
+    ]
+    inserted_texts = [
+        target_id_to_text.get(m.target_id, "") for m in mappings if m.change_type == "inserted"
+    ]
+    lemmas = (
+        _lemmatize_words(text for text in deleted_texts + inserted_texts if text)
+        if deleted_texts and inserted_texts else {}
+    )
+
     result = []
     i = 0
 
@@ -512,7 +495,7 @@ def _detect_modifications(
                 if not target_text:
                     continue
 
-                if _are_words_similar(source_text, target_text):
+                if _are_words_similar(source_text, target_text, lemmas):
                     modifications.append(WordMapping(
                         source_id=deletion.source_id,
                         target_id=insertion.target_id,
@@ -4,6 +4,7 @@ from semantic_zoom.phase3.preposition_symbols import (
     CategoricalSymbol,
     SymbolState,
     PrepositionMapping,
+    find_prepositions,
     map_preposition,
 )
 
@@ -222,3 +223,41 @@ class TestIdentityMorphism:
         """Identity morphisms have static motion."""
         result = map_preposition("as")
         assert result.state.motion == "static"
+
+
+class TestFindPrepositions:
+    """Test scanning sentences for prepositions."""
+
+    def test_finds_single_word_prepositions(self):
+        """Single-word prepositions are found in sentence order."""
+        matches = list(find_prepositions("The cat sat on the mat in the hall"))
+        assert [m.mapping.original for m in matches] == ["on", "in"]
+        assert matches[0].mapping.symbol == CategoricalSymbol.SPATIAL_ON
+
+    def test_multi_word_preposition_wins(self):
+        """Multi-word prepositions take precedence over their prefixes."""
+        matches = list(find_prepositions("He ran out of the house"))
+        assert [m.mapping.original for m in matches] == ["out of"]
+        assert matches[0].mapping.symbol == CategoricalSymbol.CONTAINMENT_OUT
+
+    def test_falls_back_to_prefix_at_word_boundary(self):
+        """A prefix still matches when the longer form is not a whole word."""
+        matches = list(find_prepositions("Go out often"))
+        assert [m.mapping.original for m in matches] == ["out"]
+
+    def test_ignores_matches_inside_words(self):
+        """Prepositions embedded in other words are not matched."""
+        assert list(find_prepositions("Tonight the painter waits")) == []
+
+    def test_offsets_and_case_preserved(self):
+        """Match offsets index into the original sentence."""
+        sentence = "Prior to lunch, meet AT noon"
+        matches = list(find_prepositions(sentence))
+        assert [sentence[m.start:m.end] for m in matches] == ["Prior to", "AT"]
+        assert matches[1].mapping.is_dual_citizen
+
+    def test_offsets_survive_case_expansion(self):
+        """Characters that lengthen when lowercased do not shift offsets."""
+        sentence = "İstanbul lies on the Bosphorus"
+        matches = list(find_prepositions(sentence))
+        assert [sentence[m.start:m.end] for m in matches] == ["on"]
@@ -11,6 +11,7 @@ from semantic_zoom.phase4.framenet_assignment import (
     FrameCandidate,
     assign_frame,
     disambiguate_polysemous,
+    disambiguate_polysemous_batch,
 )
 
 
@@ -89,6 +90,19 @@ class TestPolysemy:
         # Frame should be assigned (disambiguation worked)
         assert len(result.candidates) > 0
 
+    def test_batch_disambiguation_matches_single(self):
+        """Batch disambiguation should agree with per-item disambiguation."""
+        items = [
+            ("play", "The musicians play jazz"),
+            ("run", "He runs the company"),
+        ]
+        results = disambiguate_polysemous_batch(items)
+
+        assert [r.verb for r in results] == ["play", "run"]
+        for (verb, context), result in zip(items, results):
+            single = disambiguate_polysemous(verb=verb, candidates=None, context=context)
+            assert result.best_frame.frame_name == single.best_frame.frame_name
+
     def test_fallback_without_context(self):
         """Without context, should return candidates ranked by frequency/salience."""
         result = assign_frame("set", context=None)
@@ -5,9 +5,12 @@ Acceptance Criteria:
 - Dynamic frames -> PLAN, Stative frames -> DESCRIPTION
 - Aspectual transformations may shift to HYBRID
 """
+import dataclasses
+
 import pytest
 from semantic_zoom.phase4.plan_description import (
     PropositionType,
+    ReasonCode,
     classify_proposition,
     ClassificationResult,
 )
@@ -208,6 +211,54 @@ class TestClassificationResult:
         assert result.reasoning is not None
         assert len(result.reasoning) > 0
 
+    def test_reasoning_built_from_codes(self):
+        """Reasoning text should be formatted from the recorded reason codes."""
+        result = classify_proposition(
+            verb="know",
+            frame_name="Awareness",
+            aspect="progressive",
+        )
+
+        assert result.reasoning_codes == (
+            ReasonCode.FRAME_STATIVE,
+            ReasonCode.ASPECT_HYBRID,
+        )
+        assert result.reasoning == (
+            "Frame 'Awareness' is stative; progressive aspect creates hybrid"
+        )
+
+    def test_explicit_reasoning_overrides_codes(self):
+        """Reasoning passed to the constructor should be returned unchanged."""
+        result = ClassificationResult(PropositionType.PLAN, 0.8, "Custom reason")
+        keyword = ClassificationResult(
+            proposition_type=PropositionType.PLAN,
+            confidence=0.8,
+            reasoning="Custom reason",
+            reasoning_codes=(ReasonCode.FRAME_DYNAMIC,),
+        )
+
+        assert result.reasoning == "Custom reason"
+        assert keyword.reasoning == "Custom reason"
+
+    def test_replace_round_trips(self):
+        """dataclasses.replace should copy every field, reasoning included."""
+        result = classify_proposition(verb="know", frame_name="Awareness")
+
+        replaced = dataclasses.replace(result, confidence=0.5)
+
+        assert replaced.confidence == 0.5
+        assert replaced.reasoning == result.reasoning
+        assert replaced.reasoning_codes == result.reasoning_codes
+        assert replaced == dataclasses.replace(replaced)
+
+    def test_asdict_and_repr_include_reasoning(self):
+        """Serialised results should keep the formatted explanation."""
+        result = classify_proposition(verb="know", frame_name="Awareness")
+
+        assert dataclasses.asdict(result)["reasoning"] == "Frame 'Awareness' is stative"
+        assert "reasoning=\"Frame 'Awareness' is stative\"" in repr(result)
+        assert result != dataclasses.replace(result, reasoning="Other")
+
 
 class TestFrameBasedClassification:
     """Test that frame type influences classification."""
@@ -13,6 +13,7 @@ from semantic_zoom.phase5.edges import (
     AdverbTier,
     create_edge,
     create_edges_from_text,
+    create_edges_from_texts,
     NULL_NODE_ID,
 )
 
@@ -218,6 +219,16 @@ class TestEdgesFromText:
             assert edge.source_id is not None
             assert edge.target_id is not None
 
+    def test_batch_extraction_matches_single(self):
+        """Batch extraction should yield one edge list per text, in order."""
+        texts = ["The cat chased the mouse.", "The dog slept."]
+        batched = list(create_edges_from_texts(texts))
+
+        assert len(batched) == len(texts)
+        for text, edges in zip(texts, batched):
+            single = create_edges_from_text(text)
+            assert [e.verb for e in edges] == [e.verb for e in single]
+
 
 class TestSemanticEdge:
     """Test SemanticEdge data structure."""
@@ -11,7 +11,10 @@ from semantic_zoom.phase5.nodes import (
     SemanticNode,
     NodeType,
     create_node,
+    create_nodes_from_doc,
     create_nodes_from_text,
+    create_nodes_from_texts,
+    _get_nlp,
 )
 
 
@@ -212,6 +215,35 @@ class TestNodesFromText:
             assert text[node.span[0]:node.span[1]].lower() == node.text.lower() or \
                    node.text.lower() in text[node.span[0]:node.span[1]].lower()
 
+    def test_repeated_text_creates_fresh_nodes(self):
+        """Reusing a cached parse should still mint new node objects and IDs."""
+        first = create_nodes_from_text("The cat sat on the mat.")
+        second = create_nodes_from_text("The cat sat on the mat.")
+
+        assert [n.text for n in first] == [n.text for n in second]
+        assert {n.node_id for n in first}.isdisjoint(n.node_id for n in second)
+
+    def test_nodes_from_existing_doc(self):
+        """A pre-parsed Doc should yield the same nodes as parsing the text."""
+        text = "The cat sat on the mat."
+        doc = _get_nlp()(text)
+
+        from_doc = create_nodes_from_doc(doc)
+        from_text = create_nodes_from_text(text)
+
+        assert [(n.text, n.span) for n in from_doc] == [(n.text, n.span) for n in from_text]
+
+    def test_batch_matches_single_text(self):
+        """Batched extraction should yield one node list per text, in order."""
+        texts = ["The cat sat on the mat.", "She saw him."]
+
+        batched = list(create_nodes_from_texts(texts))
+
+        assert len(batched) == 2
+        for text, nodes in zip(texts, batched):
+            single = create_nodes_from_text(text)
+            assert [(n.text, n.span) for n in nodes] == [(n.text, n.span) for n in single]
+
 
 class TestSemanticNode:
     """Test SemanticNode data structure."""
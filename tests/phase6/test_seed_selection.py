@@ -2,7 +2,7 @@
 
 import pytest
 from semantic_zoom.phase1.tokenizer import Tokenizer
-from semantic_zoom.phase1.dependency_parser import DependencyParser
+from semantic_zoom.phase1.dependency_parser import DependencyParser, ParsedToken
 from semantic_zoom.phase6.seed_selection import SeedSelector, Seed
 
 
@@ -58,7 +58,8 @@ class TestSeedSelection:
         seed = selector.select_range(parsed, start_id=0, end_id=1)
         
         assert hasattr(seed, 'word_ids')
-        assert seed.word_ids == [0, 1]
+        assert seed.word_ids == range(0, 2)
+        assert seed.word_ids_list == [0, 1]
 
 
 class TestContainingClause:
@@ -238,3 +239,111 @@ class TestSeedAttributes:
         assert hasattr(seed, 'sentence_start_id')
         assert hasattr(seed, 'sentence_end_id')
         assert hasattr(seed, 'clause_root_id')
+
+
+class TestTokenIndexReuse:
+    """Test that the selector's token index tracks the token list it is given."""
+
+    def test_new_token_list_rebuilds_index(self):
+        """Selecting from a different document should not reuse stale lookups."""
+        tokenizer = Tokenizer()
+        parser = DependencyParser()
+        selector = SeedSelector()
+
+        first = parser.parse(tokenizer.tokenize("Hello world."))
+        second = parser.parse(tokenizer.tokenize("Goodbye moon."))
+
+        assert selector.select_range(first, start_id=0, end_id=0).text == "Hello"
+        assert selector.select_range(second, start_id=0, end_id=0).text == "Goodbye"
+        assert selector.select_range(first, start_id=1, end_id=1).text == "world"
+
+    def test_deep_clause_subtree(self):
+        """Clause token collection should handle trees deeper than the recursion limit."""
+        depth = 5000
+        tokens = [
+            ParsedToken(
+                id=i, text="w", whitespace_after=" ", is_punct=False,
+                start_char=2 * i, end_char=2 * i + 1, pos="NOUN", tag="NN",
+                head_id=i - 1, dep="ROOT" if i == 0 else "nmod",
+            )
+            for i in range(depth)
+        ]
+        selector = SeedSelector()
+        seed = Seed(id="s", start_id=0, end_id=0, word_ids=range(0, 1), text="w", clause_root_id=0)
+
+        assert selector.get_clause_token_ids(tokens, seed) == list(range(depth))
+
+    def test_select_range_with_offset_ids(self):
+        """Token lists whose IDs are not list positions should still select by ID."""
+        words = ["Hello", "big", "world"]
+        tokens = [
+            ParsedToken(
+                id=10 + i, text=w, whitespace_after=" ", is_punct=False,
+                start_char=0, end_char=len(w), pos="X", tag="X",
+                head_id=-1, dep="ROOT",
+            )
+            for i, w in enumerate(words)
+        ]
+        selector = SeedSelector()
+
+        assert selector.select_range(tokens, start_id=11, end_id=12).text == "big world"
+        assert selector.select_range(tokens, start_id=0, end_id=2).text == ""
+
+    def test_out_of_order_ids_scan_sentences_in_list_order(self):
+        """Unsorted token IDs should not be bisected for sentence bounds."""
+        words = [(3, "Bye"), (4, "now"), (5, "."), (0, "Hi"), (1, "there"), (2, ".")]
+        tokens = [
+            ParsedToken(
+                id=i, text=w, whitespace_after=" ", is_punct=w == ".",
+                start_char=0, end_char=len(w), pos="X", tag="X",
+                head_id=-1, dep="ROOT",
+            )
+            for i, w in words
+        ]
+        selector = SeedSelector()
+
+        for token_id in range(6):
+            assert selector._find_sentence_bounds(tokens, token_id) == (
+                selector._scan_sentence_bounds(tokens, token_id)
+            )
+        assert selector._find_sentence_bounds(tokens, 4) == (0, 5)
+
+
+class TestSeedsView:
+    """Test the read-only seeds snapshot."""
+
+    @staticmethod
+    def _seed(seed_id: str) -> Seed:
+        return Seed(id=seed_id, start_id=0, end_id=0, word_ids=range(0, 1), text="w")
+
+    def test_seeds_snapshot_is_reused_until_changed(self):
+        """Repeated reads should share one snapshot; mutations should refresh it."""
+        selector = SeedSelector()
+        selector.add_seed(self._seed("a"))
+
+        first = selector.seeds
+        assert selector.seeds is first
+        assert isinstance(first, tuple)
+
+        selector.add_seed(self._seed("b"))
+        assert [s.id for s in selector.seeds] == ["a", "b"]
+        assert [s.id for s in first] == ["a"]
+
+        selector.remove_seed("a")
+        assert [s.id for s in selector.seeds] == ["b"]
+
+        selector.clear_seeds()
+        assert selector.seeds == ()
+
+    def test_re_adding_seed_id_replaces_in_place(self):
+        """Seeds are keyed by ID, so re-adding an ID replaces the stored seed."""
+        selector = SeedSelector()
+        selector.add_seed(self._seed("a"))
+        selector.add_seed(self._seed("b"))
+
+        replacement = self._seed("a")
+        selector.add_seed(replacement)
+
+        assert [s.id for s in selector.seeds] == ["a", "b"]
+        assert selector.seeds[0] is replacement
+        assert selector.remove_seed("missing") is False
@@ -2,9 +2,9 @@
 
 import pytest
 from semantic_zoom.phase1.tokenizer import Tokenizer
-from semantic_zoom.phase1.dependency_parser import DependencyParser
+from semantic_zoom.phase1.dependency_parser import DependencyParser, ParsedToken
 from semantic_zoom.phase6.seed_selection import SeedSelector
-from semantic_zoom.phase6.subgraph_extraction import SubgraphExtractor
+from semantic_zoom.phase6.subgraph_extraction import SubgraphExtractor, SubgraphResult
 from semantic_zoom.phase6.sparse_render import SparseRenderer
 
 
@@ -271,3 +271,64 @@ class TestSparseRendererMethods:
         # Should include "Cat" and "sat"
         assert "Cat" in rendered
         assert "sat" in rendered
+
+
+class TestGapRuns:
+    """Test placeholder emission over runs of kept and omitted tokens."""
+
+    @staticmethod
+    def _tokens(words):
+        tokens = []
+        offset = 0
+        for i, word in enumerate(words):
+            tokens.append(ParsedToken(
+                id=i, text=word, whitespace_after=" ", is_punct=False,
+                start_char=offset, end_char=offset + len(word), pos="X", tag="X",
+                head_id=-1, dep="dep",
+            ))
+            offset += len(word) + 1
+        return tokens
+
+    def test_one_placeholder_per_gap_run(self):
+        """Each maximal run of omitted tokens should render as one placeholder."""
+        tokens = self._tokens(["a", "b", "c", "d", "e", "f", "g"])
+        result = SubgraphResult(word_ids=[1, 2, 5], zoom_level=1, seed_ids=[])
+
+        rendered = SparseRenderer().render(tokens, result)
+
+        assert rendered == "[...] b c [...] f [...]"
+
+    def test_empty_document(self):
+        """Rendering against no tokens should produce an empty string."""
+        result = SubgraphResult(word_ids=[0], zoom_level=1, seed_ids=[])
+
+        assert SparseRenderer().render([], result) == ""
+
+    def test_context_window_merges_overlapping_neighbourhoods(self):
+        """Context around nearby IDs should merge, clipped to the document."""
+        tokens = self._tokens(["a", "b", "c", "d", "e", "f", "g"])
+        result = SubgraphResult(word_ids=[0, 2, 6], zoom_level=1, seed_ids=[])
+
+        rendered = SparseRenderer().render_with_context(tokens, result, context_window=1)
+
+        assert rendered == "a b c d [...] f g"
+
+    def test_coverage_gap_count(self):
+        """Coverage stats should count each run of omitted tokens once."""
+        tokens = self._tokens(["a", "b", "c", "d", "e", "f", "g"])
+        result = SubgraphResult(word_ids=[1, 2, 5], zoom_level=1, seed_ids=[])
+
+        stats = SparseRenderer().get_coverage_stats(tokens, result)
+
+        assert stats["gap_count"] == 3
+        assert stats["included_tokens"] == 3
+        assert stats["total_tokens"] == 7
+
+    def test_empty_kept_run_does_not_split_gap(self):
+        """A kept token that renders nothing should not produce adjacent placeholders."""
+        tokens = self._tokens(["a", "b", "c", "d", "e"])
+        tokens[2].text = ""
+        tokens[2].whitespace_after = ""
+        result = SubgraphResult(word_ids=[2, 4], zoom_level=1, seed_ids=[])
+
+        assert SparseRenderer().render(tokens, result) == "[...] e"
@@ -1,10 +1,13 @@
 """Tests for subgraph extraction algorithm (NSM-54)."""
 
+import dataclasses
+
+import numpy as np
 import pytest
 from semantic_zoom.phase1.tokenizer import Tokenizer
-from semantic_zoom.phase1.dependency_parser import DependencyParser
-from semantic_zoom.phase6.seed_selection import SeedSelector
-from semantic_zoom.phase6.subgraph_extraction import SubgraphExtractor
+from semantic_zoom.phase1.dependency_parser import DependencyParser, ParsedToken
+from semantic_zoom.phase6.seed_selection import Seed, SeedSelector
+from semantic_zoom.phase6.subgraph_extraction import SubgraphExtractor, SubgraphResult
 
 
 class TestSubgraphExtraction:
@@ -371,3 +374,245 @@ class TestCopulaSkipping:
         assert "John" in words
         assert "is" not in words
         assert "doctor" in words
+
+
+def _tree_tokens(heads, texts=None, pos=None):
+    """Build parsed tokens from a head list, filling children_ids from heads."""
+    texts = texts or [f"w{i}" for i in range(len(heads))]
+    pos = pos or ["NOUN"] * len(heads)
+    tokens = [
+        ParsedToken(
+            id=i, text=texts[i], whitespace_after=" ", is_punct=False,
+            start_char=0, end_char=len(texts[i]), pos=pos[i], tag="X",
+            head_id=h, dep="ROOT" if h < 0 else "dep",
+        )
+        for i, h in enumerate(heads)
+    ]
+    for t in tokens:
+        if t.head_id >= 0:
+            tokens[t.head_id].children_ids.append(t.id)
+    return tokens
+
+
+def _seed(*word_ids):
+    return Seed(
+        id=f"s{word_ids[0]}", start_id=word_ids[0], end_id=word_ids[-1],
+        word_ids=range(word_ids[0], word_ids[-1] + 1), text="",
+    )
+
+
+class TestAdjacencyReuse:
+    """Test that cached adjacency tracks the token list it was built from."""
+
+    def test_new_token_list_rebuilds_adjacency(self):
+        """Extracting from a different parse should not reuse stale structure."""
+        extractor = SubgraphExtractor()
+        chain = _tree_tokens([-1, 0, 1, 2])
+        star = _tree_tokens([-1, 0, 0, 0])
+
+        assert extractor.extract(chain, [_seed(0)], zoom_level=1).word_ids == (0, 1)
+        assert extractor.extract(star, [_seed(0)], zoom_level=1).word_ids == (0, 1, 2, 3)
+        assert extractor.extract(chain, [_seed(0)], zoom_level=2).word_ids == (0, 1, 2)
+
+    def test_children_only_edge_is_linked(self):
+        """An edge listed only in children_ids should still connect both ends."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, -1])
+        tokens[0].children_ids.append(2)
+
+        assert extractor.extract(tokens, [_seed(2)], zoom_level=1).word_ids == (0, 2)
+
+    def test_hand_built_copula_links_siblings(self):
+        """Dependents of a skipped copula should reach each other in one hop."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens(
+            [1, -1, 1, 2],
+            texts=["it", "is", "big", "indeed"],
+            pos=["PRON", "AUX", "ADJ", "ADV"],
+        )
+
+        result = extractor.extract(
+            tokens, [_seed(0)], zoom_level=1, skip_copulas=True
+        )
+        assert result.word_ids == (0, 2)
+        assert extractor.extract(tokens, [_seed(0)], zoom_level=1).word_ids == (0, 1)
+
+    def test_adjacency_is_compact_int32_csr(self):
+        """Adjacency should be stored as flat int32 arrays, not per-node sets."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 0, 1])
+
+        adjacency = extractor._get_adjacency(tokens, set())
+
+        assert adjacency.indptr.dtype == np.int32
+        assert adjacency.indices.dtype == np.int32
+        neighbors = [
+            adjacency.indices[adjacency.indptr[i]:adjacency.indptr[i + 1]].tolist()
+            for i in range(4)
+        ]
+        assert neighbors == [[1, 2], [0, 3], [0], [1]]
+
+
+class TestSingleHopFastPath:
+    """Test the zoom-level-1 path that skips building adjacency."""
+
+    def test_single_hop_does_not_build_adjacency(self):
+        """One hop without copula skipping should leave the adjacency cache empty."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 1, 1])
+
+        result = extractor.extract(tokens, [_seed(1)], zoom_level=1)
+
+        assert result.word_ids == (0, 1, 2, 3)
+        assert extractor._adjacency_cache == {}
+
+    def test_single_hop_matches_cached_adjacency(self):
+        """The fast path and the adjacency path should agree."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([2, 0, -1, 2, 3])
+
+        fast = [extractor.extract(tokens, [_seed(i)], zoom_level=1).word_ids for i in range(5)]
+        extractor.extract(tokens, [_seed(0)], zoom_level=2)
+        cached = [extractor.extract(tokens, [_seed(i)], zoom_level=1).word_ids for i in range(5)]
+
+        assert fast == cached
+
+
+class TestFullCoverage:
+    """Test expansion once every token has been reached."""
+
+    def test_zoom_beyond_tree_depth_returns_all_tokens(self):
+        """Hops past full coverage should not change the result."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 1, 0, 3])
+
+        shallow = extractor.extract(tokens, [_seed(2)], zoom_level=4)
+        deep = extractor.extract(tokens, [_seed(2)], zoom_level=100)
+
+        assert shallow.word_ids == deep.word_ids == (0, 1, 2, 3, 4)
+
+
+class TestExtractBatch:
+    """Test batched extraction over one token list."""
+
+    def test_batch_matches_individual_extractions(self):
+        """Each batched result should equal the single extraction."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 1, 2, 3, 0, 5])
+        seeds_list = [[_seed(i)] for i in range(7)] + [[_seed(1), _seed(6)], []]
+
+        batch = extractor.extract_batch(tokens, seeds_list, zoom_level=2)
+
+        assert batch == [
+            SubgraphExtractor().extract(tokens, seeds, zoom_level=2)
+            for seeds in seeds_list
+        ]
+
+    def test_batch_larger_than_64(self):
+        """Batches beyond 64 seed lists should be split, not truncated."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1] + list(range(99)))
+        seeds_list = [[_seed(i)] for i in range(100)]
+
+        batch = extractor.extract_batch(tokens, seeds_list, zoom_level=1)
+
+        assert len(batch) == 100
+        assert batch[70].word_ids == (69, 70, 71)
+        assert batch[99].word_ids == (98, 99)
+
+    def test_negative_zoom_keeps_seeds(self):
+        """A negative zoom should cover just the seeds, batched or not."""
+        tokens = _tree_tokens([-1, 0, 1, 2])
+        seeds_list = [[_seed(1)], [_seed(0), _seed(3)]]
+
+        batch = SubgraphExtractor().extract_batch(tokens, seeds_list, zoom_level=-1)
+        single = [
+            SubgraphExtractor().extract(tokens, seeds, zoom_level=-1)
+            for seeds in seeds_list
+        ]
+
+        assert [r.word_ids for r in single] == [(1,), (0, 3)]
+        assert batch == single
+
+    def test_numpy_bfs_marks_seeds_without_hops(self):
+        """The NumPy BFS should mark the seeds even for a non-positive hop count."""
+        from semantic_zoom.phase6.subgraph_extraction import _bfs_n_hops_numpy
+
+        indptr = np.array([0, 1, 3, 4], dtype=np.int32)
+        indices = np.array([1, 0, 2, 1], dtype=np.int32)
+
+        for n_hops in (-1, 0):
+            visited = np.zeros(3, dtype=bool)
+            _bfs_n_hops_numpy(indptr, indices, np.array([1, 1], dtype=np.int32), n_hops, visited)
+            assert visited.tolist() == [False, True, False]
+
+
+class TestResultCache:
+    """Test reuse of extraction results for repeated calls."""
+
+    def test_repeated_call_is_served_from_cache(self):
+        """The same seeds and zoom should hit the cache and agree."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 1, 2])
+
+        first = extractor.extract(tokens, [_seed(1)], zoom_level=2)
+        second = extractor.extract(tokens, [_seed(1)], zoom_level=2)
+
+        assert first == second
+        assert len(extractor._result_cache) == 1
+
+    def test_mutating_result_does_not_poison_cache(self):
+        """Returned results should reject mutation, keeping the cache intact."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 1, 2])
+
+        first = extractor.extract(tokens, [_seed(0)], zoom_level=1)
+        with pytest.raises(AttributeError):
+            first.word_ids.append(99)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.word_ids = [99]
+
+        assert extractor.extract(tokens, [_seed(0)], zoom_level=1).word_ids == (0, 1)
+
+    def test_seed_ids_follow_each_call(self):
+        """Seeds covering the same words should still report their own IDs."""
+        extractor = SubgraphExtractor()
+        tokens = _tree_tokens([-1, 0, 1, 2])
+        renamed = Seed(id="other", start_id=1, end_id=1, word_ids=range(1, 2), text="")
+
+        extractor.extract(tokens, [_seed(1)], zoom_level=1)
+        result = extractor.extract(tokens, [renamed], zoom_level=1)
+
+        assert result.seed_ids == ("other",)
+        assert result.word_ids == (0, 1, 2)
+
+
+class TestSubgraphResultImmutability:
+    """Test that SubgraphResult is a frozen, hashable value."""
+
+    def test_lists_are_stored_as_tuples(self):
+        """List arguments should be converted to tuples."""
+        result = SubgraphResult(word_ids=[1, 2], zoom_level=1, seed_ids=["s1"])
+
+        assert result.word_ids == (1, 2)
+        assert result.seed_ids == ("s1",)
+        assert hash(result) == hash(SubgraphResult((1, 2), 1, ("s1",)))
+
+
+class TestDefaultSignature:
+    """Test the original call signature keeps its behavior."""
+
+    def test_default_extractor_keeps_copulas(self):
+        """A default extractor with zoom_level=2 should traverse and keep copulas."""
+        tokens = _tree_tokens(
+            [1, -1, 1, 2],
+            texts=["it", "is", "big", "indeed"],
+            pos=["PRON", "AUX", "ADJ", "ADV"],
+        )
+
+        extractor = SubgraphExtractor()
+        result = extractor.extract(tokens, [_seed(0)], zoom_level=2)
+
+        assert extractor.skip_copulas is False
+        assert result.word_ids == (0, 1, 2)
+        assert extractor.extract(tokens, [_seed(0)], 2) == result
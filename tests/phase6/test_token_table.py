@@ -0,0 +1,38 @@
+"""Tests for the columnar token view used by Phase 6."""
+
+from semantic_zoom.phase1.dependency_parser import ParsedToken
+from semantic_zoom.phase6.token_table import TokenTable
+
+
+def _token(i: int, text: str, head_id: int, start: int) -> ParsedToken:
+    return ParsedToken(
+        id=i, text=text, whitespace_after=" ", is_punct=False,
+        start_char=start, end_char=start + len(text), pos="NOUN", tag="NN",
+        head_id=head_id, dep="dep",
+    )
+
+
+class TestTokenTable:
+    """Test conversion from parsed tokens to parallel arrays."""
+
+    def test_columns_follow_token_order(self):
+        """Each column should hold the matching field of each token in order."""
+        tokens = [_token(0, "Hello", 1, 0), _token(1, "world", -1, 6)]
+
+        table = TokenTable.from_parsed_tokens(tokens)
+
+        assert len(table) == 2
+        assert table.ids.tolist() == [0, 1]
+        assert table.head_ids.tolist() == [1, -1]
+        assert table.start_chars.tolist() == [0, 6]
+        assert table.end_chars.tolist() == [5, 11]
+        assert table.texts == ["Hello", "world"]
+        assert table.whitespace_after == [" ", " "]
+        assert table.pos == ["NOUN", "NOUN"]
+
+    def test_empty_token_list(self):
+        """An empty document should produce empty columns."""
+        table = TokenTable.from_parsed_tokens([])
+
+        assert len(table) == 0
+        assert table.ids.size == 0
@@ -126,6 +126,21 @@ class TestPronounAmbiguity:
                 assert hasattr(antecedent, 'confidence')
                 assert 0.0 <= antecedent.confidence <= 1.0
 
+    def test_singular_pronoun_skips_plural_antecedents(self):
+        """Test that only preceding, number-compatible nouns are listed."""
+        from semantic_zoom.phase7.ambiguity_detection import detect_ambiguities, AmbiguityType
+
+        text = "The dogs followed John and Bill until he stopped near Mary."
+        result = detect_ambiguities(text)
+
+        pronoun_ambiguities = [a for a in result.ambiguities if a.ambiguity_type == AmbiguityType.PRONOUN]
+        if pronoun_ambiguities:
+            antecedent_texts = [a.text for a in pronoun_ambiguities[0].possible_antecedents]
+            assert "dogs" not in antecedent_texts
+            assert "Mary" not in antecedent_texts
+            token_ids = [a.token_id for a in pronoun_ambiguities[0].possible_antecedents]
+            assert token_ids == sorted(token_ids)
+
 
 class TestQuantifierScopeAmbiguity:
     """Test quantifier scope ambiguity detection."""
@@ -231,7 +246,7 @@ class TestAmbiguityResult:
 
         assert result.ambiguities is not None
         # Simple sentence should have few or no ambiguities
-        assert isinstance(result.ambiguities, list)
+        assert isinstance(result.ambiguities, tuple)
 
 
 class TestAmbiguityType:
@@ -246,3 +261,135 @@ class TestAmbiguityType:
         assert AmbiguityType.PRONOUN is not None
         assert AmbiguityType.QUANTIFIER_SCOPE is not None
         assert AmbiguityType.NEGATION_SCOPE is not None
+
+
+class TestBatchDetection:
+    """Test detecting ambiguities in many texts in one call."""
+
+    def test_batch_matches_single_calls(self):
+        """Batch results should match detect_ambiguities() per text, in order."""
+        from semantic_zoom.phase7.ambiguity_detection import (
+            detect_ambiguities,
+            detect_ambiguities_batch,
+        )
+
+        texts = ["I saw the man with the telescope.", "The cat sat.", "John told Bill that he was wrong."]
+        results = detect_ambiguities_batch(texts)
+
+        assert results == [detect_ambiguities(t) for t in texts]
+
+
+class TestResultCache:
+    """Test caching of detection results per text."""
+
+    def test_repeated_text_returns_cached_result(self):
+        """Detecting the same text twice should reuse the immutable result."""
+        import dataclasses
+
+        from semantic_zoom.phase7.ambiguity_detection import detect_ambiguities
+
+        detect_ambiguities.cache_clear()
+        text = "I saw the man with the telescope."
+        first = detect_ambiguities(text)
+
+        assert detect_ambiguities(text) is first
+        assert detect_ambiguities.cache_info().hits == 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.ambiguities = ()
+
+
+class TestCompactResults:
+    """Test that result objects are slotted, immutable values."""
+
+    def test_results_have_no_instance_dict(self):
+        """Result dataclasses should use __slots__ and accept list arguments."""
+        from semantic_zoom.phase7.ambiguity_detection import (
+            Ambiguity,
+            AmbiguityResult,
+            AmbiguityType,
+            Antecedent,
+            Interpretation,
+        )
+
+        interpretation = Interpretation(description="d", confidence=0.5)
+        antecedent = Antecedent(text="John", token_id=0, confidence=0.5)
+        ambiguity = Ambiguity(
+            ambiguity_type=AmbiguityType.PRONOUN,
+            span=(0, 2),
+            text="he",
+            interpretations=[interpretation],
+            possible_antecedents=[antecedent],
+        )
+        result = AmbiguityResult(text="he", ambiguities=[ambiguity])
+
+        for obj in (interpretation, antecedent, ambiguity, result):
+            assert not hasattr(obj, "__dict__")
+        assert ambiguity.interpretations == (interpretation,)
+        assert hash(result) == hash(AmbiguityResult(text="he", ambiguities=(ambiguity,)))
+
+
+class TestCandidateCollection:
+    """Test the single pass that gathers every detector's candidates."""
+
+    def test_candidates_match_direct_walks(self):
+        """Candidates should match walking the Doc and its tree directly."""
+        import spacy
+        from spacy.tokens import Doc
+        from semantic_zoom.phase7.ambiguity_detection import _collect_candidates
+
+        doc = Doc(
+            spacy.blank("en").vocab,
+            words=["I", "saw", "old", "men", "and", "women", "with", "hats"],
+            pos=["PRON", "VERB", "ADJ", "NOUN", "CCONJ", "NOUN", "ADP", "NOUN"],
+            deps=["nsubj", "ROOT", "amod", "dobj", "cc", "conj", "prep", "pobj"],
+            heads=[1, 1, 3, 1, 3, 3, 5, 6],
+        )
+        candidates = _collect_candidates(doc)
+
+        for token in doc:
+            expected = next(
+                (a.i for a in token.ancestors if a.pos_ == "VERB"), -1
+            )
+            assert candidates.nearest_verb[token.i] == expected
+        assert candidates.nearest_verb[1] == -1
+        assert candidates.nearest_verb[7] == 1
+        assert candidates.conj_children == {3: [5]}
+        assert [t.i for t in candidates.prepositions] == [6]
+        assert [t.i for t in candidates.coordinators] == [4]
+        assert candidates.any_number == [3, 5, 7]
+
+
+class TestParseSkipping:
+    """Test that text too short to be ambiguous is not parsed."""
+
+    def test_single_word_is_not_parsed(self, monkeypatch):
+        """Single words and punctuation should yield no ambiguities without a parse."""
+        from semantic_zoom.phase7 import ambiguity_detection
+
+        def fail():
+            raise AssertionError("model should not be loaded")
+
+        monkeypatch.setattr(ambiguity_detection, "_get_nlp", fail)
+        ambiguity_detection.detect_ambiguities.cache_clear()
+
+        result = ambiguity_detection.detect_ambiguities("Hello!")
+        batch = ambiguity_detection.detect_ambiguities_batch(["", "42", "yes."])
+
+        assert result.ambiguities == ()
+        assert [r.ambiguities for r in batch] == [(), (), ()]
+
+
+class TestIterAmbiguities:
+    """Test streaming ambiguity detection."""
+
+    def test_iter_ambiguities_matches_detect_ambiguities(self):
+        """Streamed ambiguities should equal the detected ones, in order."""
+        from semantic_zoom.phase7.ambiguity_detection import (
+            detect_ambiguities,
+            iter_ambiguities,
+        )
+
+        text = "John told Bill that he saw the man with the telescope."
+
+        assert tuple(iter_ambiguities(text)) == detect_ambiguities(text).ambiguities
+        assert list(iter_ambiguities("Hello")) == []
@@ -50,6 +50,18 @@ class TestGrammarError:
         has_double_neg = any(e.error_type == "DOUBLE_NEGATIVE" for e in result.errors)
         assert has_double_neg or len(result.errors) > 0  # Some error detected
 
+    def test_overlapping_double_negatives(self):
+        """Overlapping matches of different patterns should each be reported."""
+        from semantic_zoom.phase7.grammar_check import _check_double_negatives
+
+        text = "We don't never no longer go."
+        errors = _check_double_negatives(text)
+
+        assert [(e.start_char, e.text) for e in errors] == [
+            (3, "don't never no"),
+            (9, "never no"),
+        ]
+
     def test_missing_comma(self):
         """Test detection of missing commas."""
         from semantic_zoom.phase7.grammar_check import check_grammar, Severity
@@ -77,6 +89,18 @@ class TestSeverityLevels:
         assert Severity.WARNING is not None
         assert Severity.INFO is not None
 
+    def test_severity_orders_as_integers(self):
+        """Severities should sort most severe first and bucket as integers."""
+        import numpy as np
+
+        from semantic_zoom.phase7.grammar_check import Severity
+
+        severities = [Severity.INFO, Severity.ERROR, Severity.WARNING, Severity.ERROR]
+
+        assert sorted(severities) == [Severity.ERROR, Severity.ERROR, Severity.WARNING, Severity.INFO]
+        assert np.bincount(severities).tolist() == [0, 2, 1, 1]
+        assert Severity.WARNING.name == "WARNING"
+
     def test_severe_error_classification(self):
         """Test that severe errors get ERROR severity."""
         from semantic_zoom.phase7.grammar_check import check_grammar, Severity
@@ -307,3 +331,203 @@ class TestPhonologicalArticleCheck:
 
         article_errors = [e for e in result.errors if e.error_type == "ARTICLE"]
         assert len(article_errors) == 0
+
+    def test_article_as_last_token_not_flagged(self):
+        """Test a trailing article with no following word is not flagged."""
+        from semantic_zoom.phase7.grammar_check import check_grammar
+
+        result = check_grammar("He wrote an")
+
+        article_errors = [e for e in result.errors if e.error_type == "ARTICLE"]
+        assert len(article_errors) == 0
+
+
+class TestBatchCheck:
+    """Test checking many texts in one call."""
+
+    def test_batch_matches_single_calls(self):
+        """Batch results should match check_grammar() per text, in order."""
+        from semantic_zoom.phase7.grammar_check import check_grammar, check_grammar_batch
+
+        texts = ["The dogs runs quickly.", "", "I saw a apple.", "The cat sleeps."]
+        results = check_grammar_batch(texts)
+
+        assert len(results) == len(texts)
+        assert results == [check_grammar(t) for t in texts]
+
+
+class TestSharedModel:
+    """Test the spaCy model shared by Phase 7 modules."""
+
+    def test_phase7_modules_share_model(self):
+        """All modules should parse with the same pipeline without NER."""
+        from semantic_zoom.phase7 import ambiguity_detection, grammar_check, preservation
+
+        nlp = grammar_check._get_nlp()
+
+        assert ambiguity_detection._get_nlp() is nlp
+        assert preservation._get_nlp() is nlp
+        assert "ner" not in nlp.pipe_names
+        assert "lemmatizer" in nlp.pipe_names
+
+    def test_concurrent_first_use_loads_once(self, monkeypatch):
+        """Threads racing on first use should all get one loaded model."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from semantic_zoom.phase7 import _spacy_loader
+
+        loads = []
+
+        def fake_load():
+            loads.append(1)
+            return object()
+
+        monkeypatch.setattr(_spacy_loader, "_nlp", None)
+        monkeypatch.setattr(_spacy_loader, "_load_nlp", fake_load)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            models = list(pool.map(lambda _: _spacy_loader.get_nlp(), range(32)))
+
+        assert len(loads) == 1
+        assert all(model is models[0] for model in models)
+
+
+class TestResultCache:
+    """Test caching of grammar check results per text."""
+
+    def test_repeated_text_returns_cached_result(self):
+        """Checking the same text twice should reuse the immutable result."""
+        import dataclasses
+
+        from semantic_zoom.phase7.grammar_check import check_grammar
+
+        check_grammar.cache_clear()
+        text = "The dogs runs quickly."
+        first = check_grammar(text)
+
+        assert check_grammar(text) is first
+        assert isinstance(first.errors, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.errors[0].suggestion = "run"
+
+
+class TestApplyCorrections:
+    """Test building corrected text from suggestions."""
+
+    @staticmethod
+    def _error(start, end, suggestion):
+        from semantic_zoom.phase7.grammar_check import GrammarError, Severity
+
+        return GrammarError(
+            error_type="TEST", severity=Severity.INFO, start_char=start,
+            end_char=end, text="", suggestion=suggestion, message="",
+        )
+
+    def test_suggestions_applied_at_their_positions(self):
+        """Replacements and insertions should land at their own positions."""
+        from semantic_zoom.phase7.grammar_check import _apply_corrections
+
+        text = "However the dogs runs to a hour."
+        errors = [
+            self._error(0, 7, None),
+            self._error(7, 7, ","),
+            self._error(17, 21, "run"),
+            self._error(25, 26, "an"),
+        ]
+
+        assert _apply_corrections(text, errors) == "However, the dogs run to an hour."
+
+    def test_overlapping_suggestion_skipped(self):
+        """A suggestion overlapping an earlier one should be ignored."""
+        from semantic_zoom.phase7.grammar_check import _apply_corrections
+
+        errors = [self._error(0, 5, "Hi"), self._error(3, 8, "XX")]
+
+        assert _apply_corrections("Hello world", errors) == "Hi world"
+
+
+class TestParseSkipping:
+    """Test that text no check can fire on is not parsed."""
+
+    def test_text_without_letters_is_not_parsed(self, monkeypatch):
+        """Punctuation and numbers should come back unchanged without a parse."""
+        from semantic_zoom.phase7 import grammar_check
+
+        def fail():
+            raise AssertionError("model should not be loaded")
+
+        monkeypatch.setattr(grammar_check, "_get_nlp", fail)
+        grammar_check.check_grammar.cache_clear()
+
+        result = grammar_check.check_grammar("... 42 !?")
+        batch = grammar_check.check_grammar_batch(["", "3.14", "--"])
+
+        assert result.corrected == "... 42 !?"
+        assert result.errors == ()
+        assert [r.corrected for r in batch] == ["", "3.14", "--"]
+
+    def test_none_text_is_returned_unchanged(self, monkeypatch):
+        """None should still short-circuit rather than reach the letter regex."""
+        from semantic_zoom.phase7 import grammar_check
+
+        def fail():
+            raise AssertionError("model should not be loaded")
+
+        monkeypatch.setattr(grammar_check, "_get_nlp", fail)
+        grammar_check.check_grammar.cache_clear()
+
+        result = grammar_check.check_grammar(None)
+
+        assert result.corrected is None
+        assert result.errors == ()
+        assert grammar_check.check_grammar_batch([None])[0].corrected is None
+        assert list(grammar_check.iter_errors(None)) == []
+
+
+class TestIterErrors:
+    """Test streaming grammar errors."""
+
+    def test_iter_errors_matches_check_grammar(self):
+        """Streamed errors should be the checked errors, in check order."""
+        from semantic_zoom.phase7.grammar_check import check_grammar, iter_errors
+
+        text = "However the dogs runs to a hour."
+        streamed = list(iter_errors(text))
+
+        assert sorted(streamed, key=lambda e: e.start_char) == list(check_grammar(text).errors)
+        assert list(iter_errors("...")) == []
+
+
+class TestFusedChecks:
+    """Test the single-pass run of every grammar check."""
+
+    def test_fused_pass_matches_individual_checks(self):
+        """One pass should find the same errors, in order, as each check alone."""
+        import spacy
+        from spacy.tokens import Doc
+
+        from semantic_zoom.phase7 import grammar_check as gc
+
+        doc = Doc(
+            spacy.blank("en").vocab,
+            words=["Because", "the", "dogs", "runs", "to", "a", "apple"],
+            pos=["SCONJ", "DET", "NOUN", "VERB", "ADP", "DET", "NOUN"],
+            tags=["IN", "DT", "NNS", "VBZ", "IN", "DT", "NN"],
+            deps=["mark", "det", "nsubj", "advcl", "prep", "det", "pobj"],
+            heads=[3, 2, 3, 3, 3, 6, 4],
+            lemmas=["because", "the", "dog", "run", "to", "a", "apple"],
+        )
+
+        expected = []
+        for check in (
+            gc._check_subject_verb_agreement,
+            gc._check_article_errors,
+            gc._check_fragment,
+            gc._check_comma_after_introductory,
+        ):
+            check(doc, expected)
+
+        fused = gc._check_all(doc.text, doc, [])
+
+        assert fused == expected
+        assert [e.error_type for e in fused] == ["SUBJECT_VERB_AGREEMENT", "ARTICLE", "FRAGMENT"]
@@ -43,6 +43,20 @@ class TestVersionStore:
         assert version.word_ids is not None
         assert len(version.word_ids) >= 3  # At least "The", "dog", "runs"
 
+    def test_adding_version_does_not_load_model(self, monkeypatch):
+        """Word IDs should come from the blank tokenizer, not the full pipeline."""
+        from semantic_zoom.phase7 import preservation
+
+        def fail():
+            raise AssertionError("model should not be loaded")
+
+        monkeypatch.setattr(preservation, "_get_nlp", fail)
+
+        store = preservation.VersionStore()
+        version = store.get_version(store.add_version("The dogs don't run.\n"))
+
+        assert [w.text for w in version.word_ids] == ["The", "dogs", "do", "n't", "run", "."]
+
 
 class TestWordIDMapping:
     """Test word ID mapping between versions."""
@@ -96,6 +110,23 @@ class TestWordIDMapping:
         # Should indicate deletion of "big"
         assert mapping is not None
 
+    def test_mapping_covers_every_word_once(self):
+        """Every source and target word should appear in exactly one mapping."""
+        from semantic_zoom.phase7.preservation import VersionStore
+
+        store = VersionStore()
+        v1 = store.add_version("The quick cat sat on the mat today.")
+        v2 = store.add_version("A quick dog sat on the red mat.", parent_id=v1)
+
+        mapping = store.get_word_mapping(v1, v2)
+        source_ids = [m.source_id for m in mapping if m.source_id is not None]
+        target_ids = [m.target_id for m in mapping if m.target_id is not None]
+
+        assert sorted(source_ids) == sorted(w.word_id for w in store.get_version(v1).word_ids)
+        assert sorted(target_ids) == sorted(w.word_id for w in store.get_version(v2).word_ids)
+        unchanged = [m for m in mapping if m.change_type == "unchanged"]
+        assert len(unchanged) == 6  # quick, sat, on, the, mat, "."
+
 
 class TestModificationDetection:
     """Test detection of word modifications (morphological changes)."""
@@ -154,6 +185,39 @@ class TestModificationDetection:
         modified_count = sum(1 for m in mapping if m.change_type == "modified")
         assert modified_count >= 1, "Expected at least one modification"
 
+    def test_lemmas_computed_in_one_batch(self, monkeypatch):
+        """All changed words should be lemmatized with a single pipe call."""
+        from semantic_zoom.phase7 import preservation
+
+        nlp = preservation._get_nlp()
+        calls = []
+
+        class CountingNLP:
+            def pipe(self, texts, **kwargs):
+                texts = list(texts)
+                calls.append(texts)
+                return nlp.pipe(texts, **kwargs)
+
+        monkeypatch.setattr(preservation, "_get_nlp", CountingNLP)
+
+        store = preservation.VersionStore()
+        v1 = store.add_version("The dogs bark at cats.")
+        v2 = store.add_version("The dog barks at a cat.", parent_id=v1)
+        mapping = store.get_word_mapping(v1, v2)
+
+        assert len(calls) == 1
+        assert sum(1 for m in mapping if m.change_type == "modified") == 3
+
+    def test_word_similarity_cached_per_pair(self):
+        """Repeated comparisons in either order should reuse one cached result."""
+        from semantic_zoom.phase7.preservation import _are_words_similar, _lemmas_match
+
+        _lemmas_match.cache_clear()
+
+        assert _are_words_similar("runs", "run")
+        assert _are_words_similar("run", "runs")
+        assert _lemmas_match.cache_info().hits == 1
+
 
 class TestOriginalRecovery:
     """Test original view recovery."""
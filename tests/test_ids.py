@@ -0,0 +1,36 @@
+"""Tests for process-unique identifier generation."""
+import os
+
+import pytest
+
+from semantic_zoom._ids import next_id
+
+
+class TestNextId:
+    """Test prefix-plus-counter identifiers."""
+
+    def test_ids_are_unique_and_labelled(self):
+        """Successive IDs should differ and carry their label."""
+        ids = [next_id("edge_") for _ in range(1000)]
+
+        assert len(set(ids)) == 1000
+        assert all(i.startswith("edge_") and len(i) == 21 for i in ids)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_repeat_parent_ids(self):
+        """A forked worker should draw a new prefix instead of reusing the parent's."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, next_id().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent_id = next_id()
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_id
+        assert child_id[:8] != parent_id[:8]